@@ -134,6 +134,10 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# Maximum number of integration imports the preimport scheduler keeps
+# queued on the import executor at any one time
+PREIMPORT_MAX_PENDING = 2
+
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -954,6 +958,23 @@ async def _async_resolve_domains_to_setup(
         eager_start=True,
     )
 
+    # Import the integrations we are going to set up in dependency order
+    # so the import executor is kept busy while earlier stages are still
+    # being set up and most components are already loaded by the time
+    # their setup starts. We do not wait for this since its an
+    # optimization only.
+    hass.async_create_background_task(
+        _async_preimport_integrations(
+            {
+                domain: itg
+                for domain, itg in integration_cache.items()
+                if domain in domains_to_setup
+            }
+        ),
+        "preimport integrations",
+        eager_start=True,
+    )
+
     # Preload storage for all integrations we are going to set up
     # so we do not have to wait for it to be loaded when we need it
     # in the setup process.
@@ -968,6 +989,112 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_preimport_integrations(
+    integrations: dict[str, loader.Integration],
+) -> dict[str, tuple[float, float]]:
+    """Import integrations in the background in dependency order.
+
+    Integrations are imported leaf first so the dependencies of an
+    integration are already in sys.modules when it is imported. At most
+    PREIMPORT_MAX_PENDING imports are in flight at once so imports
+    requested by integrations being set up do not queue behind the
+    whole preimport.
+
+    Returns a dict of domain to (import time, critical path time) where
+    the critical path time is the longest chain of imports ending with
+    the integration.
+    """
+    deps_by_domain: dict[str, set[str]] = {}
+    waiting_on: dict[str, set[str]] = {}
+    dependants: defaultdict[str, set[str]] = defaultdict(set)
+    for domain, itg in integrations.items():
+        deps = {
+            dep
+            for dep in chain(itg.dependencies, itg.after_dependencies)
+            if dep in integrations and dep != domain
+        }
+        deps_by_domain[domain] = deps
+        waiting_on[domain] = set(deps)
+        for dep in deps:
+            dependants[dep].add(domain)
+
+    ready = [domain for domain, deps in waiting_on.items() if not deps]
+    timings: dict[str, tuple[float, float]] = {}
+    pending: dict[asyncio.Task[float], str] = {}
+
+    async def _async_import(integration: loader.Integration) -> float:
+        """Import an integration and return how long it took."""
+        if not integration.import_executor:
+            # Integrations that import in the event loop are left
+            # for setup so we do not block the loop at an arbitrary time
+            return 0
+        start = monotonic()
+        try:
+            await integration.async_get_component()
+        except Exception:  # noqa: BLE001
+            # Setup will raise and log the error when it imports it again
+            _LOGGER.debug("Failed to preimport %s", integration.domain, exc_info=True)
+        return monotonic() - start
+
+    while waiting_on or pending:
+        if not ready and not pending:
+            # after_dependencies may be circular, break the cycle by
+            # importing the integration with the fewest pending deps
+            ready.append(min(waiting_on, key=lambda domain: len(waiting_on[domain])))
+        while ready and len(pending) < PREIMPORT_MAX_PENDING:
+            domain = ready.pop()
+            del waiting_on[domain]
+            pending[
+                create_eager_task(
+                    _async_import(integrations[domain]),
+                    name=f"preimport {domain}",
+                    loop=asyncio.get_running_loop(),
+                )
+            ] = domain
+        if not pending:
+            continue
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            domain = pending.pop(task)
+            import_time = task.result()
+            timings[domain] = (
+                import_time,
+                import_time
+                + max(
+                    (
+                        timings[dep][1]
+                        for dep in deps_by_domain[domain]
+                        if dep in timings
+                    ),
+                    default=0,
+                ),
+            )
+            for dependant in dependants.pop(domain, ()):
+                if (deps := waiting_on.get(dependant)) is not None:
+                    deps.discard(domain)
+                    if not deps:
+                        ready.append(dependant)
+
+    if timings and _LOGGER.isEnabledFor(logging.DEBUG):
+        domain = max(timings, key=lambda domain: timings[domain][1])
+        critical_path = [domain]
+        while deps := [
+            dep
+            for dep in deps_by_domain[domain]
+            if dep in timings and dep not in critical_path
+        ]:
+            domain = max(deps, key=lambda dep: timings[dep][1])
+            critical_path.append(domain)
+        _LOGGER.debug(
+            "Integration import critical path (%.3f seconds): %s; import times: %s",
+            timings[critical_path[0]][1],
+            " -> ".join(reversed(critical_path)),
+            dict(sorted(timings.items(), key=itemgetter(1), reverse=True)),
+        )
+
+    return timings
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
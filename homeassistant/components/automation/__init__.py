@@ -14,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import CONF_STORED_TRACES
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -67,7 +68,10 @@ from homeassistant.helpers.script import (
     ScriptRunResult,
     script_stack_cv,
 )
-from homeassistant.helpers.script_variables import ScriptVariables
+from homeassistant.helpers.script_variables import (
+    ScriptVariables,
+    async_referenced_variables,
+)
 from homeassistant.helpers.service import (
     ReloadServiceHelper,
     async_register_admin_service,
@@ -76,6 +80,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_disabled,
     trace_get,
     trace_path,
 )
@@ -484,6 +489,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         raw_config: ConfigType | None,
         blueprint_inputs: ConfigType | None,
         trace_config: ConfigType,
+        referenced_variables: set[str] | None = None,
     ) -> None:
         """Initialize an automation entity."""
         self._attr_name = name
@@ -496,6 +502,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         self._is_enabled = False
         self._logger = LOGGER
         self._variables = variables
+        self._referenced_variables = referenced_variables
         self._trigger_variables = trigger_variables
         self.raw_config = raw_config
         self._blueprint_inputs = blueprint_inputs
@@ -609,6 +616,16 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         if enable_automation:
             await self._async_enable()
 
+    @callback
+    def _async_check_conditions(
+        self, cond_func: IfAction, variables: dict[str, Any]
+    ) -> bool:
+        """Check the conditions, without tracing them if traces are not stored."""
+        if self._trace_config[CONF_STORED_TRACES]:
+            return cond_func(variables)
+        with trace_disabled():
+            return cond_func(variables)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on and update the state."""
         await self._async_enable()
@@ -659,7 +676,9 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             variables: dict[str, Any] = {"this": this, **(run_variables or {})}
             if self._variables:
                 try:
-                    variables = self._variables.async_render(self.hass, variables)
+                    variables = self._variables.async_render(
+                        self.hass, variables, referenced=self._referenced_variables
+                    )
                 except TemplateError as err:
                     self._logger.error("Error rendering variables: %s", err)
                     automation_trace.set_error(err)
@@ -683,7 +702,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
             if (
                 not skip_condition
                 and self._cond_func is not None
-                and not self._cond_func(variables)
+                and not self._async_check_conditions(self._cond_func, variables)
             ):
                 self._logger.debug(
                     "Conditions not met, aborting automation. Condition summary: %s",
@@ -976,6 +995,13 @@ async def _create_automation_entities(
             automation_config.raw_config,
             automation_config.raw_blueprint_inputs,
             config_block[CONF_TRACE],
+            # Blueprint automations only render the variables their
+            # conditions and actions can read when they are triggered
+            None
+            if automation_config.raw_blueprint_inputs is None
+            else async_referenced_variables(
+                [config_block.get(CONF_CONDITIONS), config_block[CONF_ACTIONS]]
+            ),
         )
         entities.append(entity)
 
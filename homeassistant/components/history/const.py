@@ -5,3 +5,11 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Chunks of a chunked history response which may be queued to be sent
+# before the executor waits for the client to catch up
+MAX_CHUNKS_IN_FLIGHT = 4
+
+# Seconds between checks whether a chunked history response was cancelled
+# while the executor waits for the client to catch up
+CHUNK_WAIT_INTERVAL = 1
@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
@@ -38,7 +39,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    CHUNK_WAIT_INTERVAL,
+    EVENT_COALESCE_TIME,
+    MAX_CHUNKS_IN_FLIGHT,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,6 +80,21 @@ def _ws_get_significant_states(
     no_attributes: bool,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
+    if minimal_response:
+        # Minimal responses are fetched in columns and serialized
+        # directly to avoid creating a dict for every state
+        return messages.construct_result_message(
+            msg_id,
+            history.get_significant_states_columns(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            ).as_json(),
+        )
     return json_bytes(
         messages.result_message(
             msg_id,
@@ -93,6 +114,103 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    send_chunk: Callable[[bytes], bool],
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk holds the states of a single entity and is serialized as soon as
+    it is read from the database so memory use does not grow with the size of
+    the requested period. Chunks for the same entity are sent in order.
+    send_chunk blocks while too many chunks are waiting to be sent, and
+    returns False if the response was cancelled.
+    """
+    for entity_id, states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    ):
+        if not send_chunk(
+            json_bytes(messages.event_message(msg_id, {"states": {entity_id: states}}))
+        ):
+            return
+
+
+async def _async_send_chunked_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    *args: Any,
+) -> None:
+    """Send history significant_states in chunks as they are read.
+
+    At most MAX_CHUNKS_IN_FLIGHT chunks are queued at a time, the next ones
+    are only read once the client caught up. Reading stops as soon as the
+    chunks can no longer be sent, e.g. when the connection is closed.
+    """
+    loop = hass.loop
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+    in_flight = threading.Semaphore(MAX_CHUNKS_IN_FLIGHT)
+    cancelled = threading.Event()
+
+    def _send_chunk(chunk: bytes) -> bool:
+        """Queue a chunk from the executor."""
+        while not in_flight.acquire(timeout=CHUNK_WAIT_INTERVAL):
+            if cancelled.is_set():
+                return False
+        if cancelled.is_set():
+            return False
+        loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+        return True
+
+    @callback
+    def _async_cancel() -> None:
+        """Stop reading chunks which can no longer be sent."""
+        cancelled.set()
+        in_flight.release()
+
+    async def _async_send_chunks() -> None:
+        """Send the chunks once the previous ones have been sent."""
+        try:
+            while (chunk := await chunks.get()) is not None:
+                if cancelled.is_set():
+                    continue
+                connection.send_message(chunk)
+                await connection.async_drain()
+                in_flight.release()
+        finally:
+            _async_cancel()
+
+    sender = create_eager_task(_async_send_chunks())
+    connection.subscriptions[msg_id] = _async_cancel
+    try:
+        await get_instance(hass).async_add_executor_job(
+            _ws_stream_significant_states, hass, _send_chunk, msg_id, *args
+        )
+    except BaseException:
+        sender.cancel()
+        raise
+    finally:
+        connection.subscriptions.pop(msg_id, None)
+    chunks.put_nowait(None)
+    await sender
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +221,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -158,6 +277,24 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        # The chunks are sent as events followed by an empty
+        # result once all the states have been sent.
+        await _async_send_chunked_significant_states(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        connection.send_result(msg["id"], {})
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -10,11 +10,17 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device import (
     async_remove_stale_devices_links_keep_entity_device,
 )
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import Template
 
 from .const import CONF_DURATION, CONF_END, CONF_START, PLATFORMS
 from .coordinator import HistoryStatsUpdateCoordinator
-from .data import HistoryStats
+from .data import (
+    STORAGE_KEY_PREFIX,
+    STORAGE_VERSION,
+    HistoryStats,
+    async_schedule_store_cleanup,
+)
 
 type HistoryStatsConfigEntry = ConfigEntry[HistoryStatsUpdateCoordinator]
 
@@ -40,10 +46,12 @@ async def async_setup_entry(
         Template(start, hass) if start else None,
         Template(end, hass) if end else None,
         duration,
+        entry.entry_id,
     )
     coordinator = HistoryStatsUpdateCoordinator(hass, history_stats, entry, entry.title)
     await coordinator.async_config_entry_first_refresh()
     entry.runtime_data = coordinator
+    async_schedule_store_cleanup(hass)
 
     async_remove_stale_devices_links_keep_entity_device(
         hass,
@@ -64,6 +72,15 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: HistoryStatsConfigEntry
+) -> None:
+    """Remove the accumulated history of a History stats config entry."""
+    await Store(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}{entry.entry_id}"
+    ).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
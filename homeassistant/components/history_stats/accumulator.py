@@ -0,0 +1,254 @@
+"""Accumulate the time an entity matched in hourly buckets."""
+
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+from collections.abc import Sequence
+from dataclasses import dataclass
+import math
+from operator import itemgetter
+from typing import Any, Final
+
+BUCKET_SECONDS: Final = 3600
+
+# The timestamp of a state change and if the new state matches
+type ChangePoint = tuple[float, bool]
+
+_TIMESTAMP: Final = itemgetter(0)
+
+
+@dataclass(slots=True)
+class Bucket:
+    """The matched time of an hour.
+
+    Rises are changes from a non matching to a matching state after the
+    start of the hour, up to and including its end.
+    """
+
+    seconds_matched: float
+    rises: int
+    matched_at_start: bool
+
+
+def floor_bucket(timestamp: float) -> int:
+    """Return the start of the bucket a timestamp is in."""
+    return math.floor(timestamp / BUCKET_SECONDS) * BUCKET_SECONDS
+
+
+def ceil_bucket(timestamp: float) -> int:
+    """Return the first bucket boundary at or after a timestamp."""
+    return math.ceil(timestamp / BUCKET_SECONDS) * BUCKET_SECONDS
+
+
+def accumulate(
+    points: Sequence[ChangePoint], start: float, end: float, until: float
+) -> tuple[float, int, bool]:
+    """Return the matched seconds and rises between start and end.
+
+    The state at start is the one of the last change point at or before
+    start, or not matching if there is none. Change points before until
+    are taken into account, those after end as if they happened at end.
+    Also return if the state matched at start.
+    """
+    index = bisect_right(points, start, key=_TIMESTAMP)
+    matches = matched_at_start = index > 0 and points[index - 1][1]
+    seconds = 0.0
+    rises = 0
+    last = start
+    for timestamp, point_matches in points[index:]:
+        if timestamp >= until:
+            break
+        timestamp = min(timestamp, end)
+        if matches:
+            seconds += timestamp - last
+        elif point_matches:
+            rises += 1
+        matches = point_matches
+        last = timestamp
+    if matches:
+        seconds += end - last
+    return seconds, rises, matched_at_start
+
+
+def fold_buckets(
+    points: Sequence[ChangePoint], start: int, end: int
+) -> dict[int, Bucket]:
+    """Fold the change points between two bucket boundaries into buckets.
+
+    Hours which did not match at all get no bucket.
+    """
+    buckets: dict[int, Bucket] = {}
+    index = bisect_right(points, start, key=_TIMESTAMP)
+    matches = index > 0 and points[index - 1][1]
+    count = len(points)
+    bucket_start = start
+    while bucket_start < end:
+        if not matches:
+            # Skip to the hour of the next change
+            if index == count:
+                break
+            bucket_start = max(
+                bucket_start, ceil_bucket(points[index][0]) - BUCKET_SECONDS
+            )
+            if bucket_start >= end:
+                break
+        bucket_end = bucket_start + BUCKET_SECONDS
+        matched_at_start = matches
+        seconds = 0.0
+        rises = 0
+        last: float = bucket_start
+        while index < count and (timestamp := points[index][0]) <= bucket_end:
+            point_matches = points[index][1]
+            if matches:
+                seconds += timestamp - last
+            elif point_matches:
+                rises += 1
+            matches = point_matches
+            last = timestamp
+            index += 1
+        if matches:
+            seconds += bucket_end - last
+        buckets[bucket_start] = Bucket(seconds, rises, matched_at_start)
+        bucket_start = bucket_end
+    return buckets
+
+
+class HistoryStatsAccumulator:
+    """Accumulate the matched time of an entity in hourly buckets.
+
+    Complete hours from start to end are folded into buckets, the changes
+    since end are kept as change points. A window only needs to add and
+    drop buckets when it moves, the changes of the hours it only partially
+    covers have to be provided.
+    """
+
+    def __init__(self) -> None:
+        """Init the accumulator."""
+        self.start: int | None = None
+        self.end = 0
+        self.buckets: dict[int, Bucket] = {}
+        self.tail: list[ChangePoint] = []
+        self.covered_until = 0.0
+        self._window: tuple[int, int, float, int] | None = None
+
+    def reset(self, points: Sequence[ChangePoint], start: int, now: float) -> None:
+        """Replace the buckets with the changes from start until now."""
+        self.start = self.end = start
+        self.buckets = {}
+        self.tail = list(points)
+        self.covered_until = now
+        self._window = None
+        self.advance(now)
+
+    def prepend(self, points: Sequence[ChangePoint], start: int) -> None:
+        """Add the buckets for the changes from start to the current start."""
+        assert self.start is not None
+        self.buckets.update(fold_buckets(points, start, self.start))
+        self.start = start
+        self._window = None
+
+    def add_change(self, timestamp: float, matches: bool) -> None:
+        """Add a state change which happened after the buckets end."""
+        if timestamp < self.end:
+            return
+        tail = self.tail
+        if not tail or timestamp > tail[-1][0]:
+            # Changes between states which both match or both don't
+            # match make no difference
+            if not tail or tail[-1][1] != matches:
+                tail.append((timestamp, matches))
+        elif (timestamp, matches) not in tail:
+            insort(tail, (timestamp, matches))
+
+    def advance(self, now: float) -> bool:
+        """Fold the hours completed before now into buckets.
+
+        Return True if buckets were added.
+        """
+        self.covered_until = max(self.covered_until, now)
+        if (end := floor_bucket(now)) <= self.end:
+            return False
+        tail = self.tail
+        self.buckets.update(fold_buckets(tail, self.end, end))
+        # Keep the state at the new end
+        index = bisect_right(tail, end, key=_TIMESTAMP)
+        self.tail = tail[max(0, index - 1) :]
+        self.end = end
+        return True
+
+    def drop_before(self, start: int) -> None:
+        """Drop the buckets before start."""
+        if self.start is None or start <= self.start:
+            return
+        buckets = self.buckets
+        for bucket_start in [key for key in buckets if key < start]:
+            del buckets[bucket_start]
+        self.start = start
+
+    def matched_at(self, boundary: int) -> bool:
+        """Return if the state matched at a bucket boundary."""
+        if boundary >= self.end:
+            return accumulate(self.tail, boundary, boundary, boundary)[2]
+        bucket = self.buckets.get(boundary)
+        return bucket is not None and bucket.matched_at_start
+
+    def window_sum(self, start: int, end: int) -> tuple[float, int]:
+        """Return the matched seconds and rises of the buckets in a window.
+
+        The sums of the last window are adjusted by the buckets which were
+        added to or dropped from it.
+        """
+        buckets = self.buckets
+        if (window := self._window) is not None and (
+            window[0] <= start <= window[1] <= end
+        ):
+            last_start, last_end, seconds, rises = window
+            for bucket_start in range(last_start, start, BUCKET_SECONDS):
+                if (bucket := buckets.get(bucket_start)) is not None:
+                    seconds -= bucket.seconds_matched
+                    rises -= bucket.rises
+            for bucket_start in range(last_end, end, BUCKET_SECONDS):
+                if (bucket := buckets.get(bucket_start)) is not None:
+                    seconds += bucket.seconds_matched
+                    rises += bucket.rises
+        else:
+            seconds = 0.0
+            rises = 0
+            for bucket_start, bucket in buckets.items():
+                if start <= bucket_start < end:
+                    seconds += bucket.seconds_matched
+                    rises += bucket.rises
+        self._window = (start, end, seconds, rises)
+        return seconds, rises
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the accumulator as a dict."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "buckets": [
+                [
+                    bucket_start,
+                    bucket.seconds_matched,
+                    bucket.rises,
+                    bucket.matched_at_start,
+                ]
+                for bucket_start, bucket in sorted(self.buckets.items())
+            ],
+            "tail": [list(point) for point in self.tail],
+            "covered_until": self.covered_until,
+        }
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """Restore the accumulator from a dict."""
+        self.start = data["start"]
+        self.end = data["end"]
+        self.buckets = {
+            bucket_start: Bucket(seconds_matched, rises, matched_at_start)
+            for bucket_start, seconds_matched, rises, matched_at_start in data[
+                "buckets"
+            ]
+        }
+        self.tail = [(point[0], point[1]) for point in data["tail"]]
+        self.covered_until = data["covered_until"]
+        self._window = None
@@ -2,23 +2,101 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 import datetime
+import hashlib
 import logging
 import math
+import os
+from typing import Any, Final
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
+from .accumulator import (
+    BUCKET_SECONDS,
+    ChangePoint,
+    HistoryStatsAccumulator,
+    accumulate,
+    ceil_bucket,
+    floor_bucket,
+)
+from .const import DOMAIN
 from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10
+STORAGE_KEY_PREFIX: Final = f"{DOMAIN}."
+
+_STORE_CLEANUP: HassKey[bool] = HassKey(f"{DOMAIN}_store_cleanup")
+_STORAGE_KEYS: HassKey[set[str]] = HassKey(f"{DOMAIN}_storage_keys")
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def yaml_storage_key(unique_id: str) -> str:
+    """Return the storage key of a sensor set up from YAML.
+
+    The unique id is hashed since it may contain anything, and the key
+    ends up in a file name.
+    """
+    return f"yaml_{hashlib.sha256(unique_id.encode()).hexdigest()[:32]}"
+
+
+@callback
+def async_schedule_store_cleanup(hass: HomeAssistant) -> None:
+    """Remove the stores of removed sensors once Home Assistant has started."""
+    if _STORE_CLEANUP in hass.data:
+        return
+    hass.data[_STORE_CLEANUP] = True
+    async_at_started(hass, _async_cleanup_stores)
+
+
+async def _async_cleanup_stores(hass: HomeAssistant) -> None:
+    """Remove the stores not used by a config entry or a registered sensor."""
+    keys = {entry.entry_id for entry in hass.config_entries.async_entries(DOMAIN)}
+    keys.update(hass.data.get(_STORAGE_KEYS, ()))
+    keys.update(
+        yaml_storage_key(entry.unique_id)
+        for entry in er.async_get(hass).entities.values()
+        if entry.platform == DOMAIN and entry.config_entry_id is None
+    )
+    stored = await hass.async_add_executor_job(
+        _list_storage_keys, hass.config.path(STORAGE_DIR)
+    )
+    for key in stored - keys:
+        _LOGGER.debug("Removing the accumulated history of removed sensor %s", key)
+        await Store(hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}{key}").async_remove()
+
+
+def _list_storage_keys(path: str) -> set[str]:
+    """Return the keys of the history stats stores."""
+    try:
+        names = os.listdir(path)
+    except FileNotFoundError:
+        return set()
+    return {
+        name.removeprefix(STORAGE_KEY_PREFIX)
+        for name in names
+        if name.startswith(STORAGE_KEY_PREFIX)
+    }
+
+
 @dataclass
 class HistoryStatsState:
     """The current stats of the history stats."""
@@ -28,16 +106,14 @@ class HistoryStatsState:
     period: tuple[datetime.datetime, datetime.datetime]
 
 
-@dataclass
-class HistoryState:
-    """A minimal state to avoid holding on to State objects."""
-
-    state: str
-    last_changed: float
-
-
 class HistoryStats:
-    """Manage history stats."""
+    """Manage history stats.
+
+    The matched time of the entity is accumulated in hourly buckets, which
+    are persisted if a storage key is given. The database is only queried
+    for the hours the buckets don't cover yet and for the changes in the
+    hours at the edges of the period.
+    """
 
     def __init__(
         self,
@@ -47,25 +123,37 @@ class HistoryStats:
         start: Template | None,
         end: Template | None,
         duration: datetime.timedelta | None,
+        storage_key: str | None = None,
     ) -> None:
         """Init the history stats manager."""
         self.hass = hass
         self.entity_id = entity_id
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
-        self._history_current_period: list[HistoryState] = []
-        self._previous_run_before_start = False
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
         self._end = end
+        self._accumulator = HistoryStatsAccumulator()
+        # Changes in the hours before the end of the buckets which
+        # are partially covered by the period
+        self._hour_changes: dict[int, list[ChangePoint]] = {}
+        self._store: Store[dict[str, Any]] | None = None
+        self._loaded = storage_key is None
+        self._restored = False
+        if storage_key is not None:
+            hass.data.setdefault(_STORAGE_KEYS, set()).add(storage_key)
+            self._store = Store(
+                hass,
+                STORAGE_VERSION,
+                f"{STORAGE_KEY_PREFIX}{storage_key}",
+                private=True,
+            )
 
     async def async_update(
         self, event: Event[EventStateChangedData] | None
     ) -> HistoryStatsState:
         """Update the stats at a given time."""
-        # Get previous values of start and end
-        previous_period_start, previous_period_end = self._period
         # Parse templates
         self._period = async_calculate_period(self._duration, self._start, self._end)
         # Get the current period
@@ -74,97 +162,138 @@ class HistoryStats:
         # Convert times to UTC
         current_period_start = dt_util.as_utc(current_period_start)
         current_period_end = dt_util.as_utc(current_period_end)
-        previous_period_start = dt_util.as_utc(previous_period_start)
-        previous_period_end = dt_util.as_utc(previous_period_end)
 
         # Compute integer timestamps
         current_period_start_timestamp = floored_timestamp(current_period_start)
         current_period_end_timestamp = floored_timestamp(current_period_end)
-        previous_period_start_timestamp = floored_timestamp(previous_period_start)
-        previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
-            self._history_current_period = []
-            self._previous_run_before_start = True
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
-        #
-        # We avoid querying the database if the below did NOT happen:
-        #
-        # - The previous run happened before the start time
-        # - The start time changed
-        # - The period shrank in size
-        # - The previous period ended before now
-        #
-        if (
-            not self._previous_run_before_start
-            and current_period_start_timestamp == previous_period_start_timestamp
-            and (
-                current_period_end_timestamp == previous_period_end_timestamp
-                or (
-                    current_period_end_timestamp >= previous_period_end_timestamp
-                    and previous_period_end_timestamp <= now_timestamp
-                )
-            )
-        ):
-            new_data = False
-            if event and (new_state := event.data["new_state"]) is not None:
-                if (
-                    current_period_start_timestamp
-                    <= floored_timestamp(new_state.last_changed)
-                    <= current_period_end_timestamp
-                ):
-                    self._history_current_period.append(
-                        HistoryState(new_state.state, new_state.last_changed_timestamp)
-                    )
-                    new_data = True
-            if not new_data and current_period_end_timestamp < now_timestamp:
-                # If period has not changed and current time after the period end...
-                # Don't compute anything as the value cannot have changed
-                return self._state
-        else:
-            await self._async_history_from_db(
-                current_period_start_timestamp, current_period_end_timestamp
-            )
-            if event and (new_state := event.data["new_state"]) is not None:
-                if (
-                    current_period_start_timestamp
-                    <= floored_timestamp(new_state.last_changed)
-                    <= current_period_end_timestamp
-                ):
-                    self._history_current_period.append(
-                        HistoryState(new_state.state, new_state.last_changed_timestamp)
-                    )
 
-            self._previous_run_before_start = False
+        await self._async_update_buckets(current_period_start_timestamp, now_timestamp)
+        if event and (new_state := event.data["new_state"]) is not None:
+            self._accumulator.add_change(
+                new_state.last_changed_timestamp,
+                new_state.state in self._entity_states,
+            )
 
-        seconds_matched, match_count = self._async_compute_seconds_and_changes(
+        seconds_matched, match_count = await self._async_compute_seconds_and_changes(
             now_timestamp,
             current_period_start_timestamp,
             current_period_end_timestamp,
         )
+        self._accumulator.drop_before(floor_bucket(current_period_start_timestamp))
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
-    async def _async_history_from_db(
-        self,
-        current_period_start_timestamp: float,
-        current_period_end_timestamp: float,
+    async def _async_update_buckets(
+        self, start_timestamp: int, now_timestamp: int
     ) -> None:
-        """Update history data for the current period from the database."""
+        """Make the buckets cover the period start until now."""
+        accumulator = self._accumulator
+        if not self._loaded:
+            self._loaded = True
+            await self._async_load()
+        start = floor_bucket(start_timestamp)
+        changed = False
+        if accumulator.start is None or now_timestamp < accumulator.covered_until:
+            # Nothing is known yet, or time went backwards
+            points = await self._async_change_points(start, now_timestamp)
+            accumulator.reset(points, start, now_timestamp)
+            self._hour_changes.clear()
+            self._remember_hours(points, start, accumulator.end)
+            changed = True
+        else:
+            if self._restored:
+                # Changes since the buckets were saved were not tracked
+                self._restored = False
+                covered_until = accumulator.covered_until
+                for timestamp, matches in await self._async_change_points(
+                    covered_until, now_timestamp
+                ):
+                    accumulator.add_change(max(timestamp, covered_until), matches)
+            if start < accumulator.start:
+                points = await self._async_change_points(start, accumulator.start)
+                self._remember_hours(points, start, accumulator.start)
+                accumulator.prepend(points, start)
+                changed = True
+            tail, end = accumulator.tail, accumulator.end
+            if accumulator.advance(now_timestamp):
+                self._remember_hours(tail, end, accumulator.end)
+                changed = True
+        if changed and self._store is not None:
+            self._store.async_delay_save(self._async_data_to_save, STORAGE_SAVE_DELAY)
+
+    def _remember_hours(self, points: list[ChangePoint], start: int, end: int) -> None:
+        """Keep the change points of the hours folded into buckets.
+
+        The changes of the hours at the edges of the period are needed
+        again, those which are not are dropped on the next computation.
+        """
+        for hour in range(start, end, BUCKET_SECONDS):
+            self._hour_changes[hour] = points
+
+    async def _async_load(self) -> None:
+        """Restore the buckets of the tracked entity and states."""
+        assert self._store is not None
+        if (
+            (data := await self._store.async_load())
+            and data["entity_id"] == self.entity_id
+            and set(data["entity_states"]) == self._entity_states
+        ):
+            self._accumulator.load_dict(data["accumulator"])
+            self._restored = True
+
+    @callback
+    def _async_data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "entity_id": self.entity_id,
+            "entity_states": sorted(self._entity_states),
+            "accumulator": self._accumulator.as_dict(),
+        }
+
+    async def _async_change_points(
+        self, start_timestamp: float, end_timestamp: float
+    ) -> list[ChangePoint]:
+        """Return the state changes from start to end as change points.
+
+        The first change point is the state at start.
+        """
         instance = get_instance(self.hass)
         states = await instance.async_add_executor_job(
             self._state_changes_during_period,
-            current_period_start_timestamp,
-            current_period_end_timestamp,
+            start_timestamp,
+            end_timestamp,
         )
-        self._history_current_period = [
-            HistoryState(state.state, state.last_changed.timestamp())
-            for state in states
-        ]
+        entity_states = self._entity_states
+        points: list[ChangePoint] = []
+        for state in states:
+            timestamp = state.last_changed_timestamp
+            if timestamp > end_timestamp:
+                break
+            if timestamp <= start_timestamp:
+                # Only keep the state at start
+                points.clear()
+            points.append((timestamp, state.state in entity_states))
+        return points
+
+    async def _async_hour_change_points(
+        self, hour: int, now_timestamp: int
+    ) -> Sequence[ChangePoint]:
+        """Return the change points of an hour."""
+        accumulator = self._accumulator
+        if hour >= accumulator.end:
+            return accumulator.tail
+        if (points := self._hour_changes.get(hour)) is None:
+            points = self._hour_changes[hour] = await self._async_change_points(
+                hour, min(hour + BUCKET_SECONDS, now_timestamp)
+            )
+        return points
 
     def _state_changes_during_period(
         self, start_ts: float, end_ts: float
@@ -181,45 +310,69 @@ class HistoryStats:
             no_attributes=True,
         ).get(self.entity_id, [])
 
-    def _async_compute_seconds_and_changes(
+    async def _async_compute_seconds_and_changes(
         self, now_timestamp: float, start_timestamp: float, end_timestamp: float
     ) -> tuple[float, int]:
-        """Compute the seconds matched and changes from the history list and first state."""
-        # state_changes_during_period is called with include_start_time_state=True
-        # which is the default and always provides the state at the start
-        # of the period
-        previous_state_matches = False
-        last_state_change_timestamp = 0.0
-        elapsed = 0.0
-        match_count = 0
-
-        # Make calculations
-        for history_state in self._history_current_period:
-            current_state_matches = history_state.state in self._entity_states
-            state_change_timestamp = history_state.last_changed
-
-            if math.floor(state_change_timestamp) > now_timestamp:
-                # Shouldn't count states that are in the future
-                _LOGGER.debug(
-                    "Skipping future timestamp %s (now %s)",
-                    state_change_timestamp,
-                    now_timestamp,
-                )
-                continue
-
-            if previous_state_matches:
-                elapsed += state_change_timestamp - last_state_change_timestamp
-            elif current_state_matches:
-                match_count += 1
-
-            previous_state_matches = current_state_matches
-            last_state_change_timestamp = max(start_timestamp, state_change_timestamp)
-
-        # Count time elapsed between last history state and end of measure
-        if previous_state_matches:
-            measure_end = min(end_timestamp, now_timestamp)
-            elapsed += measure_end - last_state_change_timestamp
-
-        # Save value in seconds
-        seconds_matched = elapsed
-        return seconds_matched, match_count
+        """Compute the seconds matched and changes in the period.
+
+        The period is split into the complete hours, which are summed from
+        the buckets, and the partial hours at its start and end.
+        """
+        accumulator = self._accumulator
+        end_timestamp = min(end_timestamp, now_timestamp)
+        if end_timestamp < start_timestamp:
+            return 0.0, 0
+        # Changes are counted up to the second the period ends
+        until = end_timestamp + 1
+        first_boundary = ceil_bucket(start_timestamp)
+        last_boundary = floor_bucket(end_timestamp)
+        hour_changes = self._hour_changes
+        for hour in [
+            hour
+            for hour in hour_changes
+            if hour not in (floor_bucket(start_timestamp), last_boundary)
+        ]:
+            del hour_changes[hour]
+
+        if first_boundary > last_boundary:
+            # The period is within an hour
+            seconds_matched, match_count, matched_at_start = accumulate(
+                await self._async_hour_change_points(
+                    floor_bucket(start_timestamp), now_timestamp
+                ),
+                start_timestamp,
+                end_timestamp,
+                until,
+            )
+            return seconds_matched, match_count + matched_at_start
+
+        if start_timestamp < first_boundary:
+            seconds_matched, match_count, matched_at_start = accumulate(
+                await self._async_hour_change_points(
+                    floor_bucket(start_timestamp), now_timestamp
+                ),
+                start_timestamp,
+                first_boundary,
+                math.nextafter(first_boundary, math.inf),
+            )
+        else:
+            seconds_matched, match_count = 0.0, 0
+            matched_at_start = accumulator.matched_at(first_boundary)
+
+        window_seconds, window_rises = accumulator.window_sum(
+            first_boundary, last_boundary
+        )
+        seconds_matched += window_seconds
+        match_count += window_rises
+
+        if last_boundary < end_timestamp:
+            end_seconds, end_rises, _ = accumulate(
+                await self._async_hour_change_points(last_boundary, now_timestamp),
+                last_boundary,
+                end_timestamp,
+                until,
+            )
+            seconds_matched += end_seconds
+            match_count += end_rises
+
+        return seconds_matched, match_count + matched_at_start
@@ -48,7 +48,7 @@ from .const import (
     PLATFORMS,
 )
 from .coordinator import HistoryStatsUpdateCoordinator
-from .data import HistoryStats
+from .data import HistoryStats, async_schedule_store_cleanup, yaml_storage_key
 from .helpers import pretty_ratio
 
 UNITS: dict[str, str] = {
@@ -103,11 +103,20 @@ async def async_setup_platform(
     name: str = config[CONF_NAME]
     unique_id: str | None = config.get(CONF_UNIQUE_ID)
 
-    history_stats = HistoryStats(hass, entity_id, entity_states, start, end, duration)
+    history_stats = HistoryStats(
+        hass,
+        entity_id,
+        entity_states,
+        start,
+        end,
+        duration,
+        yaml_storage_key(unique_id) if unique_id is not None else None,
+    )
     coordinator = HistoryStatsUpdateCoordinator(hass, history_stats, None, name)
     await coordinator.async_refresh()
     if not coordinator.last_update_success:
         raise PlatformNotReady from coordinator.last_exception
+    async_schedule_store_cleanup(hass)
     async_add_entities(
         [HistoryStatsSensor(hass, coordinator, sensor_type, name, unique_id, entity_id)]
     )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
@@ -14,7 +15,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -47,13 +48,15 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
+from . import line_protocol
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
+    BATCH_TARGET_WRITE_TIME,
     BATCH_TIMEOUT,
-    CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
     CODE_INVALID_INPUTS,
@@ -81,27 +84,26 @@ from .const import (
     DEFAULT_SSL_V2,
     DOMAIN,
     EVENT_NEW_STATE,
-    INFLUX_CONF_FIELDS,
-    INFLUX_CONF_MEASUREMENT,
     INFLUX_CONF_ORG,
     INFLUX_CONF_STATE,
-    INFLUX_CONF_TAGS,
-    INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    MAX_BATCH_SIZE,
+    POINTS_RATE_WINDOW,
     QUERY_ERROR,
-    QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPILL_FILE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import PointSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -201,8 +203,8 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
-    """Build event to json converter and add to config."""
+def _generate_event_to_line(conf: dict) -> Callable[[Event], str | None]:
+    """Build event to line protocol converter and add to config."""
     entity_filter = convert_include_exclude_filter(conf)
     tags = conf.get(CONF_TAGS)
     tags_attributes: list[str] = conf[CONF_TAGS_ATTRIBUTES]
@@ -215,9 +217,10 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
         conf[CONF_COMPONENT_CONFIG_DOMAIN],
         conf[CONF_COMPONENT_CONFIG_GLOB],
     )
+    precision = conf.get(CONF_PRECISION)
 
-    def event_to_json(event: Event) -> dict[str, Any] | None:
-        """Convert event into json in format Influx expects."""
+    def event_to_line(event: Event) -> str | None:
+        """Convert event into a line in the protocol Influx expects."""
         state: State | None = event.data.get(EVENT_NEW_STATE)
         if (
             state is None
@@ -266,59 +269,58 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
                 else:
                     include_uom = measurement_attr != "unit_of_measurement"
 
-        json: dict[str, Any] = {
-            INFLUX_CONF_MEASUREMENT: measurement,
-            INFLUX_CONF_TAGS: {
-                CONF_DOMAIN: state.domain,
-                CONF_ENTITY_ID: state.object_id,
-            },
-            INFLUX_CONF_TIME: event.time_fired,
-            INFLUX_CONF_FIELDS: {},
+        point_tags: dict[str, Any] = {
+            CONF_DOMAIN: state.domain,
+            CONF_ENTITY_ID: state.object_id,
         }
+        fields: dict[str, Any] = {}
         if _include_state:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_STATE] = state.state
+            fields[INFLUX_CONF_STATE] = state.state
         if _include_value:
-            json[INFLUX_CONF_FIELDS][INFLUX_CONF_VALUE] = _state_as_value
+            fields[INFLUX_CONF_VALUE] = _state_as_value
 
         ignore_attributes = set(entity_config.get(CONF_IGNORE_ATTRIBUTES, []))
         ignore_attributes.update(global_ignore_attributes)
         for key, value in state.attributes.items():
             if key in tags_attributes:
-                json[INFLUX_CONF_TAGS][key] = value
+                point_tags[key] = value
             elif (
                 (key != CONF_UNIT_OF_MEASUREMENT or include_uom)
                 and (key != "device_class" or include_dc)
                 and key not in ignore_attributes
             ):
                 # If the key is already in fields
-                if key in json[INFLUX_CONF_FIELDS]:
+                if key in fields:
                     key = f"{key}_"
                 # Prevent column data errors in influxDB.
                 # For each value we try to cast it as float
                 # But if we cannot do it we store the value
                 # as string add "_str" postfix to the field key
                 try:
-                    json[INFLUX_CONF_FIELDS][key] = float(value)
+                    fields[key] = float(value)
                 except (ValueError, TypeError):
                     new_key = f"{key}_str"
                     new_value = str(value)
-                    json[INFLUX_CONF_FIELDS][new_key] = new_value
+                    fields[new_key] = new_value
 
                     if RE_DIGIT_TAIL.match(new_value):
-                        json[INFLUX_CONF_FIELDS][key] = float(
-                            RE_DECIMAL.sub("", new_value)
-                        )
+                        fields[key] = float(RE_DECIMAL.sub("", new_value))
 
                 # Infinity and NaN are not valid floats in InfluxDB
                 with suppress(KeyError, TypeError):
-                    if not math.isfinite(json[INFLUX_CONF_FIELDS][key]):
-                        del json[INFLUX_CONF_FIELDS][key]
+                    if not math.isfinite(fields[key]):
+                        del fields[key]
 
-        json[INFLUX_CONF_TAGS].update(tags)
+        point_tags.update(tags)
 
-        return json
+        return line_protocol.make_line(
+            measurement,
+            point_tags,
+            fields,
+            line_protocol.timestamp(event.time_fired, precision),
+        )
 
-    return event_to_json
+    return event_to_line
 
 
 @dataclass
@@ -326,7 +328,7 @@ class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[list[str]], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -351,12 +353,13 @@ def get_influx_connection(  # noqa: C901
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are made synchronously from the writer thread so points
+        # which could not be written are kept to be written again
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -367,7 +370,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -391,7 +394,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -431,10 +433,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +445,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -491,9 +493,12 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = PointSpool(hass.config.path(STORAGE_DIR, SPILL_FILE))
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_line, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -508,77 +513,117 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    Events are encoded to lines as soon as they are taken from the queue
+    and kept in a spool until they are written. The batch size adapts to
+    the time writes take while there is a backlog.
+    """
+
+    def __init__(self, hass, influx, event_to_line, max_tries, spool):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
-        self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
+        self.queue: queue.SimpleQueue[threading.Event | Event | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
+        self.spool: PointSpool = spool
+        self.batch_size = BATCH_BUFFER_SIZE
         self.write_errors = 0
+        self.points_written = 0
+        self._written_samples: deque[tuple[float, int]] = deque()
+        self._retry_at = 0.0
+        self._waiters: list[threading.Event] = []
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
     def _event_listener(self, event):
         """Listen for new messages on the bus and queue them for Influx."""
-        item = (time.monotonic(), event)
-        self.queue.put(item)
+        self.queue.put(event)
 
     @staticmethod
     def batch_timeout():
         """Return number of seconds to wait for more events."""
         return BATCH_TIMEOUT
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
-        queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of events and points waiting to be written."""
+        return self.queue.qsize() + len(self.spool)
+
+    @property
+    def points_per_second(self) -> float:
+        """Return the number of points written per second recently."""
+        since = time.monotonic() - POINTS_RATE_WINDOW
+        return (
+            sum(
+                points
+                for written, points in tuple(self._written_samples)
+                if written > since
+            )
+            / POINTS_RATE_WINDOW
+        )
 
-        count = 0
-        json = []
+    def _take(self, item: threading.Event | Event | None, lines: list[str]) -> None:
+        """Encode an event or keep a waiter from the queue.
 
-        dropped = 0
+        Waiters are released once the batch being written has been handled.
+        """
+        if item is None:
+            self.shutdown = True
+        elif isinstance(item, threading.Event):
+            self._waiters.append(item)
+        elif line := self.event_to_line(item):
+            lines.append(line)
+
+    def spool_events(self) -> None:
+        """Encode queued events into the spool until a batch is ready."""
+        if not self.spool:
+            # Wait for the first event
+            timeout: float | None = None
+        elif self.write_errors:
+            # Wait before writing again while the server is unavailable
+            timeout = max(0.0, self._retry_at - time.monotonic())
+        else:
+            # Catch up on the backlog
+            timeout = 0
 
+        lines: list[str] = []
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
-                item = self.queue.get(timeout=timeout)
-                count += 1
-
-                if item is None:
-                    self.shutdown = True
-                elif type(item) is tuple:
-                    timestamp, event = item
-                    age = time.monotonic() - timestamp
-
-                    if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
-                    else:
-                        dropped += 1
-                elif isinstance(item, threading.Event):
-                    item.set()
-
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+            self._take(self.queue.get(timeout=timeout), lines)
+            while len(self.spool) + len(lines) < self.batch_size and not self.shutdown:
+                self._take(self.queue.get(timeout=self.batch_timeout()), lines)
+        self.spool_queued(lines)
+
+    def spool_queued(self, lines: list[str] | None = None) -> None:
+        """Move whatever is queued to the spool so the queue stays short."""
+        if lines is None:
+            lines = []
+        with suppress(queue.Empty):
+            while not self.shutdown:
+                self._take(self.queue.get_nowait(), lines)
+                if len(lines) >= MAX_BATCH_SIZE:
+                    self.spool.append(lines)
+                    lines = []
+        self.spool.append(lines)
 
-        return count, json
+    def write_to_influxdb(self, lines):
+        """Write lines to influxdb, with retry.
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        Return False if the lines should be written again later.
+        """
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                self.influx.write(lines)
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -586,17 +631,63 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                    # Events keep coming in while the server is unavailable
+                    self.spool_queued()
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    self.write_errors = len(self.spool) + len(lines)
+                    return False
+        return True
+
+    def write_batch(self):
+        """Write a batch from the spool and adapt the batch size."""
+        lines = self.spool.pop_batch(self.batch_size)
+        start = time.monotonic()
+        if not self.write_to_influxdb(lines):
+            self.spool.requeue(lines)
+            self._retry_at = time.monotonic() + RETRY_DELAY
+            return
+        end = time.monotonic()
+        self.points_written += len(lines)
+        samples = self._written_samples
+        samples.append((end, len(lines)))
+        while samples[0][0] < end - POINTS_RATE_WINDOW:
+            samples.popleft()
+
+        write_time = end - start
+        if write_time > BATCH_TARGET_WRITE_TIME:
+            batch_size = max(BATCH_BUFFER_SIZE, self.batch_size // 2)
+        elif write_time < BATCH_TARGET_WRITE_TIME / 2 and len(self.spool) >= (
+            self.batch_size
+        ):
+            batch_size = min(MAX_BATCH_SIZE, self.batch_size * 2)
+        else:
+            return
+        if batch_size != self.batch_size:
+            _LOGGER.debug(
+                "Batch of %d events took %.3fs, writing %d events per batch",
+                len(lines),
+                write_time,
+                batch_size,
+            )
+            self.batch_size = batch_size
 
     def run(self):
         """Process incoming events."""
+        self.spool.load()
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            self.spool_events()
+            # While the server is unavailable, writes are only tried
+            # again once the retry delay has passed
+            if self.spool and (
+                not self.write_errors or time.monotonic() >= self._retry_at
+            ):
+                self.write_batch()
+            waiters, self._waiters = self._waiters, []
+            for waiter in waiters:
+                waiter.set()
+        self.spool.close()
 
     def block_till_done(self):
         """Block till all events processed.
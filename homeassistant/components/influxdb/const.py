@@ -74,10 +74,18 @@ DOMAIN = "influxdb"
 API_VERSION_2 = "2"
 TIMEOUT = 10  # seconds
 RETRY_DELAY = 20
-QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+# The batch size is doubled, up to MAX_BATCH_SIZE, while there is a backlog
+# and writes take less than half of BATCH_TARGET_WRITE_TIME, and halved,
+# down to BATCH_BUFFER_SIZE, when writes take longer than it
+MAX_BATCH_SIZE = 5000
+BATCH_TARGET_WRITE_TIME = 0.5  # seconds
+MAX_MEMORY_POINTS = 20000
+MAX_SPILL_BYTES = 100 * 1024 * 1024
+SPILL_FILE = "influxdb.spill"
+POINTS_RATE_WINDOW = 60  # seconds
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,8 +125,9 @@ QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
-CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
-RESUMED_MESSAGE = "Resumed, lost %d events."
+SPILL_FULL_MESSAGE = "InfluxDB spill file is full, dropped %d events."
+SPILL_ERROR = "Could not access InfluxDB spill file %s due to '%s'."
+RESUMED_MESSAGE = "Resumed, writing %d delayed events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
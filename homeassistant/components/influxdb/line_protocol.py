@@ -0,0 +1,83 @@
+"""Encode points in the InfluxDB line protocol."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Final
+
+_EPOCH: Final = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Divisors to convert nanoseconds to the precision of the written timestamps
+PRECISION_DIVISORS: Final = {None: 1, "ns": 1, "us": 10**3, "ms": 10**6, "s": 10**9}
+
+
+def _escape(text: str) -> str:
+    """Escape the characters which delimit keys and tag values."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+@lru_cache(maxsize=4096)
+def _escape_cached(text: str) -> str:
+    """Escape a string which repeats for every state of an entity."""
+    return _escape(text)
+
+
+def escape_key(key: Any) -> str:
+    """Escape a measurement, tag key or field key."""
+    return _escape_cached(key) if type(key) is str else _escape(str(key))
+
+
+def escape_tag_value(value: Any) -> str:
+    """Escape a tag value, tags without a value are left out."""
+    return "" if value is None else escape_key(value)
+
+
+def format_field_value(value: float | str) -> str:
+    """Format a float or string field value."""
+    if type(value) is str:
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'
+    return repr(value)
+
+
+def timestamp(time_fired: datetime, precision: str | None) -> int:
+    """Return the time as an integer timestamp in the given precision."""
+    delta = time_fired - _EPOCH
+    nanoseconds = (
+        delta.days * 86400 + delta.seconds
+    ) * 10**9 + delta.microseconds * 10**3
+    return nanoseconds // PRECISION_DIVISORS[precision]
+
+
+def make_line(
+    measurement: str,
+    tags: Mapping[str, Any],
+    fields: Mapping[str, float | str],
+    time: int,
+) -> str:
+    """Return the line of a point.
+
+    Tags and fields are sorted by key, as recommended for write performance,
+    and tags or fields which key or value is empty are left out.
+    """
+    tag_set = "".join(
+        f",{key}={value}"
+        for key, value in (
+            (escape_key(key), escape_tag_value(tags[key])) for key in sorted(tags)
+        )
+        if key and value
+    )
+    field_set = ",".join(
+        f"{escaped}={format_field_value(fields[key])}"
+        for key in sorted(fields)
+        if (escaped := escape_key(key))
+    )
+    return f"{escape_key(measurement)}{tag_set} {field_set} {time}"
@@ -0,0 +1,202 @@
+"""Buffer encoded points in memory and spill them to disk."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import logging
+import os
+from typing import BinaryIO
+
+from .const import MAX_MEMORY_POINTS, MAX_SPILL_BYTES, SPILL_ERROR, SPILL_FULL_MESSAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PointSpool:
+    """Hold the lines waiting to be written to InfluxDB.
+
+    Up to max_memory_points lines are kept in memory. When the server
+    can't keep up, or is down, the oldest lines are appended to a spill
+    file and read back, oldest first, once writes succeed again. Lines
+    still in memory when the spool is closed are spilled as well, so
+    they are written after a restart. The offset up to which the spill
+    file has been read is kept next to it when the spool is closed, so
+    lines which were written are not written again after a restart.
+
+    Every line carries its own timestamp, so lines which are requeued
+    after a failed write may be written out of order.
+
+    The spool is only used from the writer thread, apart from reading
+    the counters.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_memory_points: int = MAX_MEMORY_POINTS,
+        max_spill_bytes: int = MAX_SPILL_BYTES,
+    ) -> None:
+        """Initialize the spool."""
+        self._path = path
+        self._offset_path = f"{path}.offset"
+        self._max_memory_points = max_memory_points
+        self._max_spill_bytes = max_spill_bytes
+        self._memory: deque[str] = deque()
+        self._spill_writer: BinaryIO | None = None
+        self._spill_reader: BinaryIO | None = None
+        self._read_offset = 0
+        self.spilled = 0
+        self.spill_bytes = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Return the number of lines waiting to be written."""
+        return len(self._memory) + self.spilled
+
+    def load(self) -> None:
+        """Pick up the lines spilled before the last shutdown."""
+        try:
+            spill_bytes = os.path.getsize(self._path)
+        except FileNotFoundError:
+            # An offset left behind does not belong to the next spill file
+            self._remove_offset_file()
+            return
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR, self._path, err)
+            return
+        read_offset = self._load_offset(spill_bytes)
+        try:
+            with open(self._path, "rb") as spill_file:
+                spill_file.seek(read_offset)
+                spilled = sum(1 for _ in spill_file)
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR, self._path, err)
+            return
+        self._read_offset = read_offset
+        self.spilled = spilled
+        self.spill_bytes = spill_bytes
+        if not spilled:
+            self._remove_spill_file()
+
+    def _load_offset(self, spill_bytes: int) -> int:
+        """Return the offset up to which the spill file has been read."""
+        try:
+            with open(self._offset_path, encoding="ascii") as offset_file:
+                read_offset = int(offset_file.read())
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as err:
+            _LOGGER.error(SPILL_ERROR, self._offset_path, err)
+            return 0
+        if not 0 <= read_offset <= spill_bytes:
+            _LOGGER.error(SPILL_ERROR, self._offset_path, "offset past the end")
+            return 0
+        return read_offset
+
+    def append(self, lines: Iterable[str]) -> None:
+        """Queue new lines."""
+        self._memory.extend(lines)
+        self._spill_overflow()
+
+    def requeue(self, lines: list[str]) -> None:
+        """Queue lines again which failed to be written."""
+        self._memory.extendleft(reversed(lines))
+        self._spill_overflow()
+
+    def pop_batch(self, size: int) -> list[str]:
+        """Remove and return up to size lines, spilled lines first."""
+        batch = self._read_spilled(size) if self.spilled else []
+        memory = self._memory
+        if (count := min(size - len(batch), len(memory))) > 0:
+            batch.extend(memory.popleft() for _ in range(count))
+        return batch
+
+    def close(self) -> None:
+        """Spill the lines in memory and close the spill file."""
+        self._spill(len(self._memory))
+        if self._spill_reader is not None:
+            self._read_offset = self._spill_reader.tell()
+        self._close_spill_file()
+        if not self.spilled or not self._read_offset:
+            return
+        try:
+            with open(self._offset_path, "w", encoding="ascii") as offset_file:
+                offset_file.write(str(self._read_offset))
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR, self._offset_path, err)
+
+    def _close_spill_file(self) -> None:
+        """Close the spill file handles."""
+        for spill_file in (self._spill_writer, self._spill_reader):
+            if spill_file is not None:
+                spill_file.close()
+        self._spill_writer = self._spill_reader = None
+
+    def _spill_overflow(self) -> None:
+        """Spill the oldest lines when there are too many in memory."""
+        if (overflow := len(self._memory) - self._max_memory_points) > 0:
+            self._spill(overflow)
+
+    def _spill(self, count: int) -> None:
+        """Move the count oldest lines from memory to the spill file."""
+        if not count:
+            return
+        memory = self._memory
+        data = b"".join(f"{memory.popleft()}\n".encode() for _ in range(count))
+        if self.spill_bytes + len(data) > self._max_spill_bytes:
+            self.dropped += count
+            _LOGGER.warning(SPILL_FULL_MESSAGE, count)
+            return
+        try:
+            if self._spill_writer is None:
+                self._spill_writer = open(self._path, "ab")  # noqa: SIM115
+            self._spill_writer.write(data)
+            self._spill_writer.flush()
+        except OSError as err:
+            self.dropped += count
+            _LOGGER.error(SPILL_ERROR, self._path, err)
+            return
+        self.spilled += count
+        self.spill_bytes += len(data)
+
+    def _read_spilled(self, size: int) -> list[str]:
+        """Read up to size lines from the spill file."""
+        try:
+            if self._spill_reader is None:
+                self._spill_reader = open(self._path, "rb")  # noqa: SIM115
+                self._spill_reader.seek(self._read_offset)
+            reader = self._spill_reader
+            lines = []
+            while len(lines) < size and (line := reader.readline()):
+                lines.append(line.rstrip(b"\n").decode())
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR, self._path, err)
+            lines = []
+            self.dropped += self.spilled
+            self.spilled = 0
+        else:
+            self.spilled = 0 if len(lines) < size else self.spilled - len(lines)
+        if not self.spilled:
+            self._remove_spill_file()
+        return lines
+
+    def _remove_spill_file(self) -> None:
+        """Remove the spill file once all its lines have been read."""
+        self._close_spill_file()
+        self.spill_bytes = 0
+        self._read_offset = 0
+        try:
+            os.unlink(self._path)
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR, self._path, err)
+        self._remove_offset_file()
+
+    def _remove_offset_file(self) -> None:
+        """Remove the offset of a spill file which is gone."""
+        try:
+            os.unlink(self._offset_path)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error(SPILL_ERROR, self._offset_path, err)
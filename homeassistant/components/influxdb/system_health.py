@@ -0,0 +1,32 @@
+"""Provide info to system health."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    if (instance := hass.data.get(DOMAIN)) is None:
+        return {}
+    spool = instance.spool
+    return {
+        "queue_depth": instance.queue_depth,
+        "spilled_events": spool.spilled,
+        "dropped_events": spool.dropped,
+        "events_per_second": round(instance.points_per_second, 1),
+        "batch_size": instance.batch_size,
+    }
@@ -0,0 +1,217 @@
+"""In-memory index of the rows that started each context."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import timedelta
+import logging
+from typing import Final
+
+from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    session_scope,
+)
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED, MATCH_ALL
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.collection import chunked_or_all
+import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import bytes_to_ulid
+
+from .models import (
+    CONTEXT_ID_BIN_POS,
+    ENTITY_ID_POS,
+    EVENT_TYPE_POS,
+    TIME_FIRED_TS_POS,
+    EventAsRow,
+    async_event_to_row,
+)
+from .queries.contexts import context_rows_since_stmt, context_rows_stmt
+
+_LOGGER = logging.getLogger(__name__)
+
+# The index holds the origin row of this many contexts before
+# the oldest ones are evicted
+MAX_CONTEXT_INDEX_SIZE: Final = 65536
+
+# How far back the index is warmed from the database at startup
+CONTEXT_INDEX_WARM_WINDOW: Final = timedelta(hours=1)
+
+
+def _context_id_bin_timestamp(context_id_bin: bytes) -> float:
+    """Return the creation time encoded in the first 48 bits of a ulid."""
+    return int.from_bytes(context_id_bin[:6]) / 1000
+
+
+def _rows_are_same(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
+    """Check if two rows from different sources are the same event or state."""
+    return (
+        row[TIME_FIRED_TS_POS] == other_row[TIME_FIRED_TS_POS]
+        and row[EVENT_TYPE_POS] == other_row[EVENT_TYPE_POS]
+        and row[ENTITY_ID_POS] == other_row[ENTITY_ID_POS]
+    )
+
+
+class LogbookContextIndex:
+    """Map context ids to the first event or state recorded with them.
+
+    The index is fed from the event bus and warmed from the database
+    at startup so logbook requests for entities and devices can link
+    contexts without joining every context id back to the events and
+    states tables.
+
+    A context is only answered from the index if it was created after
+    the index started covering the bus, as older contexts may have
+    their origin outside of the index. When the index is full the
+    oldest contexts are evicted and the covered window shrinks.
+    """
+
+    def __init__(self, max_size: int = MAX_CONTEXT_INDEX_SIZE) -> None:
+        """Init the index."""
+        self._origins: dict[str, Row | EventAsRow] = {}
+        self._max_size = max_size
+        self._covered_after = 0.0
+        self.ready = False
+
+    def __len__(self) -> int:
+        """Return the number of indexed contexts."""
+        return len(self._origins)
+
+    @callback
+    def async_setup(self, hass: HomeAssistant) -> None:
+        """Listen for new contexts and warm the index from the database."""
+        instance = get_instance(hass)
+        entity_filter = instance.entity_filter
+        exclude_event_types = instance.exclude_event_types
+        origins = self._origins
+
+        @callback
+        def _async_event_listener(event: Event) -> None:
+            """Index the event if it is the first one recorded for its context."""
+            if (context_id := event.context.id) in origins:
+                return
+            if (event_type := event.event_type) in exclude_event_types:
+                return
+            if (
+                entity_filter is not None
+                and isinstance(entity_id := event.data.get(ATTR_ENTITY_ID), str)
+                and not entity_filter(entity_id)
+            ):
+                return
+            # The context is dropped so the index does not keep
+            # the origin event and everything it references alive
+            if event_type != EVENT_STATE_CHANGED:
+                row = async_event_to_row(event)._replace(context=None)
+            elif event.data["new_state"] is not None:
+                # Only the state is needed to describe a state change
+                row = async_event_to_row(event)._replace(data={}, context=None)
+            else:
+                return
+            self._async_add(context_id, row)
+
+        hass.bus.async_listen(MATCH_ALL, _async_event_listener)
+        hass.async_create_background_task(
+            self._async_warm(hass), "logbook context index warm up"
+        )
+
+    @callback
+    def _async_add(self, context_id: str, row: Row | EventAsRow) -> None:
+        """Add an origin row and evict the oldest one when full."""
+        origins = self._origins
+        origins[context_id] = row
+        if len(origins) > self._max_size:
+            evicted = origins.pop(next(iter(origins)))
+            self._covered_after = max(self._covered_after, evicted[TIME_FIRED_TS_POS])
+
+    async def _async_warm(self, hass: HomeAssistant) -> None:
+        """Load the contexts started in the warm window from the database."""
+        instance = get_instance(hass)
+        if not await instance.async_db_ready:
+            return
+        # Make sure everything fired before the listener was
+        # added is in the database before we look for it
+        await instance.async_block_till_done()
+        start_day = (dt_util.utcnow() - CONTEXT_INDEX_WARM_WINDOW).timestamp()
+        rows = await instance.async_add_executor_job(
+            _get_context_rows_since, hass, start_day
+        )
+        self.async_load(start_day, rows)
+        _LOGGER.debug("Warmed logbook context index with %s contexts", len(self))
+
+    @callback
+    def async_load(self, start_day: float, rows: Iterable[Row]) -> None:
+        """Load rows ordered by time and start covering contexts after start_day."""
+        origins = self._origins
+        for row in rows:
+            if (context_id_bin := row[CONTEXT_ID_BIN_POS]) is None:
+                continue
+            context_id = bytes_to_ulid(context_id_bin)
+            if (existing := origins.get(context_id)) is None or existing[
+                TIME_FIRED_TS_POS
+            ] > row[TIME_FIRED_TS_POS]:
+                # Events seen on the bus while the database was being
+                # read are replaced by older rows for the same context
+                self._async_add(context_id, row)
+        self._covered_after = max(self._covered_after, start_day)
+        self.ready = True
+
+    def get(self, context_id_bin: bytes) -> Row | EventAsRow | None:
+        """Return the origin row of a context if the index covers it."""
+        if (
+            not self.ready
+            or _context_id_bin_timestamp(context_id_bin) <= self._covered_after
+        ):
+            return None
+        return self._origins.get(bytes_to_ulid(context_id_bin))
+
+    def find_context_origins(
+        self,
+        session: Session,
+        rows: Sequence[Row],
+        context_lookup: dict[bytes | None, Row | EventAsRow | None],
+        max_bind_vars: int,
+    ) -> None:
+        """Add the origin rows for the contexts of rows to context_lookup.
+
+        The rows must be ordered by time. Contexts the index does not
+        cover are looked up in the database in batches. Nothing is added
+        when a row is the origin of its own context since it will be
+        memoized when the rows are processed.
+        """
+        first_rows: dict[bytes, Row] = {}
+        for row in rows:
+            if (context_id_bin := row[CONTEXT_ID_BIN_POS]) is not None:
+                first_rows.setdefault(context_id_bin, row)
+        missing: list[bytes] = []
+        for context_id_bin, row in first_rows.items():
+            if (origin := self.get(context_id_bin)) is None:
+                missing.append(context_id_bin)
+            elif not _rows_are_same(row, origin):
+                context_lookup[context_id_bin] = origin
+        if not missing:
+            return
+        origins: dict[bytes, Row] = {}
+        # Each context id is bound once for events and once for states
+        for missing_chunk in chunked_or_all(missing, max_bind_vars // 2):
+            for origin in execute_stmt_lambda_element(
+                session, context_rows_stmt(missing_chunk), orm_rows=False
+            ):
+                origins.setdefault(origin[CONTEXT_ID_BIN_POS], origin)
+        context_lookup.update(
+            (context_id_bin, origin)
+            for context_id_bin, origin in origins.items()
+            if not _rows_are_same(first_rows[context_id_bin], origin)
+        )
+
+
+def _get_context_rows_since(hass: HomeAssistant, start_day: float) -> list[Row]:
+    """Get the context linked rows since start_day."""
+    with session_scope(hass=hass, read_only=True) as session:
+        return list(
+            execute_stmt_lambda_element(
+                session, context_rows_since_stmt(start_day), orm_rows=False
+            )
+        )
@@ -126,6 +126,7 @@ class EventProcessor:
         self.context_id = context_id
         logbook_config: LogbookConfig = hass.data[DOMAIN]
         self.filters: Filters | None = logbook_config.sqlalchemy_filter
+        self.context_index = logbook_config.context_index
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
@@ -170,6 +171,14 @@ class EventProcessor:
                     instance.event_type_manager.get_many(self.event_types, session)
                 )
             )
+            # Entity and device requests find the rows that started their
+            # contexts in the context index instead of joining them in
+            context_index = self.context_index
+            use_context_index = bool(
+                (self.entity_ids or self.device_ids)
+                and context_index is not None
+                and context_index.ready
+            )
             stmt = statement_for_request(
                 start_day,
                 end_day,
@@ -179,10 +188,20 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                context_union=not use_context_index,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
-            )
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if use_context_index:
+                if TYPE_CHECKING:
+                    assert context_index is not None
+                    assert isinstance(rows, Sequence)
+                context_index.find_context_origins(
+                    session,
+                    rows,
+                    self.logbook_run.context_lookup,
+                    instance.max_bind_vars,
+                )
+            return self.humanify(rows)
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
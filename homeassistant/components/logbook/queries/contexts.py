@@ -0,0 +1,59 @@
+"""Context queries for logbook."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import lambda_stmt, union_all
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+
+def context_rows_stmt(context_id_bins: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a query to find the rows linked to multiple context ids."""
+    return lambda_stmt(
+        lambda: union_all(
+            apply_events_context_hints(
+                select_events_context_only()
+                .where(Events.context_id_bin.in_(context_id_bins))
+                .outerjoin(
+                    EventTypes, (Events.event_type_id == EventTypes.event_type_id)
+                )
+                .outerjoin(EventData, (Events.data_id == EventData.data_id))
+            ),
+            apply_states_context_hints(
+                select_states_context_only()
+                .where(States.context_id_bin.in_(context_id_bins))
+                .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+            ),
+        ).order_by(Events.time_fired_ts)
+    )
+
+
+def context_rows_since_stmt(start_day: float) -> StatementLambdaElement:
+    """Generate a query to find the context linked rows since a point in time."""
+    return lambda_stmt(
+        lambda: union_all(
+            select_events_context_only()
+            .where(Events.time_fired_ts > start_day)
+            .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+            .outerjoin(EventData, (Events.data_id == EventData.data_id)),
+            select_states_context_only()
+            .where(States.last_updated_ts > start_day)
+            .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id)),
+        ).order_by(Events.time_fired_ts)
+    )
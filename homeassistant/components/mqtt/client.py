@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import chain, count, groupby
 import logging
 from operator import attrgetter
 import socket
@@ -117,6 +117,10 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# The number of received topics for which the matching subscriptions are cached.
+# Topics are evicted least recently used first when the cache is full.
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -267,12 +271,118 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicTrieNode:
+    """A node in the wildcard subscription topic trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: dict[Subscription, None] = {}
+
+
+class WildcardSubscriptionIndex:
+    """Index wildcard subscriptions in a trie of topic levels.
+
+    Each topic filter level, including the `+` and `#` wildcards, is a node
+    in the trie. Matching a topic only visits the nodes that can match it,
+    instead of testing every wildcard subscription.
+
+    Iterating the index yields the subscriptions in the order they were added,
+    and matches are returned in that same order.
+    """
+
+    __slots__ = ("_order", "_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._root = _TopicTrieNode()
+        self._order: dict[Subscription, int] = {}
+        self._sequence = count()
+
+    def __contains__(self, subscription: object) -> bool:
+        """Return if the subscription is indexed."""
+        return subscription in self._order
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate the subscriptions in the order they were added."""
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        """Return the number of indexed subscriptions."""
+        return len(self._order)
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the index."""
+        if subscription in self._order:
+            return
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions[subscription] = None
+        self._order[subscription] = next(self._sequence)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the index.
+
+        Raises KeyError if the subscription is not indexed.
+        """
+        del self._order[subscription]
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.subscriptions[subscription]
+        # Prune the branches that no longer lead to a subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.subscriptions:
+                break
+            del parent.children[level]
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic."""
+        matches: list[Subscription] = []
+        levels = topic.split("/")
+        # Wildcards at the first level must not match topics starting
+        # with `$` [MQTT-4.7.2-1]
+        wildcard_root = not topic.startswith("$")
+        nodes = [self._root]
+        for index, level in enumerate(levels):
+            match_wildcards = wildcard_root or index > 0
+            next_nodes: list[_TopicTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if match_wildcards:
+                    if (multi_level := children.get("#")) is not None:
+                        matches.extend(multi_level.subscriptions)
+                    if (single_level := children.get("+")) is not None:
+                        next_nodes.append(single_level)
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+        else:
+            for node in nodes:
+                matches.extend(node.subscriptions)
+                # `a/#` also matches the parent level `a`
+                if (multi_level := node.children.get("#")) is not None:
+                    matches.extend(multi_level.subscriptions)
+        if len(matches) > 1:
+            matches.sort(key=self._order.__getitem__)
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,9 +486,8 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        # To ensure the wildcard subscriptions order is preserved, we use a dict
-        # with `None` values instead of a set.
-        self._wildcard_subscriptions: dict[Subscription, None] = {}
+        # The wildcard subscription index preserves the subscription order.
+        self._wildcard_subscriptions = WildcardSubscriptionIndex()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -759,7 +868,7 @@ class MQTT:
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
-            self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -777,7 +886,7 @@ class MQTT:
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
             else:
-                del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -848,9 +957,7 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
-
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1057,18 +1164,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.match(topic))
         return subscriptions
 
     @callback
@@ -1264,13 +1366,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -9,7 +9,7 @@ import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
@@ -74,6 +74,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import ExpositionCache, accepts_gzip
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -123,8 +125,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -145,6 +145,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         override_metric,
         default_metric,
     )
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
     hass.bus.listen(
@@ -207,7 +208,9 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
+        self._registry = prometheus_client.CollectorRegistry()
         self._metrics: dict[str, MetricWrapperBase] = {}
+        self._exposition = ExpositionCache()
         self._metrics_by_entity_id: dict[str, set[MetricNameWithLabelValues]] = (
             defaultdict(set)
         )
@@ -270,6 +273,18 @@ class PrometheusMetrics:
             if hasattr(self, handler) and state.state:
                 getattr(self, handler)(state)
 
+        self._exposition.mark_dirty(
+            entity_id,
+            (
+                metric.metric_name
+                for metric in self._metrics_by_entity_id.get(entity_id, ())
+            ),
+        )
+
+    def generate_latest(self, compress: bool = False) -> bytes:
+        """Return the exposition of the metrics, optionally gzip compressed."""
+        return self._exposition.generate_latest(dict(self._metrics), compress)
+
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
@@ -318,6 +333,9 @@ class PrometheusMetrics:
             )
             removed_metrics.add(metric)
             self._metrics[metric_name].remove(*label_values)
+        self._exposition.mark_dirty(
+            entity_id, (metric.metric_name for metric in removed_metrics)
+        )
         metric_set -= removed_metrics
         if not metric_set:
             del self._metrics_by_entity_id[entity_id]
@@ -353,7 +371,7 @@ class PrometheusMetrics:
                 full_metric_name,
                 documentation,
                 labels.keys(),
-                registry=prometheus_client.REGISTRY,
+                registry=self._registry,
             )
             metric = cast(_MetricBaseT, self._metrics[metric_name])
         self._metrics_by_entity_id[labels["entity"]].add(
@@ -857,19 +875,25 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
+        compress = accepts_gzip(request.headers.get(hdrs.ACCEPT_ENCODING, ""))
         body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
+            self._metrics.generate_latest, compress
         )
+        headers = {hdrs.VARY: hdrs.ACCEPT_ENCODING}
+        if compress:
+            headers[hdrs.CONTENT_ENCODING] = "gzip"
         return web.Response(
             body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
+            headers=headers,
         )
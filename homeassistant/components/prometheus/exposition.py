@@ -0,0 +1,229 @@
+"""Cache the text exposition of the Home Assistant metrics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import struct
+import threading
+from typing import Final
+import zlib
+
+import prometheus_client
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.metrics_core import Metric
+from prometheus_client.samples import Sample
+
+GZIP_COMPRESS_LEVEL: Final = 6
+
+# Magic, deflate, no flags, no modification time, no extra flags, unknown OS
+_GZIP_HEADER: Final = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def _deflate(data: bytes, finish: bool) -> bytes:
+    """Compress data to a raw deflate stream.
+
+    Unless finished, the stream ends with a full flush so the next
+    stream can be appended to it.
+    """
+    compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(
+        zlib.Z_FINISH if finish else zlib.Z_FULL_FLUSH
+    )
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return if an Accept-Encoding header value allows gzip.
+
+    A coding with a q-value of 0 is not acceptable. Without an entry for
+    gzip, the wildcard entry applies.
+    """
+    wildcard = False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name == "gzip":
+            return quality > 0
+        wildcard = quality > 0
+    return wildcard
+
+
+class _Family:
+    """Collect a single metric family with the given samples."""
+
+    def __init__(self, metric: Metric, samples: list[Sample]) -> None:
+        """Initialize the family."""
+        self._metric = Metric(
+            metric.name, metric.documentation, metric.type, metric.unit
+        )
+        self._metric.samples = samples
+
+    def collect(self) -> list[Metric]:
+        """Return the family."""
+        return [self._metric]
+
+
+def _render_samples(metric: Metric, samples: list[Sample]) -> dict[bytes, bytes]:
+    """Render samples of a metric family to its sections.
+
+    The text format puts the OpenMetrics specific samples, such as the
+    created time of counters, in sections of their own after the others.
+    The sections are returned keyed by their HELP and TYPE lines.
+    """
+    sections: dict[bytes, bytes] = {}
+    header = b""
+    lines: list[bytes] = []
+    for line in prometheus_client.generate_latest(
+        _Family(metric, samples)  # type: ignore[arg-type]
+    ).splitlines(keepends=True):
+        if line.startswith(b"# HELP "):
+            if header:
+                sections[header] = b"".join(lines)
+            header = line
+            lines = []
+        elif line.startswith(b"# TYPE "):
+            header += line
+        else:
+            lines.append(line)
+    sections[header] = b"".join(lines)
+    return sections
+
+
+class _FamilyExposition:
+    """The exposition of a metric family, kept per entity."""
+
+    __slots__ = ("header", "series")
+
+    def __init__(self, header: bytes) -> None:
+        """Initialize the exposition."""
+        self.header = header
+        self.series: dict[str, dict[bytes, bytes]] = {}
+
+    def render(self) -> bytes:
+        """Join the sections of all entities."""
+        series = self.series.values()
+        parts = [self.header]
+        parts.extend(sections.get(self.header, b"") for sections in series)
+        for header in sorted(
+            {header for sections in series for header in sections} - {self.header}
+        ):
+            parts.append(header)
+            parts.extend(sections.get(header, b"") for sections in series)
+        return b"".join(parts)
+
+
+class ExpositionCache:
+    """Cache the exposition of metric families until their series change.
+
+    The samples of each family are rendered per entity and kept until the
+    entity is marked dirty, so a state change only renders the series of
+    the entity which changed. The joined body of all families, and its
+    compressed copy, are kept until any entity is marked dirty, so scrapes
+    between state changes only render the collectors of the default registry.
+
+    Entities must be marked dirty after their series have been updated,
+    as a render running concurrently with the update may miss it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._generation = 0
+        self._dirty: dict[str, set[str]] = {}
+        self._families: dict[str, _FamilyExposition] = {}
+        self._fragments: dict[str, bytes] = {}
+        self._body_generation = -1
+        self._body = b""
+        self._deflated_body: bytes | None = None
+        self._body_crc = 0
+
+    def mark_dirty(self, entity_id: str, metric_names: Iterable[str]) -> None:
+        """Mark the series of an entity in metric families as changed."""
+        with self._lock:
+            for metric_name in metric_names:
+                self._dirty.setdefault(metric_name, set()).add(entity_id)
+            self._generation += 1
+
+    def _render_family(
+        self, metric_name: str, metric: MetricWrapperBase, entity_ids: set[str] | None
+    ) -> bytes:
+        """Render the series of the entities of a family which changed.
+
+        All series are rendered when entity_ids is None.
+        """
+        (family,) = metric.collect()
+        if entity_ids is None:
+            header = next(iter(_render_samples(family, [])))
+            exposition = self._families[metric_name] = _FamilyExposition(header)
+        else:
+            exposition = self._families[metric_name]
+        samples: dict[str, list[Sample]] = {}
+        for sample in family.samples:
+            entity_id = sample.labels.get("entity", "")
+            if entity_ids is None or entity_id in entity_ids:
+                samples.setdefault(entity_id, []).append(sample)
+        series = exposition.series
+        for entity_id in entity_ids or ():
+            if entity_id not in samples:
+                series.pop(entity_id, None)
+        for entity_id, entity_samples in samples.items():
+            series[entity_id] = _render_samples(family, entity_samples)
+        return exposition.render()
+
+    def _update_body(self, metrics: Mapping[str, MetricWrapperBase]) -> None:
+        """Render the series which changed since the last render."""
+        with self._lock:
+            generation = self._generation
+            dirty = self._dirty
+            self._dirty = {}
+        if generation == self._body_generation:
+            return
+        fragments = self._fragments
+        for metric_name, metric in metrics.items():
+            if metric_name not in fragments:
+                fragments[metric_name] = self._render_family(metric_name, metric, None)
+            elif (entity_ids := dirty.get(metric_name)) is not None:
+                fragments[metric_name] = self._render_family(
+                    metric_name, metric, entity_ids
+                )
+        self._body = b"".join(fragments[metric_name] for metric_name in metrics)
+        self._body_generation = generation
+        self._deflated_body = None
+
+    def generate_latest(
+        self, metrics: Mapping[str, MetricWrapperBase], compress: bool = False
+    ) -> bytes:
+        """Return the exposition of the metrics and the default registry.
+
+        If compress is set, the exposition is returned gzip compressed.
+        """
+        with self._render_lock:
+            self._update_body(metrics)
+            body = self._body
+            default_body = prometheus_client.generate_latest(prometheus_client.REGISTRY)
+            if not compress:
+                return body + default_body
+            if self._deflated_body is None:
+                self._deflated_body = _deflate(body, False)
+                self._body_crc = zlib.crc32(body)
+            deflated_body = self._deflated_body
+            crc = zlib.crc32(default_body, self._body_crc)
+        size = len(body) + len(default_body)
+        return b"".join(
+            (
+                _GZIP_HEADER,
+                deflated_body,
+                _deflate(default_body, True),
+                struct.pack("<II", crc, size & 0xFFFFFFFF),
+            )
+        )
@@ -172,6 +172,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         exclude_event_types=exclude_event_types,
     )
     get_instance.cache_clear()
+    await instance.purge_progress.async_load()
     instance.async_initialize()
     instance.async_register()
     instance.start()
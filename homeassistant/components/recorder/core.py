@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -80,6 +87,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge_progress import PurgeProgress
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -174,6 +182,7 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_progress = PurgeProgress(hass)
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -203,6 +212,12 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Events and States are buffered and written with multi-row inserts
+        # when the event session is committed instead of being flushed one
+        # by one by the ORM unit of work.
+        self._pending_events: list[Events] = []
+        self._pending_states: list[States] = []
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -653,6 +668,13 @@ class Recorder(threading.Thread):
             self.hass, self._async_five_minute_tasks, minute=range(0, 60, 5), second=10
         )
 
+        # Resume a purge that was interrupted by a restart
+        if (progress := self.purge_progress).in_progress:
+            assert progress.purge_before is not None
+            self.queue_task(
+                PurgeTask(progress.purge_before, progress.repack, progress.apply_filter)
+            )
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -690,6 +712,82 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_pending_event(self, dbevent: Events) -> None:
+        """Add an event to be inserted when the event session is committed."""
+        self._event_session_has_pending_writes = True
+        self._pending_events.append(dbevent)
+
+    def _add_pending_state(self, dbstate: States) -> None:
+        """Add a state to be inserted when the event session is committed."""
+        self._event_session_has_pending_writes = True
+        self._pending_states.append(dbstate)
+
+    def _insert_pending_events(self, session: Session) -> None:
+        """Insert the pending events with a single multi-row insert.
+
+        The session must be flushed first so the ids of new
+        EventData and EventTypes rows are known.
+        """
+        pending_events = self._pending_events
+        columns = [
+            column.key for column in Events.__table__.columns if not column.primary_key
+        ]
+        rows: list[dict[str, Any]] = []
+        for dbevent in pending_events:
+            row = {column: getattr(dbevent, column) for column in columns}
+            if (event_data := dbevent.event_data_rel) is not None:
+                row["data_id"] = event_data.data_id
+            if (event_type := dbevent.event_type_rel) is not None:
+                row["event_type_id"] = event_type.event_type_id
+            rows.append(row)
+        session.execute(insert(Events), rows)
+        self._pending_events = []
+
+    def _insert_pending_states(self, session: Session) -> None:
+        """Insert the pending states with multi-row inserts.
+
+        The session must be flushed first so the ids of new
+        StateAttributes and StatesMeta rows are known.
+
+        A state that links to an old state recorded in the same commit
+        interval is inserted in a later round, once the state_id of the
+        old state has been returned by the database. Every round is a
+        single multi-row insert.
+        """
+        columns = [
+            column.key for column in States.__table__.columns if not column.primary_key
+        ]
+        rounds: list[list[States]] = []
+        round_by_state: dict[int, int] = {}
+        for dbstate in self._pending_states:
+            round_ = 0
+            if (old_state := dbstate.old_state) is not None and (
+                old_round := round_by_state.get(id(old_state))
+            ) is not None:
+                round_ = old_round + 1
+            round_by_state[id(dbstate)] = round_
+            if round_ == len(rounds):
+                rounds.append([])
+            rounds[round_].append(dbstate)
+
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        for round_states in rounds:
+            rows: list[dict[str, Any]] = []
+            for dbstate in round_states:
+                row = {column: getattr(dbstate, column) for column in columns}
+                if (old_state := dbstate.old_state) is not None:
+                    row["old_state_id"] = old_state.state_id
+                if (state_attributes := dbstate.state_attributes) is not None:
+                    row["attributes_id"] = state_attributes.attributes_id
+                if (states_meta := dbstate.states_meta_rel) is not None:
+                    row["metadata_id"] = states_meta.metadata_id
+                rows.append(row)
+            for dbstate, state_id in zip(
+                round_states, session.execute(stmt, rows).scalars(), strict=True
+            ):
+                dbstate.state_id = state_id
+        self._pending_states = []
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -1056,7 +1154,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1081,7 +1179,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1163,7 +1261,10 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self._bulk_insert_states:
+            self._add_pending_state(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1226,6 +1327,12 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self._pending_events or self._pending_states:
+            session.flush()
+            if self._pending_events:
+                self._insert_pending_events(session)
+            if self._pending_states:
+                self._insert_pending_states(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1260,6 +1367,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_events = []
+        self._pending_states = []
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1378,6 +1487,12 @@ class Recorder(threading.Thread):
         ):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
+        # The state_id of new states must be known to link the old_state_id
+        # of the next state, which requires RETURNING in the same order
+        # as the parameters of a multi-row insert.
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._completed_first_database_setup = True
 
     def _setup_connection(self) -> None:
@@ -3,6 +3,9 @@
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+# Maximum number of states in each chunk yielded by stream_significant_states
+STREAM_CHUNK_SIZE = 2048
+
 SIGNIFICANT_DOMAINS = {
     "climate",
     "device_tracker",
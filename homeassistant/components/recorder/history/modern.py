@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import batched, groupby
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -36,6 +37,8 @@ from ..db_schema import (
 )
 from ..filters import Filters
 from ..models import (
+    CompressedStateColumns,
+    EntityStateColumns,
     LazyState,
     datetime_to_timestamp_or_none,
     extract_metadata_ids,
@@ -47,6 +50,7 @@ from .const import (
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
     STATE_KEY,
+    STREAM_CHUNK_SIZE,
 )
 
 _FIELD_MAP = {
@@ -204,34 +208,22 @@ def _significant_states_stmt(
     ).order_by(unioned_subquery.c.metadata_id, unioned_subquery.c.last_updated_ts)
 
 
-def get_significant_states_with_session(
+def _significant_states_query(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None = None,
-    entity_ids: list[str] | None = None,
-    filters: Filters | None = None,
-    include_start_time_state: bool = True,
-    significant_changes_only: bool = True,
-    minimal_response: bool = False,
-    no_attributes: bool = False,
-    compressed_state_format: bool = False,
-) -> dict[str, list[State | dict[str, Any]]]:
-    """Return states changes during UTC period start_time - end_time.
-
-    entity_ids is an optional iterable of entities to include in the results.
-
-    filters is an optional SQLAlchemy filter which will be applied to the database
-    queries unless entity_ids is given, in which case its ignored.
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, float | None, dict[str, int | None]] | None:
+    """Build the significant states statement for the given entities.
 
-    Significant states are all states where there is a state change,
-    as well as all states from certain domains (for instance
-    thermostat so that we get current temperature in our graphs).
+    Returns the statement, the start time timestamp to use for the start time
+    states, and the entity_id to metadata_id map, or None if none of the
+    entities have any states recorded.
     """
-    if filters is not None:
-        raise NotImplementedError("Filters are no longer supported")
-    if not entity_ids:
-        raise ValueError("entity_ids must be provided")
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -240,7 +232,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,9 +270,58 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
+    return (
+        stmt,
+        start_time_ts if include_start_time_state else None,
+        entity_id_to_metadata_id,
+    )
+
+
+def get_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    filters: Filters | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> dict[str, list[State | dict[str, Any]]]:
+    """Return states changes during UTC period start_time - end_time.
+
+    entity_ids is an optional iterable of entities to include in the results.
+
+    filters is an optional SQLAlchemy filter which will be applied to the database
+    queries unless entity_ids is given, in which case its ignored.
+
+    Significant states are all states where there is a state change,
+    as well as all states from certain domains (for instance
+    thermostat so that we get current temperature in our graphs).
+    """
+    if filters is not None:
+        raise NotImplementedError("Filters are no longer supported")
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, start_time_ts, entity_id_to_metadata_id = query
     return _sorted_states_to_dict(
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
+        start_time_ts,
         entity_ids,
         entity_id_to_metadata_id,
         minimal_response,
@@ -289,6 +330,98 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+) -> Generator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield states changes during UTC period start_time - end_time in chunks.
+
+    This is the streaming variant of get_significant_states. Instead of
+    building the whole result in memory, the rows are fetched in batches
+    and converted to (entity_id, states) chunks of at most STREAM_CHUNK_SIZE
+    states. Chunks for the same entity are yielded consecutively and in order, so
+    concatenating them gives the same result as get_significant_states.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, start_time_ts, entity_id_to_metadata_id = query
+        yield from _sorted_states_to_entity_chunks(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes,
+            STREAM_CHUNK_SIZE,
+        )
+
+
+def get_significant_states_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    no_attributes: bool = False,
+) -> CompressedStateColumns:
+    """Return minimal response states during UTC period start_time - end_time.
+
+    This is the columnar variant of get_significant_states with
+    minimal_response and compressed_state_format.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return CompressedStateColumns()
+        stmt, start_time_ts, entity_id_to_metadata_id = query
+        return _sorted_states_to_columns(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            no_attributes,
+        )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -690,6 +823,50 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, chunk in _sorted_states_to_entity_chunks(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+    ):
+        if ent_results := result[entity_id]:
+            ent_results.extend(chunk)
+        else:
+            result[entity_id] = chunk
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_entity_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool = False,
+    compressed_state_format: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int | None = None,
+) -> Generator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into (entity_id, list of states) chunks.
+
+    States must be sorted by entity_id and last_updated
+
+    If chunk_size is None, a single chunk is yielded for each entity,
+    otherwise each chunk is built from at most chunk_size rows. Entities
+    without any states are not yielded.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -704,10 +881,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -725,18 +898,20 @@ def _sorted_states_to_dict(
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
+    _utc_from_timestamp = dt_util.utc_from_timestamp
 
-    # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        batches: Iterable[Iterable[Row]] = (
+            batched(group, chunk_size) if chunk_size else (group,)
+        )
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                [
+            for batch in batches:
+                if ent_results := [
                     state_class(
                         db_state,
                         attr_cache,
@@ -746,71 +921,154 @@ def _sorted_states_to_dict(
                         db_state[last_updated_ts_idx],
                         False,
                     )
-                    for db_state in group
-                ]
-            )
+                    for db_state in batch
+                ]:
+                    yield entity_id, ent_results
             continue
 
         prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
+        first_batch = True
+        for batch in batches:
+            rows = iter(batch)
+            ent_results = []
+            # With minimal response we only provide a native
+            # State for the first and last response. All the states
+            # in-between only provide the "state" and the
+            # "last_changed".
+            if first_batch:
+                if (first_state := next(rows, None)) is None:
+                    continue
+                first_batch = False
+                prev_state = first_state[state_idx]
+                ent_results.append(
+                    state_class(
+                        first_state,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        prev_state,  # type: ignore[arg-type]
+                        first_state[last_updated_ts_idx],
+                        no_attributes,
+                    )
+                )
+
+            #
+            # minimal_response only makes sense with last_updated == last_updated
+            #
+            # We use last_updated for for last_changed since its the same
+            #
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            if compressed_state_format:
+                # Compressed state format uses the timestamp directly
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in rows
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
+            else:
+                # Non-compressed state format returns an ISO formatted string
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: _utc_from_timestamp(
+                                row[last_updated_ts_idx]
+                            ).isoformat(),
+                        }
+                        for row in rows
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
+            if ent_results:
+                yield entity_id, ent_results
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    no_attributes: bool = False,
+) -> CompressedStateColumns:
+    """Convert SQL results into a columnar minimal response.
+
+    States must be sorted by entity_id and last_updated
+    """
+    field_map = _FIELD_MAP
+    result = CompressedStateColumns()
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    if len(entity_ids) == 1:
+        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
+        assert metadata_id is not None  # should not be possible if we got here
+        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
+            (metadata_id, iter(states)),
+        )
+    else:
+        key_func = itemgetter(field_map["metadata_id"])
+        states_iter = groupby(states, key_func)
+
+    state_idx = field_map["state"]
+    last_updated_ts_idx = field_map["last_updated_ts"]
+    state_index = result.state_index
+
+    for metadata_id, group in states_iter:
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        attr_cache: dict[str, dict[str, Any]] = {}
+        if split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+            if ent_results := [
+                row_to_compressed_state(
+                    db_state,
                     attr_cache,
                     start_time_ts,
                     entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
                 )
-            )
-
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                [
-                    {
-                        attr_state: (prev_state := state),
-                        attr_time: row[last_updated_ts_idx],
-                    }
-                    for row in group
-                    if (state := row[state_idx]) != prev_state
-                ]
-            )
+                for db_state in group
+            ]:
+                result.entities[entity_id] = ent_results
             continue
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            ]
+        if (first_state := next(group, None)) is None:
+            continue
+        prev_state: str = first_state[state_idx]
+        columns = EntityStateColumns(
+            row_to_compressed_state(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,
+                first_state[last_updated_ts_idx],
+                no_attributes,
+            )
         )
+        result.entities[entity_id] = columns
+        # Only the state changes are kept, the same as with the
+        # minimal response in _sorted_states_to_entity_chunks
+        last_updated_ts_append = columns.last_updated_ts.append
+        state_idx_append = columns.state_idx.append
+        for row in group:
+            if (state := row[state_idx]) != prev_state:
+                prev_state = state
+                state_idx_append(state_index(state))
+                last_updated_ts_append(row[last_updated_ts_idx])
 
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+    # The rows are grouped by metadata_id, return the entities in the
+    # requested order the same as _sorted_states_to_dict
+    entities = result.entities
+    result.entities = {
+        entity_id: entities[entity_id]
+        for entity_id in entity_ids
+        if entity_id in entities
+    }
+    return result
@@ -10,7 +10,13 @@ from .context import (
 )
 from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
 from .event import extract_event_type_ids
-from .state import LazyState, extract_metadata_ids, row_to_compressed_state
+from .state import (
+    CompressedStateColumns,
+    EntityStateColumns,
+    LazyState,
+    extract_metadata_ids,
+    row_to_compressed_state,
+)
 from .statistics import (
     CalendarStatisticPeriod,
     FixedStatisticPeriod,
@@ -30,8 +36,10 @@ from .time import (
 
 __all__ = [
     "CalendarStatisticPeriod",
+    "CompressedStateColumns",
     "DatabaseEngine",
     "DatabaseOptimizer",
+    "EntityStateColumns",
     "FixedStatisticPeriod",
     "LazyState",
     "RollingWindowStatisticPeriod",
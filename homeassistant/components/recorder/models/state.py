@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from array import array
 from datetime import datetime
 import logging
 from typing import TYPE_CHECKING, Any
@@ -16,6 +17,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_STATE,
 )
 from homeassistant.core import Context, State
+from homeassistant.helpers.json import json_bytes
 import homeassistant.util.dt as dt_util
 
 from .state_attributes import decode_attributes_from_source
@@ -164,3 +166,119 @@ def row_to_compressed_state(
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
     return comp_state
+
+
+class EntityStateColumns:
+    """Minimal response states of a single entity stored in arrays.
+
+    The first state is kept as a compressed state dict. All the states
+    after it are stored as a last updated timestamp and an index into the
+    interned state strings of the CompressedStateColumns they belong to.
+    """
+
+    __slots__ = ("first_state", "last_updated_ts", "state_idx")
+
+    def __init__(self, first_state: dict[str, Any]) -> None:
+        """Init the columns."""
+        self.first_state = first_state
+        self.last_updated_ts = array("d")
+        self.state_idx = array("I")
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return 1 + len(self.last_updated_ts)
+
+
+class CompressedStateColumns:
+    """A compressed states history result stored in columns.
+
+    This is an alternative to a dict of lists of compressed state dicts
+    for minimal responses that does not need a dict, a float and a string
+    for every state. Entities that need the attributes of every state
+    keep a list of compressed state dicts.
+    """
+
+    __slots__ = ("_state_to_idx", "entities", "states")
+
+    def __init__(self) -> None:
+        """Init the result."""
+        self._state_to_idx: dict[str, int] = {}
+        self.states: list[str] = []
+        self.entities: dict[str, EntityStateColumns | list[dict[str, Any]]] = {}
+
+    @classmethod
+    def from_compressed_states(
+        cls, compressed_states: dict[str, list[dict[str, Any]]]
+    ) -> CompressedStateColumns:
+        """Create a result from a dict of lists of compressed state dicts."""
+        columns = cls()
+        columns.entities.update(compressed_states)
+        return columns
+
+    def state_index(self, state: str) -> int:
+        """Return the index of an interned state string."""
+        if (idx := self._state_to_idx.get(state)) is None:
+            idx = self._state_to_idx[state] = len(self.states)
+            self.states.append(state)
+        return idx
+
+    def as_compressed_states(self) -> dict[str, list[dict[str, Any]]]:
+        """Return the result as a dict of lists of compressed state dicts."""
+        states = self.states
+        result: dict[str, list[dict[str, Any]]] = {}
+        for entity_id, entity_states in self.entities.items():
+            if type(entity_states) is not EntityStateColumns:
+                result[entity_id] = entity_states
+                continue
+            result[entity_id] = [
+                entity_states.first_state,
+                *(
+                    {
+                        COMPRESSED_STATE_STATE: states[idx],
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                    for idx, last_updated_ts in zip(
+                        entity_states.state_idx,
+                        entity_states.last_updated_ts,
+                        strict=True,
+                    )
+                ),
+            ]
+        return result
+
+    def as_json(self) -> bytes:
+        """Serialize the result to JSON without creating a dict per state."""
+        # Each state is serialized as a pre-serialized prefix
+        # for its state string followed by its timestamp
+        prefixes = [
+            b"".join(
+                (
+                    b',{"' + COMPRESSED_STATE_STATE.encode() + b'":',
+                    json_bytes(state),
+                    b',"' + COMPRESSED_STATE_LAST_UPDATED.encode() + b'":',
+                )
+            )
+            for state in self.states
+        ]
+        parts: list[bytes] = []
+        for entity_id, entity_states in self.entities.items():
+            key = json_bytes(entity_id)
+            if type(entity_states) is not EntityStateColumns:
+                parts.append(b"".join((key, b":", json_bytes(entity_states))))
+                continue
+            first_state = json_bytes(entity_states.first_state)
+            if not entity_states.last_updated_ts:
+                parts.append(b"".join((key, b":[", first_state, b"]")))
+                continue
+            # Serialize all the timestamps at once, close each state
+            # after its timestamp and interleave them with the prefixes
+            timestamps = (
+                json_bytes(entity_states.last_updated_ts.tolist())[1:-1]
+                .replace(b",", b"},")
+                .split(b",")
+            )
+            rows: list[bytes] = [b""] * (len(timestamps) * 2)
+            rows[0::2] = map(prefixes.__getitem__, entity_states.state_idx)
+            rows[1::2] = timestamps
+            parts.append(b"".join((key, b":[", first_state, *rows, b"}]")))
+        return b"{" + b",".join(parts) + b"}"
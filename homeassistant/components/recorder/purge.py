@@ -52,6 +52,10 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Seconds a purge task may spend starting new batches before it
+# yields to the recorder queue and reschedules itself
+PURGE_TIME_BUDGET = 1.0
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -61,15 +65,21 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    time_budget: float | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If a time_budget is given, no new batches of states or events are
+    started once it has been spent so the recorder can process its queue
+    before the purge continues.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    deadline = None if time_budget is None else time.monotonic() + time_budget
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -86,10 +96,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -146,10 +156,15 @@ def _purge_legacy_format(
     ) = _select_legacy_event_state_and_attributes_and_data_ids_to_purge(
         session, purge_before, instance.max_bind_vars
     )
+    progress = instance.purge_progress
     _purge_state_ids(instance, session, state_ids)
-    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    progress.states += len(state_ids)
+    progress.state_attributes += _purge_unused_attributes_ids(
+        instance, session, attributes_ids
+    )
     _purge_event_ids(session, event_ids)
-    _purge_unused_data_ids(instance, session, data_ids)
+    progress.events += len(event_ids)
+    progress.event_data += _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -163,7 +178,10 @@ def _purge_legacy_format(
         session, purge_before, instance.max_bind_vars
     )
     _purge_state_ids(instance, session, detached_state_ids)
-    _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    progress.states += len(detached_state_ids)
+    progress.state_attributes += _purge_unused_attributes_ids(
+        instance, session, detached_attributes_ids
+    )
     return bool(
         event_ids
         or state_ids
@@ -179,6 +197,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -193,17 +212,27 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    progress = instance.purge_progress
     for _ in range(states_batch_size):
+        batch_size = progress.next_batch_size(max_bind_vars)
+        start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, batch_size
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.states += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        now = time.monotonic()
+        progress.adjust_batch_size(batch_size, now - start, max_bind_vars)
+        if deadline is not None and now > deadline:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.state_attributes += _purge_unused_attributes_ids(
+        instance, session, attributes_ids_batch
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -216,6 +245,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -228,17 +258,25 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
+    progress = instance.purge_progress
     for _ in range(events_batch_size):
+        batch_size = progress.next_batch_size(max_bind_vars)
+        start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, batch_size
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.events += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        now = time.monotonic()
+        progress.adjust_batch_size(batch_size, now - start, max_bind_vars)
+        if deadline is not None and now > deadline:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.event_data += _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -320,14 +358,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -358,13 +397,15 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
@@ -0,0 +1,156 @@
+"""Track the progress of purging old data."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY: Final = "recorder.purge"
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10
+
+# The number of rows purged per batch is halved when selecting and deleting
+# a batch takes longer than this and doubled, up to max_bind_vars, when it
+# takes less than half of it
+PURGE_TARGET_BATCH_TIME: Final = 0.5
+MIN_PURGE_BATCH_SIZE: Final = 32
+
+
+class PurgeProgress:
+    """Progress of the current or last purge of old data.
+
+    The counters are updated from the recorder thread and read from the
+    event loop. The purge parameters are persisted so an unfinished purge
+    is resumed when Home Assistant is restarted.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the purge progress."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+        self.purge_before: datetime | None = None
+        self.repack = False
+        self.apply_filter = False
+        self.started: datetime | None = None
+        self.finished: datetime | None = None
+        self.runs = 0
+        self.elapsed = 0.0
+        self.states = 0
+        self.events = 0
+        self.state_attributes = 0
+        self.event_data = 0
+        self.batch_size: int | None = None
+
+    @property
+    def in_progress(self) -> bool:
+        """Return if a purge has not finished yet."""
+        return self.purge_before is not None and self.finished is None
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of rows purged per second spent purging."""
+        if not self.elapsed:
+            return None
+        rows = self.states + self.events + self.state_attributes + self.event_data
+        return rows / self.elapsed
+
+    def start(self, purge_before: datetime, repack: bool, apply_filter: bool) -> None:
+        """Start tracking a purge unless it is the one already tracked."""
+        if self.in_progress and (
+            self.purge_before == purge_before
+            and self.repack == repack
+            and self.apply_filter == apply_filter
+        ):
+            return
+        self.purge_before = purge_before
+        self.repack = repack
+        self.apply_filter = apply_filter
+        self.started = dt_util.utcnow()
+        self.finished = None
+        self.runs = 0
+        self.elapsed = 0.0
+        self.states = self.events = self.state_attributes = self.event_data = 0
+
+    def next_batch_size(self, max_bind_vars: int) -> int:
+        """Return the number of rows to select in the next purge statement."""
+        if self.batch_size is None:
+            return max_bind_vars
+        return min(self.batch_size, max_bind_vars)
+
+    def adjust_batch_size(
+        self, batch_size: int, batch_time: float, max_bind_vars: int
+    ) -> None:
+        """Adapt the batch size to the time it took to purge the last batch."""
+        if batch_time > PURGE_TARGET_BATCH_TIME:
+            batch_size = max(MIN_PURGE_BATCH_SIZE, batch_size // 2)
+        elif batch_time < PURGE_TARGET_BATCH_TIME / 2:
+            batch_size = min(max_bind_vars, batch_size * 2)
+        # A full batch is stored as None so it follows max_bind_vars
+        new_batch_size = None if batch_size >= max_bind_vars else batch_size
+        if new_batch_size != self.batch_size:
+            _LOGGER.debug(
+                "Purge batch took %.3fs, purging %s rows per batch",
+                batch_time,
+                batch_size,
+            )
+            self.batch_size = new_batch_size
+
+    def run_finished(self, elapsed: float, finished: bool) -> None:
+        """Record a purge run and persist the progress."""
+        self.runs += 1
+        self.elapsed += elapsed
+        if finished:
+            self.finished = dt_util.utcnow()
+        self.hass.add_job(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the progress."""
+        self._store.async_delay_save(self.as_dict, STORAGE_SAVE_DELAY)
+
+    async def async_load(self) -> None:
+        """Load the progress of a purge that was interrupted by a restart."""
+        if not (data := await self._store.async_load()):
+            return
+        self.purge_before = dt_util.parse_datetime(data["purge_before"])
+        self.repack = data["repack"]
+        self.apply_filter = data["apply_filter"]
+        self.started = dt_util.parse_datetime(data["started"])
+        self.finished = (
+            dt_util.parse_datetime(finished) if (finished := data["finished"]) else None
+        )
+        self.runs = data["runs"]
+        self.elapsed = data["elapsed"]
+        self.states = data["states"]
+        self.events = data["events"]
+        self.state_attributes = data["state_attributes"]
+        self.event_data = data["event_data"]
+        self.batch_size = data["batch_size"]
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "purge_before": self.purge_before and self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "started": self.started and self.started.isoformat(),
+            "finished": self.finished and self.finished.isoformat(),
+            "runs": self.runs,
+            "elapsed": self.elapsed,
+            "states": self.states,
+            "events": self.events,
+            "state_attributes": self.state_attributes,
+            "event_data": self.event_data,
+            "batch_size": self.batch_size,
+            "rows_per_second": self.rows_per_second,
+        }
@@ -207,6 +207,49 @@ class ShortTermStatisticsRunCache:
         """Cache the latest id for the each metadata_id."""
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
+    # This is a mapping of start_ts:metadata_id:statistic of the 5-minute
+    # periods compiled by this process during the current hour, which is
+    # used to summarize the hour without querying the database
+    _hour_periods: dict[float, dict[int, StatisticDataTimestamp]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def add_period(
+        self, start_ts: float, stats: dict[int, StatisticDataTimestamp]
+    ) -> None:
+        """Cache the short term statistics compiled for a 5-minute period."""
+        hour_start_ts = start_ts - start_ts % Statistics.duration.total_seconds()
+        hour_periods = self._hour_periods
+        for period_start_ts in [ts for ts in hour_periods if ts < hour_start_ts]:
+            del hour_periods[period_start_ts]
+        hour_periods[start_ts] = stats
+
+    def get_hour_periods(
+        self, start_ts: float
+    ) -> list[dict[int, StatisticDataTimestamp]] | None:
+        """Return the cached periods of the hour starting at start_ts.
+
+        Returns None unless every 5-minute period of the hour is cached.
+        """
+        period_seconds = StatisticsShortTerm.duration.total_seconds()
+        period_count = int(Statistics.duration.total_seconds() // period_seconds)
+        hour_periods = self._hour_periods
+        periods: list[dict[int, StatisticDataTimestamp]] = []
+        for idx in range(period_count):
+            if (stats := hour_periods.get(start_ts + idx * period_seconds)) is None:
+                return None
+            periods.append(stats)
+        return periods
+
+    def discard_hour_periods(self) -> None:
+        """Discard the cached periods.
+
+        Must be called when short term statistics are changed by anything
+        else than compiling them, the current hour will then be summarized
+        by querying the database.
+        """
+        self._hour_periods.clear()
+
 
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
@@ -397,18 +440,80 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics_from_periods(
+    periods: list[dict[int, StatisticDataTimestamp]], start_time_ts: float
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize cached 5-minute statistics for one hour.
+
+    This matches the result of the summary queries in _compile_hourly_statistics.
+    """
+    means: defaultdict[int, list[float]] = defaultdict(list)
+    mins: defaultdict[int, list[float]] = defaultdict(list)
+    maxs: defaultdict[int, list[float]] = defaultdict(list)
+    last_stats: dict[int, StatisticDataTimestamp] = {}
+    for period in periods:
+        for metadata_id, stat in period.items():
+            if (_mean := stat.get("mean")) is not None:
+                means[metadata_id].append(_mean)
+            if (_min := stat.get("min")) is not None:
+                mins[metadata_id].append(_min)
+            if (_max := stat.get("max")) is not None:
+                maxs[metadata_id].append(_max)
+            last_stats[metadata_id] = stat
+
+    return {
+        metadata_id: {
+            "start_ts": start_time_ts,
+            "mean": mean(means[metadata_id]) if metadata_id in means else None,
+            "min": min(mins[metadata_id]) if metadata_id in mins else None,
+            "max": max(maxs[metadata_id]) if metadata_id in maxs else None,
+            "last_reset_ts": last_stat.get("last_reset_ts"),
+            "state": last_stat.get("state"),
+            "sum": last_stat.get("sum"),
+        }
+        for metadata_id, last_stat in last_stats.items()
+    }
+
+
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    run_cache: ShortTermStatisticsRunCache | None = None,
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If every 5-minute period of the hour was compiled by this process,
+    the summary is computed from the run cache instead of the database.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
 
+    summary: dict[int, StatisticDataTimestamp]
+    if run_cache is not None and (periods := run_cache.get_hour_periods(start_time_ts)):
+        summary = _compile_hourly_statistics_from_periods(periods, start_time_ts)
+    else:
+        summary = _compile_hourly_statistics_from_db(
+            session, start_time_ts, end_time_ts
+        )
+
+    # Insert compiled hourly statistics in the database
+    now_timestamp = time_time()
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _compile_hourly_statistics_from_db(
+    session: Session, start_time_ts: float, end_time_ts: float
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize 5-minute statistics for one hour by querying the database."""
     # Compute last hour's average, min, max
     summary: dict[int, StatisticDataTimestamp] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
@@ -447,13 +552,27 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    now_timestamp = time_time()
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
-        for metadata_id, summary_item in summary.items()
+    return summary
+
+
+def _filter_compile_statistics_error(
+    instance: Recorder,
+) -> Callable[[Exception], bool]:
+    """Create a filter for errors when compiling statistics.
+
+    The 5-minute periods cached for summarizing the hour are discarded
+    since they may not have been committed to the database.
+    """
+    filter_integrity_error = filter_unique_constraint_integrity_error(
+        instance, "statistic"
     )
 
+    def _filter_compile_statistics_error(err: Exception) -> bool:
+        get_short_term_statistics_run_cache(instance.hass).discard_hour_periods()
+        return filter_integrity_error(err)
+
+    return _filter_compile_statistics_error
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -469,9 +588,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
 
     with session_scope(
         session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
+        exception_filter=_filter_compile_statistics_error(instance),
     ) as session:
         # Find the newest statistics run, if any
         if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
@@ -511,9 +628,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
         session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
+        exception_filter=_filter_compile_statistics_error(instance),
     ) as session:
         modified_statistic_ids = _compile_statistics(
             instance, session, start, fire_events
@@ -581,6 +696,7 @@ def _compile_statistics(
 
     new_short_term_stats: list[StatisticsBase] = []
     updated_metadata_ids: set[int] = set()
+    period_stats: dict[int, StatisticDataTimestamp] = {}
     now_timestamp = time_time()
     # Insert collected statistics in the database
     for stats in platform_stats:
@@ -590,10 +706,23 @@ def _compile_statistics(
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
         updated_metadata_ids.add(metadata_id)
+        stat = stats["stat"]
         if new_stat := _insert_statistics(
-            session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
+            session, StatisticsShortTerm, metadata_id, stat, now_timestamp
         ):
             new_short_term_stats.append(new_stat)
+            period_stats[metadata_id] = {
+                "start_ts": stat["start"].timestamp(),
+                "mean": stat.get("mean"),
+                "min": stat.get("min"),
+                "max": stat.get("max"),
+                "last_reset_ts": datetime_to_timestamp_or_none(stat.get("last_reset")),
+                "state": stat.get("state"),
+                "sum": stat.get("sum"),
+            }
+
+    run_cache = get_short_term_statistics_run_cache(instance.hass)
+    run_cache.add_period(start.timestamp(), period_stats)
 
     if start.minute == 50:
         # Once every hour, update issues
@@ -608,7 +737,7 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, run_cache)
 
     session.add(StatisticsRuns(start=start))
 
@@ -621,7 +750,6 @@ def _compile_statistics(
         # These are always the newest statistics, so we can update
         # the run cache without having to check the start_ts.
         session.flush()  # populate the ids of the new StatisticsShortTerm rows
-        run_cache = get_short_term_statistics_run_cache(instance.hass)
         # metadata_id is typed to allow None, but we know it's not None here
         # so we can safely cast it to int.
         run_cache.set_latest_ids_for_metadata_ids(
@@ -756,6 +884,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_short_term_statistics_run_cache(instance.hass).discard_hour_periods()
 
 
 def update_statistics_metadata(
@@ -2373,6 +2502,7 @@ def _import_statistics_with_session(
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
+    run_cache.discard_hour_periods()
     cache_latest_short_term_statistic_id_for_metadata_id(
         run_cache, session, metadata_id
     )
@@ -2488,6 +2618,7 @@ def adjust_statistics(
             start_time,
             sum_adjustment,
         )
+        get_short_term_statistics_run_cache(instance.hass).discard_hour_periods()
 
         _adjust_sum_statistics(
             session,
@@ -2560,6 +2691,7 @@ def change_statistics_unit(
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        get_short_term_statistics_run_cache(instance.hass).discard_hour_periods()
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
@@ -55,6 +55,25 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get info about the current or last purge."""
+    purge_info: dict[str, Any] = {}
+    progress = instance.purge_progress
+    if progress.started is None:
+        return purge_info
+    purge_info["purge_in_progress"] = progress.in_progress
+    purge_info["purge_rows_purged"] = (
+        progress.states
+        + progress.events
+        + progress.state_attributes
+        + progress.event_data
+    )
+    if (rows_per_second := progress.rows_per_second) is not None:
+        purge_info["purge_rows_per_second"] = f"{rows_per_second:.0f}"
+    return purge_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +91,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | _async_get_purge_info(instance)
@@ -573,6 +573,8 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
             max_exceeded=cfg[CONF_MAX_EXCEEDED],
             logger=logging.getLogger(f"{__name__}.{key}"),
             variables=cfg.get(CONF_VARIABLES),
+            # Blueprint scripts only render the variables their sequence reads
+            render_referenced_variables=blueprint_inputs is not None,
         )
         self._changed = asyncio.Event()
         self.raw_config = raw_config
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from array import array
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
-import itertools
+from itertools import chain
 import logging
 import math
+from operator import sub
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -99,51 +101,96 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
-def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
-) -> float:
-    """Calculate a time weighted average.
+def _timestamp_to_microseconds(timestamp: float) -> int:
+    """Convert a timestamp to integer microseconds.
 
-    The average is calculated by weighting the states by duration in seconds between
-    state changes.
-    Note: there's no interpolation of values between state changes.
+    The timestamp is rounded the same way as when it is converted to a datetime.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
+    seconds = int(timestamp)
+    return seconds * 1_000_000 + round((timestamp - seconds) * 1_000_000)
 
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
-
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
-    if period_seconds == 0:
-        # If the only state changed that happened was at the exact moment
-        # at the end of the period, we can't calculate a meaningful average
-        # so we return 0.0 since it represents a time duration smaller than
-        # we can measure. This probably means the precision of statistics
-        # column schema in the database is incorrect but it is actually possible
-        # to happen if the state change event fired at the exact microsecond
-        return 0.0
-    return accumulated / period_seconds
+
+class _FloatStateColumns:
+    """Timestamps and values of the float states of many entities.
+
+    The states of each entity are stored in a contiguous slice of flat
+    arrays so the statistics are calculated over the slices by the array
+    and math functions, without creating a datetime object for every state.
+    """
+
+    __slots__ = ("_slices", "_timestamps", "_values")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self._timestamps: array[int] = array("q")
+        self._values: array[float] = array("d")
+        self._slices: dict[str, tuple[int, int]] = {}
+
+    def add(self, entity_id: str, fstates: list[tuple[float, State]]) -> None:
+        """Add the float states of an entity."""
+        first = len(self._values)
+        self._values.extend(fstate for fstate, _ in fstates)
+        self._timestamps.extend(
+            _timestamp_to_microseconds(state.last_updated_timestamp)
+            for _, state in fstates
+        )
+        self._slices[entity_id] = (first, len(self._values))
+
+    def min(self, entity_id: str) -> float:
+        """Return the minimum value of an entity."""
+        first, last = self._slices[entity_id]
+        return min(self._values[first:last])
+
+    def max(self, entity_id: str) -> float:
+        """Return the maximum value of an entity."""
+        first, last = self._slices[entity_id]
+        return max(self._values[first:last])
+
+    def time_weighted_averages(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict[str, float]:
+        """Calculate the time weighted average of every entity.
+
+        The average is calculated by weighting the states by duration in seconds
+        between state changes.
+        Note: there's no interpolation of values between state changes.
+        """
+        start_us = _timestamp_to_microseconds(start.timestamp())
+        end_us = _timestamp_to_microseconds(end.timestamp())
+        timestamps = self._timestamps
+        values = self._values
+        averages: dict[str, float] = {}
+
+        for entity_id, (first, last) in self._slices.items():
+            start_times = timestamps[first:last]
+            # The recorder will give us the last known state, which may be well
+            # before the requested start time for the statistics, the states
+            # are in order so only the first ones can be before it
+            idx = 0
+            while idx < len(start_times) and start_times[idx] < start_us:
+                start_times[idx] = start_us
+                idx += 1
+
+            period_us = end_us - start_times[0]
+            if period_us == 0:
+                # If the only state changed that happened was at the exact moment
+                # at the end of the period, we can't calculate a meaningful average
+                # so we return 0.0 since it represents a time duration smaller than
+                # we can measure. This probably means the precision of statistics
+                # column schema in the database is incorrect but it is actually
+                # possible to happen if the state change event fired at the exact
+                # microsecond
+                averages[entity_id] = 0.0
+                continue
+
+            # Weight the values by the duration until the next state change,
+            # or until the end of the period for the last one
+            durations = map(sub, chain(start_times[1:], (end_us,)), start_times)
+            averages[entity_id] = (
+                math.sumprod(values[first:last], durations) / period_us
+            )
+
+        return averages
 
 
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
@@ -462,6 +509,7 @@ def compile_statistics(  # noqa: C901
     )
     to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
     to_query: set[str] = set()
+    float_state_columns = _FloatStateColumns()
     for _state in sensor_states:
         entity_id = _state.entity_id
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
@@ -478,7 +526,10 @@ def compile_statistics(  # noqa: C901
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
+        if not wanted_statistics[entity_id].isdisjoint(("max", "mean", "min")):
+            float_state_columns.add(entity_id, valid_float_states)
 
+    time_weighted_averages = float_state_columns.time_weighted_averages(start, end)
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
@@ -526,16 +577,12 @@ def compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["max"] = float_state_columns.max(entity_id)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+            stat["min"] = float_state_columns.min(entity_id)
 
         if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            stat["mean"] = time_weighted_averages[entity_id]
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -0,0 +1,615 @@
+"""Incrementally maintained characteristics of a statistics sample window."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+from homeassistant.util import dt as dt_util
+
+
+class SampleAggregate:
+    """Keep one characteristic of a sample window up to date.
+
+    The sensor calls sample_added after a sample was appended to the
+    window and sample_removed before the oldest sample is removed, so
+    the characteristic can be returned without looking at every sample.
+
+    Aggregates accumulating floats are rebuilt from the window once as
+    many samples have been removed as the window holds, which bounds
+    the rounding error of the running sums at amortized O(1) cost.
+    They are also rebuilt once a sample which is not finite leaves the
+    window, since it can't be subtracted from the running sums.
+    """
+
+    _accumulates_floats = True
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._removed = 0
+        self._stale = False
+        self._clear()
+
+    def _clear(self) -> None:
+        """Reset the aggregate to an empty window."""
+        raise NotImplementedError
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        """Add the newest sample, prev_* are None if it is the only one."""
+        raise NotImplementedError
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        """Remove the oldest sample, next_* are None if it is the only one."""
+        raise NotImplementedError
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | int | datetime | None:
+        """Return the characteristic of the window."""
+        raise NotImplementedError
+
+    def sample_added(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Handle a sample appended to the window."""
+        if self._stale:
+            return
+        if len(states) > 1:
+            self._add(states[-1], ages[-1], states[-2], ages[-2])
+        else:
+            self._add(states[-1], ages[-1], None, None)
+
+    def sample_removed(self, states: deque[bool | float], ages: deque[float]) -> None:
+        """Handle the oldest sample being removed from the window."""
+        if self._stale:
+            return
+        if not math.isfinite(states[0]):
+            self._stale = True
+            return
+        if len(states) > 1:
+            self._remove(states[0], ages[0], states[1], ages[1])
+        else:
+            self._remove(states[0], ages[0], None, None)
+        if self._accumulates_floats:
+            self._removed += 1
+            self._stale = self._removed >= len(states)
+
+    def value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | int | datetime | None:
+        """Return the characteristic, rebuilding the aggregate if needed."""
+        if self._stale:
+            self._clear()
+            prev_value: bool | float | None = None
+            prev_age: float | None = None
+            for value, age in zip(states, ages, strict=True):
+                self._add(value, age, prev_value, prev_age)
+                prev_value, prev_age = value, age
+            self._removed = 0
+            self._stale = False
+        return self._value(states, ages, percentile)
+
+
+# Aggregates for numeric sensors
+
+
+class _Moments(SampleAggregate):
+    """Running sum and Welford variance of the samples."""
+
+    def _clear(self) -> None:
+        self._count = 0
+        self._sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        self._count += 1
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        self._count -= 1
+        if not self._count:
+            self._clear()
+            return
+        self._sum -= value
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 = max(0.0, self._m2 - delta * (value - self._mean))
+
+    def _variance(self) -> float:
+        """Return the sample variance of at least two samples."""
+        return self._m2 / (self._count - 1)
+
+
+class Mean(_Moments):
+    """Mean of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._count > 0:
+            return self._sum / self._count
+        return None
+
+
+class Sum(_Moments):
+    """Sum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._count > 0:
+            return self._sum
+        return None
+
+
+class Variance(_Moments):
+    """Sample variance of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._count == 1:
+            return 0.0
+        if self._count >= 2:
+            return self._variance()
+        return None
+
+
+class StandardDeviation(_Moments):
+    """Sample standard deviation of the samples, optionally scaled."""
+
+    def __init__(self, scale: float = 1.0) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._scale = scale
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._count == 1:
+            return 0.0
+        if self._count >= 2:
+            return self._scale * math.sqrt(self._variance())
+        return None
+
+
+class MeanCircular(SampleAggregate):
+    """Circular mean of samples in degrees."""
+
+    def _clear(self) -> None:
+        self._count = 0
+        self._sin_sum = 0.0
+        self._cos_sum = 0.0
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        self._count += 1
+        self._sin_sum += math.sin(math.radians(value))
+        self._cos_sum += math.cos(math.radians(value))
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        self._count -= 1
+        self._sin_sum -= math.sin(math.radians(value))
+        self._cos_sum -= math.cos(math.radians(value))
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._count > 0:
+            return (math.degrees(math.atan2(self._sin_sum, self._cos_sum)) + 360) % 360
+        return None
+
+
+class _Extremes(SampleAggregate):
+    """Monotonic deques holding the candidates for the minimum and maximum.
+
+    The front of each deque is the oldest sample with the extreme value.
+    Samples are numbered as they are added so the front can be dropped
+    when the sample it refers to leaves the window.
+    """
+
+    _accumulates_floats = False
+
+    def _clear(self) -> None:
+        self._added = 0
+        self._removed_samples = 0
+        self._max: deque[tuple[int, bool | float, float]] = deque()
+        self._min: deque[tuple[int, bool | float, float]] = deque()
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        sample = (self._added, value, age)
+        self._added += 1
+        while self._max and self._max[-1][1] < value:
+            self._max.pop()
+        self._max.append(sample)
+        while self._min and self._min[-1][1] > value:
+            self._min.pop()
+        self._min.append(sample)
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        sample_number = self._removed_samples
+        self._removed_samples += 1
+        if self._max[0][0] == sample_number:
+            self._max.popleft()
+        if self._min[0][0] == sample_number:
+            self._min.popleft()
+
+
+class ValueMax(_Extremes):
+    """Maximum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._max:
+            return self._max[0][1]
+        return None
+
+
+class ValueMin(_Extremes):
+    """Minimum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._min:
+            return self._min[0][1]
+        return None
+
+
+class DistanceAbsolute(_Extremes):
+    """Difference between the maximum and minimum of the samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if self._max:
+            return self._max[0][1] - self._min[0][1]
+        return None
+
+
+class DatetimeValueMax(_Extremes):
+    """Time of the oldest sample with the maximum value."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> datetime | None:
+        if self._max:
+            return dt_util.utc_from_timestamp(self._max[0][2])
+        return None
+
+
+class DatetimeValueMin(_Extremes):
+    """Time of the oldest sample with the minimum value."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> datetime | None:
+        if self._min:
+            return dt_util.utc_from_timestamp(self._min[0][2])
+        return None
+
+
+class _OrderStatistics(SampleAggregate):
+    """Sorted copy of the samples.
+
+    Samples are located by bisection. Inserting and deleting moves the
+    tail of a flat list, a single memmove that stays far below the cost
+    of sorting the window for windows of any practical size.
+
+    NaN samples don't compare with any other, the list is rebuilt from the
+    window when a sample can't be found where bisection locates it.
+    """
+
+    _accumulates_floats = False
+
+    def _clear(self) -> None:
+        self._sorted: list[bool | float] = []
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        insort(self._sorted, value)
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        data = self._sorted
+        index = bisect_left(data, value)
+        if index < len(data) and data[index] == value:
+            del data[index]
+        else:
+            self._stale = True
+
+
+class Median(_OrderStatistics):
+    """Median of the samples, as returned by statistics.median."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        data = self._sorted
+        if not (n := len(data)):
+            return None
+        if n % 2 == 1:
+            return data[n // 2]
+        i = n // 2
+        return (data[i - 1] + data[i]) / 2
+
+
+class Percentile(_OrderStatistics):
+    """Percentile of the samples, as returned by statistics.quantiles."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        data = self._sorted
+        if (n := len(data)) == 1:
+            return data[0]
+        if n >= 2:
+            # The exclusive method of statistics.quantiles with n=100
+            m = n + 1
+            j = min(max(percentile * m // 100, 1), n - 1)
+            delta = percentile * m - j * 100
+            return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
+        return None
+
+
+class _PairwiseSum(SampleAggregate):
+    """Running sum of a term over each pair of consecutive samples."""
+
+    def _clear(self) -> None:
+        self._total = 0.0
+
+    def _term(
+        self, value: bool | float, age: float, next_value: bool | float, next_age: float
+    ) -> float:
+        """Return the term for two consecutive samples."""
+        raise NotImplementedError
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        if prev_value is not None:
+            assert prev_age is not None
+            self._total += self._term(prev_value, prev_age, value, age)
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        if next_value is not None:
+            assert next_age is not None
+            self._total -= self._term(value, age, next_value, next_age)
+        else:
+            self._total = 0.0
+
+
+class SumDifferences(_PairwiseSum):
+    """Sum of the absolute differences between consecutive samples."""
+
+    def _term(
+        self, value: bool | float, age: float, next_value: bool | float, next_age: float
+    ) -> float:
+        return abs(next_value - value)
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._total
+        return None
+
+
+class SumDifferencesNonnegative(_PairwiseSum):
+    """Sum of the differences between consecutive samples of a counter."""
+
+    def _term(
+        self, value: bool | float, age: float, next_value: bool | float, next_age: float
+    ) -> float:
+        return next_value - value if next_value >= value else next_value - 0
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._total
+        return None
+
+
+class Noisiness(SumDifferences):
+    """Mean absolute difference between consecutive samples."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 0.0
+        if len(states) >= 2:
+            return self._total / (len(states) - 1)
+        return None
+
+
+class AverageLinear(_PairwiseSum):
+    """Time weighted average with linear interpolation between samples."""
+
+    def _term(
+        self, value: bool | float, age: float, next_value: bool | float, next_age: float
+    ) -> float:
+        return 0.5 * (next_value + value) * (next_age - age)
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return states[0]
+        if len(states) >= 2:
+            return self._total / (ages[-1] - ages[0])
+        return None
+
+
+class AverageStep(_PairwiseSum):
+    """Time weighted average holding each sample until the next one."""
+
+    def _term(
+        self, value: bool | float, age: float, next_value: bool | float, next_age: float
+    ) -> float:
+        return value * (next_age - age)
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return states[0]
+        if len(states) >= 2:
+            return self._total / (ages[-1] - ages[0])
+        return None
+
+
+# Aggregates for binary sensors
+
+
+class BinaryAverageStep(_PairwiseSum):
+    """Percentage of time a binary sensor was on."""
+
+    def _term(
+        self, value: bool | float, age: float, next_value: bool | float, next_age: float
+    ) -> float:
+        return next_age - age if value is True else 0.0
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) == 1:
+            return 100.0 * int(states[0] is True)
+        if len(states) >= 2:
+            return 100 / (ages[-1] - ages[0]) * self._total
+        return None
+
+
+class _BinaryCount(SampleAggregate):
+    """Number of samples of a binary sensor that are on."""
+
+    _accumulates_floats = False
+
+    def _clear(self) -> None:
+        self._on = 0
+
+    def _add(
+        self,
+        value: bool | float,
+        age: float,
+        prev_value: bool | float | None,
+        prev_age: float | None,
+    ) -> None:
+        if value is True:
+            self._on += 1
+
+    def _remove(
+        self,
+        value: bool | float,
+        age: float,
+        next_value: bool | float | None,
+        next_age: float | None,
+    ) -> None:
+        if value is True:
+            self._on -= 1
+
+
+class BinaryCountOn(_BinaryCount):
+    """Number of samples that are on."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> int | None:
+        return self._on
+
+
+class BinaryCountOff(_BinaryCount):
+    """Number of samples that are off."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> int | None:
+        return len(states) - self._on
+
+
+class BinaryMean(_BinaryCount):
+    """Percentage of samples that are on."""
+
+    def _value(
+        self, states: deque[bool | float], ages: deque[float], percentile: int
+    ) -> float | None:
+        if len(states) > 0:
+            return 100.0 / len(states) * self._on
+        return None
@@ -6,6 +6,7 @@ from collections import deque
 from collections.abc import Callable, Mapping
 import contextlib
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 import math
 import statistics
@@ -59,6 +60,30 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregates import (
+    AverageLinear,
+    AverageStep,
+    BinaryAverageStep,
+    BinaryCountOff,
+    BinaryCountOn,
+    BinaryMean,
+    DatetimeValueMax,
+    DatetimeValueMin,
+    DistanceAbsolute,
+    Mean,
+    MeanCircular,
+    Median,
+    Noisiness,
+    Percentile,
+    SampleAggregate,
+    StandardDeviation,
+    Sum,
+    SumDifferences,
+    SumDifferencesNonnegative,
+    ValueMax,
+    ValueMin,
+    Variance,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -109,6 +134,16 @@ def _callable_characteristic_fn(
     return STATS_NUMERIC_SUPPORT[characteristic]
 
 
+def _incremental_characteristic_aggregate(
+    characteristic: str, binary: bool
+) -> SampleAggregate | None:
+    """Return an aggregate maintaining the characteristic, if there is one."""
+    incremental = STATS_BINARY_INCREMENTAL if binary else STATS_NUMERIC_INCREMENTAL
+    if (aggregate_factory := incremental.get(characteristic)) is None:
+        return None
+    return aggregate_factory()
+
+
 # Statistics for numeric sensor
 
 
@@ -467,6 +502,41 @@ STATS_BINARY_SUPPORT = {
     STAT_MEAN: _stat_binary_mean,
 }
 
+# Statistics kept up to date as samples enter and leave the buffer instead
+# of being calculated over the whole buffer on every update (numeric)
+STATS_NUMERIC_INCREMENTAL: dict[str, Callable[[], SampleAggregate]] = {
+    STAT_AVERAGE_LINEAR: AverageLinear,
+    STAT_AVERAGE_STEP: AverageStep,
+    STAT_AVERAGE_TIMELESS: Mean,
+    STAT_DATETIME_VALUE_MAX: DatetimeValueMax,
+    STAT_DATETIME_VALUE_MIN: DatetimeValueMin,
+    STAT_DISTANCE_95P: partial(StandardDeviation, 2 * 1.96),
+    STAT_DISTANCE_99P: partial(StandardDeviation, 2 * 2.58),
+    STAT_DISTANCE_ABSOLUTE: DistanceAbsolute,
+    STAT_MEAN: Mean,
+    STAT_MEAN_CIRCULAR: MeanCircular,
+    STAT_MEDIAN: Median,
+    STAT_NOISINESS: Noisiness,
+    STAT_PERCENTILE: Percentile,
+    STAT_STANDARD_DEVIATION: StandardDeviation,
+    STAT_SUM: Sum,
+    STAT_SUM_DIFFERENCES: SumDifferences,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: SumDifferencesNonnegative,
+    STAT_TOTAL: Sum,
+    STAT_VALUE_MAX: ValueMax,
+    STAT_VALUE_MIN: ValueMin,
+    STAT_VARIANCE: Variance,
+}
+
+# Statistics kept up to date as samples enter and leave the buffer (binary)
+STATS_BINARY_INCREMENTAL: dict[str, Callable[[], SampleAggregate]] = {
+    STAT_AVERAGE_STEP: BinaryAverageStep,
+    STAT_AVERAGE_TIMELESS: BinaryMean,
+    STAT_COUNT_BINARY_ON: BinaryCountOn,
+    STAT_COUNT_BINARY_OFF: BinaryCountOff,
+    STAT_MEAN: BinaryMean,
+}
+
 STATS_NOT_A_NUMBER = {
     STAT_DATETIME_NEWEST,
     STAT_DATETIME_OLDEST,
@@ -691,10 +761,17 @@ class StatisticsSensor(SensorEntity):
         self.ages: deque[float] = deque(maxlen=samples_max_buffer_size)
         self._attr_extra_state_attributes = {}
 
+        self._aggregate = _incremental_characteristic_aggregate(
+            state_characteristic, self.is_binary
+        )
         self._state_characteristic_fn: Callable[
             [deque[bool | float], deque[float], int],
             float | int | datetime | None,
-        ] = _callable_characteristic_fn(state_characteristic, self.is_binary)
+        ] = (
+            self._aggregate.value
+            if self._aggregate is not None
+            else _callable_characteristic_fn(state_characteristic, self.is_binary)
+        )
 
         self._update_listener: CALLBACK_TYPE | None = None
         self._preview_callback: Callable[[str, Mapping[str, Any]], None] | None = None
@@ -797,10 +874,13 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._add_sample(
+                    new_state.state == "on", new_state.last_reported_timestamp
+                )
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_reported_timestamp)
+                self._add_sample(
+                    float(new_state.state), new_state.last_reported_timestamp
+                )
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self._attr_extra_state_attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -813,6 +893,22 @@ class StatisticsSensor(SensorEntity):
 
         self._calculate_state_attributes(new_state)
 
+    def _add_sample(self, value: bool | float, timestamp: float) -> None:
+        """Append a sample, removing the oldest one if the buffer is full."""
+        if len(self.states) == self._samples_max_buffer_size:
+            self._remove_oldest_sample()
+        self.states.append(value)
+        self.ages.append(timestamp)
+        if self._aggregate is not None:
+            self._aggregate.sample_added(self.states, self.ages)
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        if self._aggregate is not None:
+            self._aggregate.sample_removed(self.states, self.ages)
+        self.ages.popleft()
+        self.states.popleft()
+
     def _calculate_state_attributes(self, new_state: State) -> None:
         """Set the entity state attributes."""
 
@@ -944,8 +1040,7 @@ class StatisticsSensor(SensorEntity):
                     dt_util.as_local(dt_util.utc_from_timestamp(self.ages[0])),
                     dt_util.utc_from_timestamp(now_timestamp - self.ages[0]),
                 )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> float | None:
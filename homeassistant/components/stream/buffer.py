@@ -0,0 +1,162 @@
+"""Pooled in-memory files for muxing segments.
+
+Segments are muxed into a SegmentBuffer, and the parts and the segment data
+are memoryview slices of it, so they are neither copied when a part is
+flushed nor joined when a segment is served.
+
+The underlying bytearrays are recycled through a SegmentBufferPool. A
+bytearray with exported memoryviews can't be resized, which tells whether a
+Part or a response still refers to it. Only buffers without any views left
+are handed out again, so data of a segment which is still kept by an output
+or sent to a client is never overwritten.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from io import SEEK_CUR, SEEK_END, SEEK_SET
+
+from .const import SEGMENT_BUFFER_INITIAL_SIZE, SEGMENT_BUFFER_POOL_SIZE
+
+_SIZE_STEP = 64 * 1024
+
+
+def _in_use(buffer: bytearray) -> bool:
+    """Return if there are memoryviews of the buffer."""
+    try:
+        buffer.append(0)
+    except BufferError:
+        return True
+    del buffer[-1]
+    return False
+
+
+class SegmentBufferPool:
+    """Ring of buffers which may be reused once no views of them are left."""
+
+    def __init__(self, max_buffers: int = SEGMENT_BUFFER_POOL_SIZE) -> None:
+        """Initialize the pool."""
+        self._buffers: deque[bytearray] = deque(maxlen=max_buffers)
+        self._buffer_size = SEGMENT_BUFFER_INITIAL_SIZE
+        self.allocations = 0
+        self.reuses = 0
+        # Size of the buffers in use by the muxer
+        self.active_bytes = 0
+
+    @property
+    def pooled_bytes(self) -> int:
+        """Return the size of the buffers kept for reuse."""
+        return sum(len(buffer) for buffer in self._buffers)
+
+    def acquire(self, min_size: int = 0) -> bytearray:
+        """Return a free buffer of at least min_size bytes."""
+        min_size = max(min_size, self._buffer_size)
+        buffers = self._buffers
+        for _ in range(len(buffers)):
+            buffer = buffers.popleft()
+            if len(buffer) < min_size:
+                # Too small for the segments of this stream, drop it
+                continue
+            if not _in_use(buffer):
+                self.reuses += 1
+                self.active_bytes += len(buffer)
+                return buffer
+            buffers.append(buffer)
+        self.allocations += 1
+        # Allocate a spare byte, so checking if the buffer is in use
+        # doesn't need to reallocate it
+        buffer = bytearray(min_size + 1)
+        del buffer[-1]
+        self.active_bytes += min_size
+        return buffer
+
+    def release(self, buffer: bytearray, used: int) -> None:
+        """Return a buffer to the pool once the muxer is done with it.
+
+        The buffers for later segments are sized to fit the largest segment
+        seen, with some headroom.
+        """
+        self.active_bytes -= len(buffer)
+        needed = -(-used * 5 // 4 // _SIZE_STEP) * _SIZE_STEP
+        self._buffer_size = max(self._buffer_size, needed)
+        if len(buffer) >= self._buffer_size:
+            self._buffers.append(buffer)
+
+
+class SegmentBuffer:
+    """A seekable in-memory file muxed into by av.
+
+    Unlike BytesIO, it can be written to while memoryviews of the data
+    written so far are held.
+    """
+
+    def __init__(self, pool: SegmentBufferPool) -> None:
+        """Initialize the buffer."""
+        self._pool = pool
+        self._buffer: bytearray | None = pool.acquire()
+        self._size = 0
+        self._pos = 0
+
+    def _ensure_capacity(self, size: int) -> bytearray:
+        """Return the buffer, moved to a larger one if needed."""
+        buffer = self._buffer
+        if buffer is None:
+            raise ValueError("I/O operation on closed file.")
+        if size <= len(buffer):
+            return buffer
+        # Views of the old buffer keep it alive, so they remain valid
+        larger = self._pool.acquire(max(size, 2 * len(buffer)))
+        larger[: self._size] = memoryview(buffer)[: self._size]
+        self._pool.release(buffer, self._size)
+        self._buffer = larger
+        return larger
+
+    def write(self, data: bytes) -> int:
+        """Write data at the current position."""
+        end = self._pos + len(data)
+        buffer = self._ensure_capacity(end)
+        if self._pos > self._size:
+            # Fill a gap left by seeking past the end
+            buffer[self._size : self._pos] = bytes(self._pos - self._size)
+        buffer[self._pos : end] = data
+        self._pos = end
+        self._size = max(self._size, end)
+        return len(data)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read a copy of up to size bytes from the current position."""
+        buffer = self._ensure_capacity(0)
+        end = self._size if size < 0 else min(self._size, self._pos + size)
+        if end <= self._pos:
+            return b""
+        with memoryview(buffer) as view:
+            data = bytes(view[self._pos : end])
+        self._pos = end
+        return data
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        """Change the current position."""
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self._size
+        elif whence != SEEK_SET:
+            raise ValueError(f"Invalid whence ({whence})")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._pos
+
+    def view(self, start: int, end: int) -> memoryview:
+        """Return a read only view of the data from start to end."""
+        return memoryview(self._ensure_capacity(0))[start:end].toreadonly()
+
+    def close(self) -> None:
+        """Return the buffer to the pool."""
+        if self._buffer is not None:
+            self._pool.release(self._buffer, self._size)
+            self._buffer = None
@@ -26,6 +26,10 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
+# Buffers to keep for reuse by the segments of a stream, which covers those
+# kept around plus the ones which are still being written or served
+SEGMENT_BUFFER_POOL_SIZE = MAX_SEGMENTS + 3
+SEGMENT_BUFFER_INITIAL_SIZE = 512 * 1024  # Grows to fit the largest segment
 TARGET_SEGMENT_DURATION_NON_LL_HLS = 2.0  # Each segment is about this many seconds
 SEGMENT_DURATION_ADJUSTER = 0.1  # Used to avoid missing keyframe boundaries
 # Number of target durations to start before the end of the playlist.
@@ -77,8 +77,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data when muxed
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +102,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # View of the data of all parts, set with the last part
+    _data_view: memoryview | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -128,18 +130,27 @@ class Segment:
         self,
         part: Part,
         duration: float,
+        data_view: memoryview | None = None,
     ) -> None:
         """Add a part to the Segment.
 
-        Duration is non zero only for the last part.
+        Duration is non zero only for the last part, which may come with a
+        view of the data of all parts.
         """
         self.parts.append(part)
         self.duration = duration
+        self._data_view = data_view
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init.
+
+        The data of a complete segment is returned without joining the parts
+        when they were muxed into the same buffer.
+        """
+        if self._data_view is not None:
+            return self._data_view
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
@@ -7,7 +7,7 @@ from collections.abc import Callable, Generator, Iterator, Mapping
 import contextlib
 from dataclasses import fields
 import datetime
-from io import SEEK_END, BytesIO
+from io import SEEK_END
 import logging
 from threading import Event
 from typing import Any, Self, cast
@@ -22,6 +22,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from . import redact_credentials
+from .buffer import SegmentBuffer, SegmentBufferPool
 from .const import (
     AUDIO_CODECS,
     HLS_PROVIDER,
@@ -81,6 +82,7 @@ class StreamState:
         # has a sequence number of 0.
         self._sequence = -1
         self._diagnostics = diagnostics
+        self.segment_buffer_pool = SegmentBufferPool()
 
     @property
     def sequence(self) -> int:
@@ -122,7 +124,7 @@ class StreamMuxer:
     """StreamMuxer re-packages video/audio packets for output."""
 
     _segment_start_dts: int
-    _memory_file: BytesIO
+    _memory_file: SegmentBuffer
     _av_output: av.container.OutputContainer
     _output_video_stream: av.VideoStream
     _output_audio_stream: av.audio.AudioStream | None
@@ -130,6 +132,8 @@ class StreamMuxer:
     # the following 2 member variables are used for Part formation
     _memory_file_pos: int
     _part_start_dts: float
+    # position of the first part in the memory_file
+    _segment_data_pos: int
 
     def __init__(
         self,
@@ -153,7 +157,7 @@ class StreamMuxer:
 
     def make_new_av(
         self,
-        memory_file: BytesIO,
+        memory_file: SegmentBuffer,
         sequence: int,
         input_vstream: av.VideoStream,
         input_astream: av.audio.AudioStream | None,
@@ -237,8 +241,8 @@ class StreamMuxer:
         """Initialize a new stream segment."""
         self._part_start_dts = self._segment_start_dts = video_dts
         self._segment = None
-        self._memory_file = BytesIO()
-        self._memory_file_pos = 0
+        self._memory_file = SegmentBuffer(self._stream_state.segment_buffer_pool)
+        self._memory_file_pos = self._segment_data_pos = 0
         (
             self._av_output,
             self._output_video_stream,
@@ -292,7 +296,7 @@ class StreamMuxer:
             _stream_outputs=self._stream_state.outputs,
             start_time=self._start_time,
         )
-        self._memory_file_pos = self._memory_file.tell()
+        self._memory_file_pos = self._segment_data_pos = self._memory_file.tell()
         self._memory_file.seek(0, SEEK_END)
 
     def check_flush_part(self, packet: av.Packet) -> None:
@@ -355,7 +359,9 @@ class StreamMuxer:
         if not self._stream_settings.ll_hls:
             adjusted_dts = packet.dts
         assert self._segment
-        self._memory_file.seek(self._memory_file_pos)
+        # The part and segment data are views of the memory_file, which
+        # remain valid while more data is written
+        data_end = self._memory_file.seek(0, SEEK_END)
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
             Part(
@@ -363,7 +369,7 @@ class StreamMuxer:
                     (adjusted_dts - self._part_start_dts) * packet.time_base
                 ),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=self._memory_file.view(self._memory_file_pos, data_end),
             ),
             (
                 (
@@ -374,10 +380,17 @@ class StreamMuxer:
                 if last_part
                 else 0
             ),
+            (
+                self._memory_file.view(self._segment_data_pos, data_end)
+                if last_part
+                else None
+            ),
         )
         if last_part:
-            # If we've written the last part, we can close the memory_file.
-            self._memory_file.close()  # We don't need the BytesIO object anymore
+            # If we've written the last part, we can close the memory_file,
+            # which returns its buffer to the pool for when the views are gone
+            self._memory_file.close()
+            self._update_buffer_diagnostics()
             self._start_time += datetime.timedelta(seconds=segment_duration)
             # Reinitialize
             self.reset(packet.dts)
@@ -388,6 +401,16 @@ class StreamMuxer:
             self._part_start_dts = adjusted_dts
         self._part_has_keyframe = False
 
+    def _update_buffer_diagnostics(self) -> None:
+        """Report the memory used for the segments of the stream."""
+        pool = self._stream_state.segment_buffer_pool
+        diagnostics = self._stream_state.diagnostics
+        diagnostics.set_value("segment_buffer_allocations", pool.allocations)
+        diagnostics.set_value("segment_buffer_reuses", pool.reuses)
+        diagnostics.set_value(
+            "segment_buffer_bytes", pool.pooled_bytes + pool.active_bytes
+        )
+
     def close(self) -> None:
         """Close stream buffer."""
         self._av_output.close()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
@@ -25,6 +26,7 @@ from homeassistant.core import (
     HomeAssistant,
     ServiceResponse,
     State,
+    StatesSnapshot,
     callback,
 )
 from homeassistant.exceptions import (
@@ -65,6 +67,7 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .replay import StateReplayLog, async_get_state_replay_log
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -312,16 +315,13 @@ async def handle_call_service(
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
-) -> list[State]:
+) -> StatesSnapshot | list[State]:
+    snapshot = hass.states.async_snapshot()
     user = connection.user
     if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
-        return hass.states.async_all()
+        return snapshot
     entity_perm = connection.user.permissions.check_entity
-    return [
-        state
-        for state in hass.states.async_all()
-        if entity_perm(state.entity_id, POLICY_READ)
-    ]
+    return [state for state in snapshot if entity_perm(state.entity_id, POLICY_READ)]
 
 
 @callback
@@ -333,7 +333,13 @@ def handle_get_states(
     states = _async_get_allowed_states(hass, connection)
 
     try:
-        serialized_states = [state.as_dict_json for state in states]
+        if type(states) is StatesSnapshot:
+            # Reuse the JSON of the domains which did not change
+            serialized_states = [
+                domain.as_dict_json for domain in states.domains.values()
+            ]
+        else:
+            serialized_states = [state.as_dict_json for state in states]
     except (ValueError, TypeError):
         pass
     else:
@@ -370,17 +376,15 @@ def _send_handle_get_states_response(
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
     event: Event[EventStateChangedData],
+    seq: int | None = None,
 ) -> None:
     """Forward entity state changed events to websocket."""
     entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
+    if entity_filter and not entity_filter(entity_id):
         return
     # We have to lookup the permissions again because the user might have
     # changed since the subscription was created.
@@ -391,7 +395,123 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    send_message(messages.cached_state_diff_message(message_id_as_bytes, event, seq))
+
+
+@callback
+def _forward_resumable_entity_changes(
+    replay_log: StateReplayLog,
+    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    entity_filter: Callable[[str], bool] | None,
+    user: User,
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+) -> None:
+    """Forward entity state changed events with their sequence number."""
+    _forward_entity_changes(
+        send_message,
+        entity_filter,
+        user,
+        message_id_as_bytes,
+        event,
+        replay_log.last_seq,
+    )
+
+
+class _CoalescedEntityChanges:
+    """Coalesce the entity state changes of a subscription.
+
+    State changes are collected for coalesce_interval seconds and then sent
+    as a single event message with one diff per entity.
+    """
+
+    __slots__ = (
+        "_changes",
+        "_coalesce_interval",
+        "_entity_filter",
+        "_hass",
+        "_message_id_as_bytes",
+        "_send_message",
+        "_timer",
+        "_user",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+        coalesce_interval: float,
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._send_message = send_message
+        self._entity_filter = entity_filter
+        self._user = user
+        self._message_id_as_bytes = message_id_as_bytes
+        self._coalesce_interval = coalesce_interval
+        self._changes: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add_change(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the next message."""
+        entity_id = event.data["entity_id"]
+        if self._entity_filter and not self._entity_filter(entity_id):
+            return
+        if (change := self._changes.get(entity_id)) is None:
+            self._changes[entity_id] = (
+                event.data["old_state"],
+                event.data["new_state"],
+            )
+        else:
+            self._changes[entity_id] = (change[0], event.data["new_state"])
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(
+                self._coalesce_interval, self._async_send_changes
+            )
+
+    @callback
+    def _async_send_changes(self) -> None:
+        """Send the collected state changes."""
+        self._timer = None
+        changes = self._changes
+        self._changes = {}
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        user = self._user
+        permissions = user.permissions
+        if not user.is_admin and not permissions.access_all_entities(POLICY_READ):
+            changes = {
+                entity_id: change
+                for entity_id, change in changes.items()
+                if permissions.check_entity(entity_id, POLICY_READ)
+            }
+        if changes:
+            self._send_message(
+                messages.coalesced_state_diff_message(
+                    self._message_id_as_bytes, changes
+                )
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the collected state changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._changes.clear()
+
+
+@callback
+def _async_unsub_coalesced_entity_changes(
+    unsub: Callable[[], None], coalescer: _CoalescedEntityChanges
+) -> None:
+    """Unsubscribe from state changes and cancel the pending message."""
+    unsub()
+    coalescer.async_cancel()
 
 
 @callback
@@ -399,35 +519,118 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_interval"): vol.All(
+            vol.Coerce(float), vol.Range(min=0.05, max=1)
+        ),
+        vol.Optional("resumable", default=False): bool,
+        vol.Inclusive("replay_id", "resume"): str,
+        vol.Inclusive("since", "resume"): cv.positive_int,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    Resumable subscriptions add the sequence number of each state change to
+    the messages. They can be resumed with the replay_id and the last seen
+    sequence number as since, which sends only the missed state changes
+    instead of all states when the replay log still holds them.
+    """
+    msg_id = msg["id"]
+    resumable = msg["resumable"] or "replay_id" in msg
+    if resumable and "coalesce_interval" in msg:
+        connection.send_error(
+            msg_id,
+            const.ERR_NOT_SUPPORTED,
+            "Resumable subscriptions cannot be coalesced",
+        )
+        return
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
+    coalescer: _CoalescedEntityChanges | None = None
+    replay_log: StateReplayLog | None = None
+    forward_entity_changes: Callable[[Event[EventStateChangedData]], None]
+    if resumable:
+        replay_log = async_get_state_replay_log(hass)
+        forward_entity_changes = partial(
+            _forward_resumable_entity_changes,
+            replay_log,
+            connection.send_message,
+            entity_filter,
+            connection.user,
+            message_id_as_bytes,
+        )
+    elif coalesce_interval := msg.get("coalesce_interval"):
+        coalescer = _CoalescedEntityChanges(
+            hass,
+            connection.send_message,
+            entity_filter,
+            connection.user,
+            message_id_as_bytes,
+            coalesce_interval,
+        )
+        forward_entity_changes = coalescer.async_add_change
+    else:
+        forward_entity_changes = partial(
             _forward_entity_changes,
             connection.send_message,
-            entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
-    )
-    connection.send_result(msg_id)
+        )
+    if entity_ids:
+        # Let the event bus route the state changes by entity_id
+        unsub = hass.bus.async_listen_keyed(
+            EVENT_STATE_CHANGED, entity_ids, forward_entity_changes
+        )
+    else:
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, forward_entity_changes)
+    if coalescer:
+        connection.subscriptions[msg_id] = partial(
+            _async_unsub_coalesced_entity_changes, unsub, coalescer
+        )
+    else:
+        connection.subscriptions[msg_id] = unsub
+
+    if replay_log is None:
+        connection.send_result(msg_id)
+    elif (
+        "replay_id" in msg
+        and (
+            missed_events := replay_log.async_events_since(
+                msg["replay_id"], msg["since"]
+            )
+        )
+        is not None
+    ):
+        connection.send_result(
+            msg_id, {"replay_id": replay_log.id, "seq": msg["since"], "resumed": True}
+        )
+        for seq, event in missed_events:
+            if not entity_ids or event.data["entity_id"] in entity_ids:
+                _forward_entity_changes(
+                    connection.send_message,
+                    entity_filter,
+                    connection.user,
+                    message_id_as_bytes,
+                    event,
+                    seq,
+                )
+        return
+    else:
+        connection.send_result(
+            msg_id,
+            {"replay_id": replay_log.id, "seq": replay_log.last_seq, "resumed": False},
+        )
 
+    states = _async_get_allowed_states(hass, connection)
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -439,6 +642,12 @@ def handle_subscribe_entities(
                 if (not entity_ids or state.entity_id in entity_ids)
                 and (not entity_filter or entity_filter(state.entity_id))
             ]
+        elif type(states) is StatesSnapshot:
+            # Fast path when not filtering, reuse the JSON of the domains
+            # which did not change
+            serialized_states = [
+                domain.as_compressed_state_json for domain in states.domains.values()
+            ]
         else:
             # Fast path when not filtering
             serialized_states = [state.as_compressed_state_json for state in states]
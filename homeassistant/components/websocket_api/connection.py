@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Awaitable, Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -51,6 +51,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_drain",
     )
 
     def __init__(
@@ -75,6 +76,7 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._drain: Callable[[], Awaitable[None]] | None = None
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -86,6 +88,20 @@ class ActiveConnection:
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
 
+    @callback
+    def async_set_drain(self, drain: Callable[[], Awaitable[None]]) -> None:
+        """Set how to wait for the queued messages to be sent."""
+        self._drain = drain
+
+    async def async_drain(self) -> None:
+        """Wait until the messages queued so far have been sent to the client.
+
+        Used to avoid queuing more messages than the client can keep up with
+        when sending a large response as many messages.
+        """
+        if self._drain is not None:
+            await self._drain()
+
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
         description = self.user.name or ""
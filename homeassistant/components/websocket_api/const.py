@@ -58,3 +58,6 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+
+# Number of state changes kept to resume subscribe_entities subscriptions
+STATE_REPLAY_LOG_SIZE: Final = 4096
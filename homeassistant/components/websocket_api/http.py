@@ -84,6 +84,7 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drained_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -107,6 +108,8 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Resolved once the writer has sent all queued messages
+        self._drained_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -145,6 +148,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if not message_queue:
+                    self._release_drained_future()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -176,6 +180,28 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drained_future()
+
+    @callback
+    def _release_drained_future(self) -> None:
+        """Release the tasks waiting for the queued messages to be sent."""
+        if (drained_future := self._drained_future) is not None:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
+    async def _async_wait_drained(self) -> None:
+        """Wait until the writer has sent the messages queued so far."""
+        if (
+            self._closing
+            or not self._message_queue
+            or self._writer_task is None
+            or self._writer_task.done()
+        ):
+            return
+        if self._drained_future is None:
+            self._drained_future = self._loop.create_future()
+        await asyncio.shield(self._drained_future)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -403,6 +429,7 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.async_set_drain(self._async_wait_drained)
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
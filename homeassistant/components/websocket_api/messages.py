@@ -6,6 +6,7 @@ from functools import lru_cache
 import logging
 from typing import Any, Final
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.const import (
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -142,7 +143,9 @@ def _partial_cached_event_message(event: Event) -> bytes:
 
 
 def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    seq: int | None = None,
 ) -> bytes:
     """Return an event message.
 
@@ -151,12 +154,26 @@ def cached_state_diff_message(
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+
+    If seq is passed, the sequence number of the state change
+    in the replay log is added to the message.
     """
+    if seq is None:
+        return b"".join(
+            (
+                _partial_cached_state_diff_message(event)[:-1],
+                b',"id":',
+                message_id_as_bytes,
+                b"}",
+            )
+        )
     return b"".join(
         (
             _partial_cached_state_diff_message(event)[:-1],
             b',"id":',
             message_id_as_bytes,
+            b',"seq":',
+            str(seq).encode(),
             b"}",
         )
     )
@@ -199,6 +216,89 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes, changes: dict[str, tuple[State | None, State | None]]
+) -> bytes:
+    """Return an event message with the state changes of multiple entities.
+
+    changes maps entity_ids to the state before the first change and the
+    state after the last change since the previous message, so each entity
+    gets a single diff no matter how often it changed in between.
+
+    The diffs are serialized once for each pair of states since the
+    subscriptions of all connections usually see the same changes.
+    """
+    added: list[bytes] = []
+    changed: list[bytes] = []
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            # Entities that were added and removed again were never sent
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            try:
+                added.append(new_state.as_compressed_state_json)
+            except (ValueError, TypeError):
+                _LOGGER.error("Unable to serialize %s to JSON", entity_id)
+        elif (diff := _cached_state_diff_json(old_state, new_state)) is not None:
+            changed.append(diff)
+    event: list[bytes] = []
+    if added:
+        event.append(
+            b'"' + ENTITY_EVENT_ADD.encode() + b'":{' + b",".join(added) + b"}"
+        )
+    if changed:
+        event.append(
+            b'"' + ENTITY_EVENT_CHANGE.encode() + b'":{' + b",".join(changed) + b"}"
+        )
+    if removed:
+        event.append(b'"' + ENTITY_EVENT_REMOVE.encode() + b'":' + json_bytes(removed))
+    return b"".join(
+        (
+            b'{"id":',
+            message_id_as_bytes,
+            b',"type":"event","event":{',
+            b",".join(event),
+            b"}}",
+        )
+    )
+
+
+# The serialized diffs are keyed by the entity_id and the last_updated
+# timestamps of both states instead of the states themselves so the cache
+# does not keep states alive that were removed or replaced long ago
+STATE_DIFF_JSON_CACHE_SIZE: Final = 4096
+_STATE_DIFF_JSON_CACHE: LRU[tuple[str, float, float], bytes | None] = LRU(
+    STATE_DIFF_JSON_CACHE_SIZE
+)
+
+
+def _cached_state_diff_json(old_state: State, new_state: State) -> bytes | None:
+    """Serialize the diff between two states as a JSON key value pair."""
+    key = (
+        new_state.entity_id,
+        old_state.last_updated_timestamp,
+        new_state.last_updated_timestamp,
+    )
+    try:
+        return _STATE_DIFF_JSON_CACHE[key]
+    except KeyError:
+        pass
+    diff_json = _message_to_json_bytes_or_none(
+        {new_state.entity_id: _state_diff(old_state, new_state)}
+    )
+    _STATE_DIFF_JSON_CACHE[key] = diff = None if diff_json is None else diff_json[1:-1]
+    return diff
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of the same entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -235,7 +335,7 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -0,0 +1,72 @@
+"""State change replay log for resumable websocket subscriptions."""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
+
+from .const import DOMAIN, STATE_REPLAY_LOG_SIZE
+
+DATA_STATE_REPLAY_LOG: HassKey[StateReplayLog] = HassKey(f"{DOMAIN}.state_replay_log")
+
+
+class StateReplayLog:
+    """Keep the most recent state changes with a sequence number.
+
+    Sequence numbers are only meaningful together with the id of the log,
+    which changes every time Home Assistant starts.
+    """
+
+    __slots__ = ("_events", "id", "last_seq")
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the replay log."""
+        self.id = ulid_now()
+        self.last_seq = 0
+        self._events: deque[Event[EventStateChangedData]] = deque(maxlen=maxlen)
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the log."""
+        self.last_seq += 1
+        self._events.append(event)
+
+    @callback
+    def async_events_since(
+        self, log_id: str, seq: int
+    ) -> list[tuple[int, Event[EventStateChangedData]]] | None:
+        """Return the state changes after seq with their sequence numbers.
+
+        Returns None if the log does not hold all the state changes after seq.
+        """
+        first_missed_seq = seq + 1
+        first_seq = self.last_seq - len(self._events) + 1
+        if log_id != self.id or not first_seq <= first_missed_seq <= self.last_seq + 1:
+            return None
+        return list(
+            enumerate(
+                islice(self._events, first_missed_seq - first_seq, None),
+                first_missed_seq,
+            )
+        )
+
+
+@callback
+def async_get_state_replay_log(hass: HomeAssistant) -> StateReplayLog:
+    """Return the state replay log, creating it on first use.
+
+    The log has to listen for state changes before any subscription that
+    uses it, so that its sequence number is already updated when the
+    subscription sees a state change.
+    """
+    if (replay_log := hass.data.get(DATA_STATE_REPLAY_LOG)) is None:
+        replay_log = hass.data[DATA_STATE_REPLAY_LOG] = StateReplayLog(
+            STATE_REPLAY_LOG_SIZE
+        )
+        hass.bus.async_listen(EVENT_STATE_CHANGED, replay_log.async_add)
+    return replay_log
@@ -1748,6 +1748,7 @@ class ConfigEntryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
             hass,
             STORAGE_VERSION,
             STORAGE_KEY,
+            journal=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
 
@@ -13,6 +13,7 @@ from collections.abc import (
     Collection,
     Coroutine,
     Iterable,
+    Iterator,
     KeysView,
     Mapping,
     ValuesView,
@@ -1460,7 +1461,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1475,10 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        # Listeners by event type and entity_id or domain
+        self._keyed_listeners: dict[
+            EventType[Any] | str, defaultdict[str, list[_FilterableJobType[Any]]]
+        ] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1484,7 +1495,15 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            keyed_jobs = {
+                filterable_job
+                for filterable_jobs in keyed_listeners.values()
+                for filterable_job in filterable_jobs
+            }
+            listeners[event_type] = listeners.get(event_type, 0) + len(keyed_jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1555,6 +1574,19 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
+        if (
+            (keyed_listeners := self._keyed_listeners.get(event_type)) is not None
+            and event_data is not None
+            and type(entity_id := event_data.get("entity_id")) is str
+        ):
+            # Listeners keyed by entity_id or domain are looked up
+            # directly instead of running a filter for each of them
+            listeners = (
+                listeners
+                + keyed_listeners.get(entity_id, EMPTY_LIST)
+                + keyed_listeners.get(entity_id.partition(".")[0], EMPTY_LIST)
+            )
+
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
@@ -1654,6 +1686,73 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type by entity_id or domain.
+
+        keys are lower case entity_ids and domains. The listener only runs
+        for events with an entity_id in the event data that is one of the
+        entity_ids or in one of the domains. The event bus looks up the
+        listeners for the entity_id and domain of each event, so firing an
+        event does not get slower with the number of keyed listeners. keys
+        should not contain both an entity_id and its domain, otherwise the
+        listener runs twice for the same event.
+
+        An optional event_filter, which must be a callable decorated with
+        @callback that returns a boolean value, determines if the
+        listener callable should run for a matching event.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require an event type")
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        key_tuple = (keys,) if isinstance(keys, str) else tuple(keys)
+        filterable_job = (
+            HassJob(listener, f"listen {event_type} {key_tuple}"),
+            event_filter,
+        )
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is None:
+            keyed_listeners = self._keyed_listeners[event_type] = defaultdict(list)
+        for key in key_tuple:
+            keyed_listeners[key].append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, key_tuple, filterable_job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                keyed_listeners[key].remove(filterable_job)
+                if not keyed_listeners[key]:
+                    del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+        except (KeyError, ValueError):
+            # KeyError is key event_type or key listener did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2063,11 +2162,78 @@ class States(UserDict[str, State]):
             return ()
         return self._domain_index[key].values()
 
+    def domains(self) -> KeysView[str]:
+        """Get all domains which have or had states."""
+        return self._domain_index.keys()
+
+
+class DomainStatesSnapshot:
+    """Immutable snapshot of the states of a domain."""
+
+    __slots__ = ("domain", "version", "states", "_cache")
+
+    def __init__(self, domain: str, version: int, states: tuple[State, ...]) -> None:
+        """Initialize the snapshot."""
+        self.domain = domain
+        self.version = version
+        self.states = states
+        self._cache: dict[str, Any] = {}
+
+    @under_cached_property
+    def as_dict_json(self) -> bytes:
+        """Return the comma separated JSON strings of the states."""
+        return b",".join(state.as_dict_json for state in self.states)
+
+    @under_cached_property
+    def as_compressed_state_json(self) -> bytes:
+        """Return the comma separated compressed JSON key value pairs of the states."""
+        return b",".join(state.as_compressed_state_json for state in self.states)
+
+
+class StatesSnapshot:
+    """Immutable snapshot of the states of all domains.
+
+    Snapshots share the snapshots of the domains which did not change
+    between them.
+    """
+
+    __slots__ = ("version", "domains")
+
+    def __init__(self, version: int, domains: dict[str, DomainStatesSnapshot]) -> None:
+        """Initialize the snapshot."""
+        self.version = version
+        self.domains = domains
+
+    def __iter__(self) -> Iterator[State]:
+        """Iterate over all states grouped by domain."""
+        for domain in self.domains.values():
+            yield from domain.states
+
+    def __len__(self) -> int:
+        """Return the number of states."""
+        return sum(len(domain.states) for domain in self.domains.values())
+
+    def domain_states(self, domain: str) -> tuple[State, ...]:
+        """Return the states of a domain."""
+        if (domain_snapshot := self.domains.get(domain)) is None:
+            return ()
+        return domain_snapshot.states
+
 
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_version",
+        "_domain_versions",
+        "_snapshot",
+        "_domain_snapshots",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2244,12 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Incremented for every state that is changed or removed, the
+        # version of a domain is the version its last change was made at
+        self._version = 0
+        self._domain_versions: dict[str, int] = {}
+        self._snapshot: StatesSnapshot | None = None
+        self._domain_snapshots: dict[str, DomainStatesSnapshot] = {}
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2129,6 +2301,56 @@ class StateMachine:
             self._loop, self.async_all, domain_filter
         ).result()
 
+    @callback
+    def async_version(self, domain_filter: str | None = None) -> int:
+        """Return the version of the states or the states of a domain.
+
+        The version changes whenever a state is changed or removed, it
+        does not change when a state is only reported.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is None:
+            return self._version
+        return self._domain_versions.get(domain_filter, 0)
+
+    @callback
+    def async_domain_snapshot(self, domain: str) -> DomainStatesSnapshot:
+        """Return an immutable snapshot of the states of a domain.
+
+        The snapshot is reused until a state of the domain changes.
+
+        This method must be run in the event loop.
+        """
+        version = self._domain_versions.get(domain, 0)
+        if (
+            snapshot := self._domain_snapshots.get(domain)
+        ) is None or snapshot.version != version:
+            snapshot = self._domain_snapshots[domain] = DomainStatesSnapshot(
+                domain, version, tuple(self._states.domain_states(domain))
+            )
+        return snapshot
+
+    @callback
+    def async_snapshot(self) -> StatesSnapshot:
+        """Return an immutable snapshot of all states.
+
+        The snapshot is reused until a state changes, only the snapshots
+        of the domains which changed are rebuilt.
+
+        This method must be run in the event loop.
+        """
+        if (
+            snapshot := self._snapshot
+        ) is not None and snapshot.version == self._version:
+            return snapshot
+        domains: dict[str, DomainStatesSnapshot] = {}
+        for domain in self._states.domains():
+            if (domain_snapshot := self.async_domain_snapshot(domain)).states:
+                domains[domain] = domain_snapshot
+        self._snapshot = StatesSnapshot(self._version, domains)
+        return self._snapshot
+
     @callback
     def async_all(
         self, domain_filter: str | Iterable[str] | None = None
@@ -2190,6 +2412,8 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._version += 1
+        self._domain_versions[old_state.domain] = self._version
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2376,6 +2600,8 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        self._version += 1
+        self._domain_versions[state.domain] = self._version
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
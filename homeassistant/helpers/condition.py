@@ -65,6 +65,7 @@ from .template import Template, render_complex
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -96,6 +97,13 @@ INPUT_ENTITY_ID = re.compile(
     r"^input_(?:select|text|number|boolean|datetime)\.(?!.+__)(?!_)[\da-z_]+(?<!_)$"
 )
 
+# Relative cost of evaluating compiled conditions, the cheapest conditions
+# of a group are evaluated first
+_COMPILED_STATE_COST = 1
+_COMPILED_STATE_FOR_COST = 2
+_COMPILED_NUMERIC_STATE_COST = 2
+_COMPILED_TIME_COST = 3
+
 
 class ConditionProtocol(Protocol):
     """Define the format of device_condition modules.
@@ -117,6 +125,7 @@ class ConditionProtocol(Protocol):
 
 
 type ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
+type _CompiledCheckerType = Callable[[HomeAssistant], bool]
 
 
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
@@ -1077,20 +1086,210 @@ async def async_validate_conditions_config(
     return [await async_validate_condition_config(hass, cond) for cond in conditions]
 
 
+def _compile_condition(
+    config: ConfigType | Template,
+) -> tuple[int, _CompiledCheckerType | None] | None:
+    """Compile a validated condition into a check which does not trace.
+
+    Returns the cost of the check and the check, which is None if the
+    condition is disabled, or None if the condition can't be compiled.
+    """
+    if not isinstance(config, dict):
+        return None
+    if CONF_ENABLED in config:
+        if isinstance(enabled := config[CONF_ENABLED], Template):
+            return None
+        if not enabled:
+            return (0, None)
+    condition = config[CONF_CONDITION]
+    if condition in ("and", "or", "not"):
+        return _compile_group(condition, config["conditions"])
+    if condition == "state":
+        return _compile_state(config)
+    if condition == "numeric_state":
+        return _compile_numeric_state(config)
+    if condition == "time":
+        return _compile_time(config)
+    return None
+
+
+def _compile_group(
+    condition: str, configs: list[ConfigType | Template]
+) -> tuple[int, _CompiledCheckerType | None] | None:
+    """Compile an and, or or not condition.
+
+    Nested groups of the same kind are flattened and the checks are
+    ordered by their cost.
+    """
+    compiled: list[tuple[int, _CompiledCheckerType]] = []
+    pending = list(reversed(configs))
+    while pending:
+        config = pending.pop()
+        if (
+            condition != "not"
+            and isinstance(config, dict)
+            and config.get(CONF_CONDITION) == condition
+            and config.get(CONF_ENABLED, True) is True
+        ):
+            pending.extend(reversed(config["conditions"]))
+            continue
+        if (compiled_check := _compile_condition(config)) is None:
+            return None
+        if compiled_check[1] is not None:
+            compiled.append(compiled_check)  # type: ignore[arg-type]
+    compiled.sort(key=lambda compiled_check: compiled_check[0])
+    checks = tuple(check for _, check in compiled)
+
+    if condition == "and":
+
+        def compiled_and(hass: HomeAssistant) -> bool:
+            return all(check(hass) for check in checks)
+
+        return (sum(cost for cost, _ in compiled), compiled_and)
+
+    if condition == "or":
+
+        def compiled_or(hass: HomeAssistant) -> bool:
+            return any(check(hass) for check in checks)
+
+        return (sum(cost for cost, _ in compiled), compiled_or)
+
+    def compiled_not(hass: HomeAssistant) -> bool:
+        return not any(check(hass) for check in checks)
+
+    return (sum(cost for cost, _ in compiled), compiled_not)
+
+
+def _compile_state(
+    config: ConfigType,
+) -> tuple[int, _CompiledCheckerType | None] | None:
+    """Compile a state condition."""
+    for_period = config.get(CONF_FOR)
+    if for_period is not None and not isinstance(for_period, timedelta):
+        return None
+    req_states = config.get(CONF_STATE, [])
+    if not isinstance(req_states, list):
+        req_states = [req_states]
+    # States of other entities are read when checking
+    if any(
+        isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None
+        for req_state in req_states
+    ):
+        return None
+    wanted_states = tuple(req_states)
+    entity_ids = tuple(config.get(CONF_ENTITY_ID, []))
+    attribute = config.get(CONF_ATTRIBUTE)
+    match_all = config.get(CONF_MATCH, ENTITY_MATCH_ALL) == ENTITY_MATCH_ALL
+
+    def state_matches(hass: HomeAssistant, entity_id: str) -> bool:
+        if (entity := hass.states.get(entity_id)) is None:
+            raise ConditionErrorMessage("state", f"unknown entity {entity_id}")
+        if attribute is None:
+            value = entity.state
+        elif attribute not in entity.attributes:
+            return False
+        else:
+            value = entity.attributes[attribute]
+        if value not in wanted_states:
+            return False
+        return for_period is None or (
+            dt_util.utcnow() - for_period > entity.last_changed
+        )
+
+    def compiled_state(hass: HomeAssistant) -> bool:
+        result = match_all
+        for entity_id in entity_ids:
+            if state_matches(hass, entity_id):
+                result = True
+            elif match_all:
+                return False
+        return result
+
+    cost = _COMPILED_STATE_COST if for_period is None else _COMPILED_STATE_FOR_COST
+    return (cost * len(entity_ids), compiled_state)
+
+
+def _compile_numeric_state(
+    config: ConfigType,
+) -> tuple[int, _CompiledCheckerType | None] | None:
+    """Compile a numeric state condition."""
+    if config.get(CONF_VALUE_TEMPLATE) is not None:
+        return None
+    entity_ids = tuple(config.get(CONF_ENTITY_ID, []))
+    attribute = config.get(CONF_ATTRIBUTE)
+    below = config.get(CONF_BELOW)
+    above = config.get(CONF_ABOVE)
+
+    def compiled_numeric_state(hass: HomeAssistant) -> bool:
+        for entity_id in entity_ids:
+            if not async_numeric_state(
+                hass, entity_id, below, above, attribute=attribute
+            ):
+                return False
+        return True
+
+    return (_COMPILED_NUMERIC_STATE_COST * len(entity_ids), compiled_numeric_state)
+
+
+def _compile_time(
+    config: ConfigType,
+) -> tuple[int, _CompiledCheckerType | None] | None:
+    """Compile a time condition."""
+    before = config.get(CONF_BEFORE)
+    after = config.get(CONF_AFTER)
+    weekday = config.get(CONF_WEEKDAY)
+
+    def compiled_time(hass: HomeAssistant) -> bool:
+        return time(hass, before, after, weekday)
+
+    return (_COMPILED_TIME_COST, compiled_time)
+
+
+@callback
+def async_compile_conditions(
+    condition_configs: list[ConfigType],
+) -> Callable[[HomeAssistant], bool] | None:
+    """Compile validated conditions into an evaluation plan which ANDs them.
+
+    The plan does not trace, resolves the configuration up front and
+    checks the cheapest conditions first. Evaluating the plan raises
+    ConditionError when a condition can't be checked, the traced
+    conditions should then be evaluated to report why.
+
+    Returns None if the conditions contain a condition which can't be
+    compiled, only state, numeric_state without value_template, time and
+    groups of those are supported.
+    """
+    if (compiled := _compile_group("and", condition_configs)) is None:
+        return None
+    return compiled[1]
+
+
 async def async_conditions_from_config(
     hass: HomeAssistant,
     condition_configs: list[ConfigType],
     logger: logging.Logger,
     name: str,
 ) -> Callable[[TemplateVarsType], bool]:
-    """AND all conditions."""
+    """AND all conditions.
+
+    The conditions are evaluated with a compiled plan when they support
+    it and no trace is being recorded.
+    """
     checks: list[ConditionCheckerType] = [
         await async_from_config(hass, condition_config)
         for condition_config in condition_configs
     ]
+    compiled = async_compile_conditions(condition_configs)
 
     def check_conditions(variables: TemplateVarsType = None) -> bool:
         """AND all conditions."""
+        if compiled is not None and trace_cv.get() is None:
+            try:
+                return compiled(hass)
+            except ConditionError:
+                # Evaluate the traced conditions to report the errors
+                pass
         errors: list[ConditionErrorIndex] = []
         for index, check in enumerate(checks):
             try:
@@ -72,6 +72,10 @@ _TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]
 _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventEntityRegistryUpdatedData]
 ] = HassKey("track_entity_registry_updated_data")
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
+_ENTITY_ID_EVENT_BATCH: HassKey[_EntityIdEventBatch] = HassKey("entity_id_event_batch")
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
@@ -89,6 +93,10 @@ _LOGGER = logging.getLogger(__name__)
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
+# How long to collect state changes before re-rendering the templates
+# they affect, 0 re-renders them in the next iteration of the event loop
+TEMPLATE_RENDER_BATCH_WINDOW = 0.0
+
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 
 
@@ -331,6 +339,14 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action, job_type)
 
 
+@dataclass(slots=True)
+class _EntityIdEventBatch:
+    """State changes fired in the same iteration of the event loop."""
+
+    pending: int = 0
+    dispatching: bool = False
+
+
 @callback
 def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
     hass: HomeAssistant,
@@ -338,7 +354,40 @@ def _async_dispatch_entity_id_event_soon[_StateEventDataT: EventStateEventData](
     event: Event[_StateEventDataT],
 ) -> None:
     """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
+    batch = hass.data.get(_ENTITY_ID_EVENT_BATCH)
+    if batch is None or batch.dispatching:
+        batch = hass.data[_ENTITY_ID_EVENT_BATCH] = _EntityIdEventBatch()
+    batch.pending += 1
+    hass.loop.call_soon(
+        _async_dispatch_batched_entity_id_event, hass, callbacks, event, batch
+    )
+
+
+@callback
+def _async_dispatch_batched_entity_id_event[_StateEventDataT: EventStateEventData](
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    event: Event[_StateEventDataT],
+    batch: _EntityIdEventBatch,
+) -> None:
+    """Dispatch an event of a batch to listeners.
+
+    Template trackers affected by the events of the batch are re-rendered
+    once the last event of the batch has been dispatched. State changes
+    fired meanwhile belong to the next batch.
+    """
+    batch.dispatching = True
+    batch.pending -= 1
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        _async_dispatch_entity_id_event(hass, callbacks, event)
+        return
+    scheduler.dispatching = True
+    try:
+        _async_dispatch_entity_id_event(hass, callbacks, event)
+    finally:
+        scheduler.dispatching = False
+        if not batch.pending:
+            scheduler.async_dispatched()
 
 
 @callback
@@ -972,6 +1021,140 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Render cost statistics of a tracked template."""
+
+    template: Template
+    renders: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+class _TemplateRenderScheduler:
+    """Batch re-renders of tracked templates triggered by state changes.
+
+    The trackers affected by the state changes fired in the same iteration
+    of the event loop are re-rendered once the last of them has been
+    dispatched, so a tracker re-renders each of its templates at most once
+    per batch, no matter how many of its entities changed. State changes
+    written by the listeners of the trackers belong to the next batch.
+    With a batch window the trackers are re-rendered once the window has
+    passed instead.
+
+    The render cost of each template is kept while its tracker exists.
+    """
+
+    __slots__ = (
+        "_hass",
+        "_pending",
+        "_rendering",
+        "_handle",
+        "dispatching",
+        "window",
+        "render_stats",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._pending: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._rendering: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self.dispatching = False
+        self.window = TEMPLATE_RENDER_BATCH_WINDOW
+        self.render_stats: dict[
+            TrackTemplateResultInfo, dict[Template, TemplateRenderStats]
+        ] = {}
+
+    @callback
+    def async_schedule(
+        self,
+        track_info: TrackTemplateResultInfo,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Schedule a re-render of a tracker for a state change."""
+        if not self.dispatching and not self.window:
+            track_info.async_refresh_events([event])
+            return
+        if (events := self._pending.get(track_info)) is None:
+            self._pending[track_info] = [event]
+        else:
+            events.append(event)
+        if self.window and self._handle is None:
+            self._handle = self._hass.loop.call_later(self.window, self.async_render)
+
+    @callback
+    def async_dispatched(self) -> None:
+        """Handle a batch of state changes being dispatched."""
+        self.dispatching = False
+        if not self.window:
+            self.async_render()
+
+    @callback
+    def async_cancel(self, track_info: TrackTemplateResultInfo) -> None:
+        """Cancel a scheduled re-render of a removed tracker."""
+        self._pending.pop(track_info, None)
+        self._rendering.pop(track_info, None)
+        self.render_stats.pop(track_info, None)
+
+    @callback
+    def async_record_render(
+        self, track_info: TrackTemplateResultInfo, template: Template, elapsed: float
+    ) -> None:
+        """Record the time it took to render a template of a tracker."""
+        if (tracker_stats := self.render_stats.get(track_info)) is None:
+            tracker_stats = self.render_stats[track_info] = {}
+        if (stats := tracker_stats.get(template)) is None:
+            stats = tracker_stats[template] = TemplateRenderStats(template)
+        stats.renders += 1
+        stats.total_time += elapsed
+        stats.max_time = max(stats.max_time, elapsed)
+
+    @callback
+    def async_render(self) -> None:
+        """Re-render the trackers with pending state changes."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._pending:
+            return
+        rendering = self._rendering = self._pending
+        self._pending = {}
+        # Trackers may be removed by the listeners of those rendered before
+        for track_info in list(rendering):
+            if (events := rendering.pop(track_info, None)) is not None:
+                track_info.async_refresh_events(events)
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
+@callback
+def async_get_template_render_stats(hass: HomeAssistant) -> list[TemplateRenderStats]:
+    """Return the render cost statistics of the tracked templates."""
+    return [
+        stats
+        for tracker_stats in _async_get_template_render_scheduler(
+            hass
+        ).render_stats.values()
+        for stats in tracker_stats.values()
+    ]
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -1003,6 +1186,7 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._scheduler = _async_get_template_render_scheduler(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1024,9 +1208,13 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
+            start = time.perf_counter()
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._scheduler.async_record_render(
+                self, template, time.perf_counter() - start
+            )
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -1045,9 +1233,13 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
+            start = time.perf_counter()
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict, log_fn=log_fn
             )
+            self._scheduler.async_record_render(
+                self, template, time.perf_counter() - start
+            )
 
             if info.exception:
                 if not log_fn:
@@ -1060,7 +1252,9 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_schedule_refresh,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1117,6 +1311,7 @@ class TrackTemplateResultInfo:
         """Cancel the listener."""
         assert self._track_state_changes
         self._track_state_changes.async_remove()
+        self._scheduler.async_cancel(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -1126,6 +1321,19 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a refresh for a state change."""
+        self._scheduler.async_schedule(self, event)
+
+    @callback
+    def async_refresh_events(self, events: list[Event[EventStateChangedData]]) -> None:
+        """Refresh the templates affected by a batch of state changes."""
+        if len(events) == 1:
+            self._refresh(events[0])
+        else:
+            self._refresh(events[-1], batched_events=events)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1170,9 +1378,11 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        start = time.perf_counter()
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._scheduler.async_record_render(self, template, time.perf_counter() - start)
 
         try:
             result: str | TemplateError = info.result()
@@ -1216,12 +1426,48 @@ class TrackTemplateResultInfo:
 
         return True
 
+    def _render_batched_template_if_ready(
+        self,
+        track_template_: TrackTemplate,
+        now: float,
+        batched_events: list[Event[EventStateChangedData]],
+        order: dict[Template, int],
+    ) -> bool | TrackTemplateResult:
+        """Re-render a template for a batch of state changes if needed.
+
+        The template is re-rendered once for the last state change which
+        is not rate limited, or the last one which triggers a re-render
+        if all of them are.
+        """
+        info = self._info[track_template_.template]
+        found: int | None = None
+        for index in range(len(batched_events) - 1, -1, -1):
+            event = batched_events[index]
+            if not _event_triggers_rerender(event, info):
+                continue
+            if found is None:
+                found = index
+            if _rate_limit_for_event(event, info, track_template_) is None:
+                found = index
+                break
+
+        if found is None:
+            return False
+
+        update = self._render_template_if_ready(
+            track_template_, now, batched_events[found]
+        )
+        if isinstance(update, TrackTemplateResult):
+            order[track_template_.template] = found
+        return update
+
     @callback
     def _refresh(
         self,
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        batched_events: list[Event[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1234,10 +1480,14 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        batched_events is set to all state changes that caused the refresh
+        when it was scheduled for more than one, the event is the last one.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired_timestamp if not replayed and event else time.time()
+        order: dict[Template, int] = {}
 
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
@@ -1246,7 +1496,12 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            if batched_events is None:
+                update = self._render_template_if_ready(super_template, now, event)
+            else:
+                update = self._render_batched_template_if_ready(
+                    super_template, now, batched_events, order
+                )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1269,6 +1524,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                batched_events = None
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1277,7 +1533,12 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                if batched_events is None:
+                    update = self._render_template_if_ready(track_template_, now, event)
+                else:
+                    update = self._render_batched_template_if_ready(
+                        track_template_, now, batched_events, order
+                    )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1307,6 +1568,11 @@ class TrackTemplateResultInfo:
         if not updates:
             return
 
+        if len(order) > 1:
+            # Hand the updates of a batch over in the order of the state
+            # changes that caused them, as if they were processed one by one
+            updates.sort(key=lambda update: order[update.template])
+
         for track_result in updates:
             self._last_result[track_result.template] = track_result.result
 
@@ -26,11 +26,15 @@ DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
+STORAGE_KEY_CHANGES = "core.restore_state_changes"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between compacting the changed states into a full dump
+STATE_COMPACT_INTERVAL = timedelta(hours=6)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -121,8 +125,18 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.changes_store = Store[dict[str, Any]](
+            hass, STORAGE_VERSION, STORAGE_KEY_CHANGES, encoder=JSONEncoder
+        )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The state and extra data of each entity as of the last dump
+        self._dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        # Stored states changed or removed since the last full dump
+        self._changed: dict[str, dict[str, Any]] = {}
+        self._removed: dict[str, datetime] = {}
+        self._changes_saved = False
+        self._last_full_dump: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -154,6 +168,39 @@ class RestoreStateData:
             }
             _LOGGER.debug("Created cache with %s", list(self.last_states))
 
+        try:
+            changes = await self.changes_store.async_load()
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error loading changed states", exc_info=exc)
+            changes = None
+
+        if changes is None:
+            return
+
+        self._changes_saved = True
+        # A change only applies if it is newer than the full dump since
+        # we may have stopped between writing the full dump and removing
+        # the changes it includes.
+        last_states = self.last_states
+        for item in changes["states"]:
+            entity_id = item["state"]["entity_id"]
+            if not valid_entity_id(entity_id):
+                continue
+            stored_state = StoredState.from_dict(item)
+            if (
+                current := last_states.get(entity_id)
+            ) is None or current.last_seen <= stored_state.last_seen:
+                last_states[entity_id] = stored_state
+        for entity_id, removed in changes["removed"].items():
+            removed_at = dt_util.parse_datetime(removed)
+            if (
+                (current := last_states.get(entity_id)) is not None
+                and removed_at is not None
+                and current.last_seen <= removed_at
+            ):
+                del last_states[entity_id]
+        _LOGGER.debug("Applied %s changed states", len(changes["states"]))
+
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
         """Get the set of states which should be stored.
@@ -201,15 +248,87 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+        dumped: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        stored_states: list[dict[str, Any]] = []
+        self._last_full_dump = dt_util.utcnow()
+        for stored_state in self.async_get_stored_states():
+            as_dict = stored_state.as_dict()
+            dumped[stored_state.state.entity_id] = (
+                stored_state.state,
+                as_dict["extra_data"],
             )
+            stored_states.append(as_dict)
+        try:
+            await self.store.async_save(stored_states)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self._dumped = dumped
+        self._changed.clear()
+        self._removed.clear()
+        if self._changes_saved:
+            self._changes_saved = False
+            await self.changes_store.async_remove()
+
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since the last dump to storage.
+
+        Only the states changed since the last full dump are written so the
+        amount of data written scales with the rate of change instead of the
+        number of entities. The changes are compacted into a full dump every
+        STATE_COMPACT_INTERVAL.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._last_full_dump is None
+            or now - self._last_full_dump >= STATE_COMPACT_INTERVAL
+        ):
+            await self.async_dump_states()
+            return
+
+        dumped = self._dumped
+        current: dict[str, tuple[State, dict[str, Any] | None]] = {}
+        changed = False
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            extra_data = (
+                stored_state.extra_data.as_dict() if stored_state.extra_data else None
+            )
+            current[state.entity_id] = (state, extra_data)
+            # State objects are replaced when the state changes so an
+            # identity check is enough, extra data is compared by value
+            if (
+                (previous := dumped.get(state.entity_id)) is None
+                or previous[0] is not state
+                or previous[1] != extra_data
+            ):
+                self._changed[state.entity_id] = {
+                    "state": state.json_fragment,
+                    "extra_data": extra_data,
+                    "last_seen": stored_state.last_seen,
+                }
+                self._removed.pop(state.entity_id, None)
+                changed = True
+        for entity_id in dumped.keys() - current.keys():
+            self._changed.pop(entity_id, None)
+            self._removed[entity_id] = now
+            changed = True
+
+        self._dumped = current
+        if not changed:
+            _LOGGER.debug("No changed states to dump")
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self._changed))
+        try:
+            await self.changes_store.async_save(
+                {"states": list(self._changed.values()), "removed": self._removed}
+            )
+        except HomeAssistantError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+        else:
+            self._changes_saved = True
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -218,6 +337,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_changed_states()
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -225,17 +347,17 @@ class RestoreStateData:
             _async_dump_states(), "RestoreStateData dump"
         )
 
-        # Dump states periodically
+        # Dump changed states periodically
         cancel_interval = async_track_time_interval(
             self.hass,
-            _async_dump_states,
+            _async_dump_changed_states,
             STATE_DUMP_INTERVAL,
             name="RestoreStateData dump states",
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping hass
         self.hass.bus.async_listen_once(
@@ -90,7 +90,7 @@ from . import condition, config_validation as cv, service, template
 from .condition import ConditionCheckerType, trace_condition_function
 from .dispatcher import async_dispatcher_connect, async_dispatcher_send_internal
 from .event import async_call_later, async_track_template
-from .script_variables import ScriptVariables
+from .script_variables import ScriptVariables, async_referenced_variables
 from .template import Template
 from .trace import (
     TraceElement,
@@ -1417,6 +1417,7 @@ class Script:
         script_mode: str = DEFAULT_SCRIPT_MODE,
         top_level: bool = True,
         variables: ScriptVariables | None = None,
+        render_referenced_variables: bool = False,
     ) -> None:
         """Initialize the script."""
         if not (all_scripts := hass.data.get(DATA_SCRIPTS)):
@@ -1463,6 +1464,12 @@ class Script:
         self._sequence_scripts: dict[int, Script] = {}
         self.variables = variables
         self._variables_dynamic = template.is_complex(variables)
+        # Only the variables the sequence can read are rendered on run
+        self._referenced_variables = (
+            async_referenced_variables(sequence)
+            if render_referenced_variables and variables is not None
+            else None
+        )
         self._copy_variables_on_run = copy_variables
 
     @property
@@ -1735,6 +1742,7 @@ class Script:
                     variables = self.variables.async_render(
                         self._hass,
                         run_variables,
+                        referenced=self._referenced_variables,
                     )
                 except exceptions.TemplateError as err:
                     self._log("Error rendering variables: %s", err, level=logging.ERROR)
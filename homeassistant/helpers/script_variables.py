@@ -2,13 +2,66 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
+from functools import lru_cache
 from typing import Any
 
+import jinja2
+from jinja2 import meta, nodes
+
+from homeassistant.const import CONF_RESPONSE_VARIABLE
 from homeassistant.core import HomeAssistant, callback
 
 from . import template
 
+_ANALYSIS_ENV = jinja2.Environment(extensions=["jinja2.ext.loopcontrols"])
+
+
+@lru_cache(maxsize=4096)
+def _template_variables(template_str: str) -> frozenset[str] | None:
+    """Return the names a template can read from its variables.
+
+    Returns None if the template includes or imports other templates
+    with its context since those can read any variable.
+    """
+    try:
+        ast = _ANALYSIS_ENV.parse(template_str)
+    except jinja2.TemplateSyntaxError:
+        return None
+    for node in ast.find_all((nodes.Include, nodes.Import, nodes.FromImport)):
+        if node.with_context:
+            return None
+    return frozenset(meta.find_undeclared_variables(ast))
+
+
+@callback
+def async_referenced_variables(config: Any) -> set[str] | None:
+    """Return the variable names the templates in a config can read.
+
+    Returns None if the variables can not be determined.
+    """
+    referenced: set[str] = set()
+    to_process = [config]
+    while to_process:
+        value = to_process.pop()
+        if isinstance(value, template.Template):
+            if value.is_static:
+                continue
+            if (names := _template_variables(value.template)) is None:
+                return None
+            referenced.update(names)
+        elif isinstance(value, Mapping):
+            # The stop action reads its response from a variable
+            if isinstance(response_variable := value.get(CONF_RESPONSE_VARIABLE), str):
+                referenced.add(response_variable)
+            to_process.extend(value.keys())
+            to_process.extend(value.values())
+        elif isinstance(value, (list, tuple, set)):
+            to_process.extend(value)
+        elif isinstance(value, ScriptVariables):
+            to_process.append(value.variables)
+    return referenced
+
 
 class ScriptVariables:
     """Class to hold and render script variables."""
@@ -17,6 +70,8 @@ class ScriptVariables:
         """Initialize script variables."""
         self.variables = variables
         self._has_template: bool | None = None
+        self._referenced: Collection[str] | None = None
+        self._to_render: set[str] | None = None
 
     @callback
     def async_render(
@@ -26,6 +81,7 @@ class ScriptVariables:
         *,
         render_as_defaults: bool = True,
         limited: bool = False,
+        referenced: Collection[str] | None = None,
     ) -> dict[str, Any]:
         """Render script variables.
 
@@ -33,6 +89,9 @@ class ScriptVariables:
 
         If `render_as_defaults` is True, the run variables will not be overridden.
 
+        If `referenced` is set, only the variables it contains and the
+        variables those depend on are rendered.
+
         """
         if self._has_template is None:
             self._has_template = template.is_complex(self.variables)
@@ -52,11 +111,14 @@ class ScriptVariables:
             return rendered_variables
 
         rendered_variables = {} if run_variables is None else dict(run_variables)
+        to_render = None if referenced is None else self._async_to_render(referenced)
 
         for key, value in self.variables.items():
             # We can skip if we're going to override this key with
-            # run variables anyway
-            if render_as_defaults and key in rendered_variables:
+            # run variables anyway or nothing reads it
+            if (render_as_defaults and key in rendered_variables) or (
+                to_render is not None and key not in to_render
+            ):
                 continue
 
             rendered_variables[key] = template.render_complex(
@@ -65,6 +127,32 @@ class ScriptVariables:
 
         return rendered_variables
 
+    @callback
+    def _async_to_render(self, referenced: Collection[str]) -> set[str] | None:
+        """Return the variables needed to render the referenced variables."""
+        if referenced is self._referenced:
+            return self._to_render
+
+        self._referenced = referenced
+        self._to_render = None
+        variables = self.variables
+        to_render: set[str] = set()
+        to_process = [key for key in referenced if key in variables]
+        while to_process:
+            if (key := to_process.pop()) in to_render:
+                continue
+            to_render.add(key)
+            if (names := async_referenced_variables(variables[key])) is None:
+                return None
+            to_process.extend(name for name in names if name in variables)
+
+        # Static variables are cheap to copy and are always included
+        to_render.update(
+            key for key, value in variables.items() if not template.is_complex(value)
+        )
+        self._to_render = to_render
+        return to_render
+
     def as_dict(self) -> dict[str, Any]:
         """Return dict version of this class."""
         return self.variables
@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -80,6 +81,24 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_INDEX: HassKey[_TargetIndex] = HassKey("service_target_index")
+
+# Maximum number of distinct device, area, floor and label targets to cache
+MAX_TARGET_INDEX_SIZE = 1024
+
+# Registry entry changes which can change what a target resolves to
+_ENTITY_TARGET_CHANGES = frozenset(
+    (
+        "area_id",
+        "device_id",
+        "disabled_by",
+        "entity_category",
+        "entity_id",
+        "hidden_by",
+        "labels",
+    )
+)
+_DEVICE_TARGET_CHANGES = frozenset(("area_id", "labels"))
 
 
 @cache
@@ -503,7 +522,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -527,6 +546,108 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    resolved = _async_get_target_index(hass).async_resolve(selector)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_get_target_index(hass: HomeAssistant) -> _TargetIndex:
+    """Return the target index, creating it if needed."""
+    if (target_index := hass.data.get(TARGET_INDEX)) is None:
+        target_index = hass.data[TARGET_INDEX] = _TargetIndex(hass)
+    return target_index
+
+
+class _TargetIndex:
+    """Index of device, area, floor and label targets to the entities they select.
+
+    Targets are resolved on first use and kept until a registry change
+    which can affect them.
+    """
+
+    __slots__ = ("_hass", "_resolved")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the target index."""
+        self._hass = hass
+        self._resolved: dict[
+            tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]],
+            SelectedEntities,
+        ] = {}
+        hass.bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=self._async_entity_registry_filter,
+        )
+        hass.bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            self._async_clear,
+            event_filter=self._async_device_registry_filter,
+        )
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_clear)
+
+    @staticmethod
+    @callback
+    def _async_entity_registry_filter(
+        event_data: entity_registry.EventEntityRegistryUpdatedData,
+    ) -> bool:
+        """Filter entity registry changes which do not affect targets."""
+        return event_data[
+            "action"
+        ] != "update" or not _ENTITY_TARGET_CHANGES.isdisjoint(event_data["changes"])
+
+    @staticmethod
+    @callback
+    def _async_device_registry_filter(
+        event_data: device_registry.EventDeviceRegistryUpdatedData,
+    ) -> bool:
+        """Filter device registry changes which do not affect targets."""
+        return event_data[
+            "action"
+        ] != "update" or not _DEVICE_TARGET_CHANGES.isdisjoint(event_data["changes"])
+
+    @callback
+    def _async_clear(self, _event: Event[Any]) -> None:
+        """Clear the resolved targets."""
+        self._resolved.clear()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> SelectedEntities:
+        """Return the entities, devices and areas selected by a target.
+
+        The returned object is shared and must not be modified.
+        """
+        key = (
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (selected := self._resolved.get(key)) is None:
+            if len(self._resolved) >= MAX_TARGET_INDEX_SIZE:
+                self._resolved.clear()
+            selected = self._resolved[key] = _async_resolve_target(self._hass, selector)
+        return selected
+
+
+@callback
+def _async_resolve_target(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a target selector."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -6,7 +6,9 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from difflib import SequenceMatcher
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
@@ -49,6 +51,79 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# The journal is compacted into the data file once it grows larger than
+# the data itself, but never before it reaches this size in bytes
+JOURNAL_COMPACT_MIN_SIZE = 64 * 1024
+
+
+def _journal_diff(old: Any, new: Any, path: list[Any], ops: list[Any]) -> None:
+    """Append the operations that turn old into new to ops.
+
+    Lists are matched item by item so adding, removing or changing a
+    single item only records that item.
+    """
+    if type(old) is dict and type(new) is dict:
+        ops.extend(["del", [*path, key]] for key in old.keys() - new.keys())
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["set", [*path, key], value])
+            elif old[key] != value:
+                _journal_diff(old[key], value, [*path, key], ops)
+        return
+
+    if type(old) is list and type(new) is list:
+        start = 0
+        shortest = min(len(old), len(new))
+        while start < shortest and old[start] == new[start]:
+            start += 1
+        end = 0
+        while end < shortest - start and old[-end - 1] == new[-end - 1]:
+            end += 1
+        old_changed = old[start : len(old) - end]
+        new_changed = new[start : len(new) - end]
+        matcher = SequenceMatcher(
+            None,
+            [json_helper.json_bytes(item) for item in old_changed],
+            [json_helper.json_bytes(item) for item in new_changed],
+            autojunk=False,
+        )
+        # Work backwards so the indexes of earlier operations stay valid
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            if tag == "replace" and i2 - i1 == j2 - j1:
+                for offset in range(i2 - i1):
+                    _journal_diff(
+                        old_changed[i1 + offset],
+                        new_changed[j1 + offset],
+                        [*path, start + i1 + offset],
+                        ops,
+                    )
+                continue
+            ops.append(["splice", path, start + i1, start + i2, new_changed[j1:j2]])
+        return
+
+    ops.append(["set", path, new])
+
+
+def _journal_apply(data: dict[str, Any], op: list[Any]) -> None:
+    """Apply a journal operation to data."""
+    path: list[Any] = op[1]
+    if op[0] == "splice":
+        target: Any = data
+        for key in path:
+            target = target[key]
+        target[op[2] : op[3]] = op[4]
+        return
+
+    target = data
+    for key in path[:-1]:
+        target = target[key]
+    if op[0] == "set":
+        target[path[-1]] = op[2]
+    else:
+        target.pop(path[-1], None)
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -242,8 +317,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If journal is set, writes only append the changes since the last
+        write to a journal next to the data file which is replayed on load
+        and compacted into the data file once it grows too large.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +340,23 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # The data as last written, only accessed in the executor
+        self._journal_base: dict[str, Any] | None = None
+        self._journal_id = 0
+        self._journal_size = 0
+        self._journal_compact = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}.journal"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -392,6 +484,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "minor_version" not in data:
             data["minor_version"] = 1
 
+        if self._journal and self._data is None:
+            data = await self.hass.async_add_executor_job(self._load_journal, data)
+            if self._journal_size or self._journal_compact:
+                # Older versions don't read the journal, compact it on
+                # shutdown so the data file is complete
+                self._async_ensure_final_write_listener()
+
         if (
             data["version"] == self.version
             and data["minor_version"] == self.minor_version
@@ -421,6 +520,59 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _load_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Replay the journal on top of the loaded data."""
+        journal_id = data.get("journal_id", 0)
+        journal_size = 0
+        compact = False
+        try:
+            with open(self.journal_path, "rb") as fp:
+                journal = fp.read()
+        except FileNotFoundError:
+            journal = b""
+
+        replayed = json_util.json_loads(json_helper.json_bytes(data))
+        for line in journal.splitlines(keepends=True):
+            try:
+                entry = json_util.json_loads(line)
+            except ValueError:
+                # The last write was interrupted, the journal must be
+                # rewritten before appending to it again
+                _LOGGER.warning("Ignoring truncated journal for %s", self.key)
+                compact = True
+                break
+            journal_size += len(line)
+            if not line.endswith(b"\n"):
+                compact = True
+            try:
+                # Entries written before the data file was last compacted
+                # are already part of the data
+                if entry["id"] != journal_id:
+                    compact = True
+                    continue
+                for op in entry["ops"]:
+                    _journal_apply(replayed, op)
+            except (AttributeError, IndexError, KeyError, TypeError, ValueError) as err:
+                _LOGGER.error(
+                    "Discarding journal for %s which does not apply to %s: %r",
+                    self.key,
+                    self.path,
+                    err,
+                )
+                with suppress(OSError):
+                    os.unlink(self.journal_path)
+                replayed = json_util.json_loads(json_helper.json_bytes(data))
+                journal_size = 0
+                compact = True
+                break
+
+        data = replayed
+        self._journal_base = json_util.json_loads(json_helper.json_bytes(data))
+        self._journal_id = journal_id
+        self._journal_size = journal_size
+        self._journal_compact = compact
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -519,6 +671,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if not self._journal or self._read_only:
+            return
+        async with self._write_lock:
+            self._async_cleanup_final_write_listener()
+            try:
+                await self.hass.async_add_executor_job(self._compact_journal)
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -544,6 +704,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        if self._journal and (self._journal_size or self._journal_compact):
+            self._async_ensure_final_write_listener()
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
@@ -552,6 +714,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            self._write_journal(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +727,79 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_journal(self, path: str, data: dict) -> None:
+        """Append the changes since the last write to the journal."""
+        try:
+            encoder = self._encoder
+            if encoder and encoder is not JSONEncoder:
+                json_data: str | bytes = json.dumps(data, cls=encoder)
+            else:
+                json_data = json_helper.json_bytes(data)
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}: {err}"
+            ) from err
+        new = json_util.json_loads(json_data)
+        base = self._journal_base
+
+        if (
+            base is None
+            or self._journal_compact
+            or base["version"] != new["version"]
+            or base["minor_version"] != new["minor_version"]
+            or self._journal_size > max(JOURNAL_COMPACT_MIN_SIZE, len(json_data))
+        ):
+            journal_id = self._journal_id + 1
+            new["journal_id"] = journal_id
+            _LOGGER.debug("Compacting data for %s to %s", self.key, path)
+            json_helper.save_json(
+                path, new, self._private, atomic_writes=self._atomic_writes
+            )
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+            self._journal_base = new
+            self._journal_id = journal_id
+            self._journal_size = 0
+            self._journal_compact = False
+            return
+
+        ops: list[Any] = []
+        _journal_diff(base["data"], new["data"], ["data"], ops)
+        self._journal_base = new
+        if not ops:
+            return
+
+        line = json_helper.json_bytes({"id": self._journal_id, "ops": ops}) + b"\n"
+        _LOGGER.debug("Appending %s bytes to journal for %s", len(line), self.key)
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, line)
+                if self._atomic_writes:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            # The journal may now end with a partial entry
+            self._journal_compact = True
+            raise WriteError(err) from err
+        self._journal_size += len(line)
+
+    def _compact_journal(self) -> None:
+        """Fold the journal into the data file."""
+        if self._journal_base is None or not (
+            self._journal_size or self._journal_compact
+        ):
+            return
+        self._journal_compact = True
+        data = self._journal_base
+        data.pop("journal_id", None)
+        self._write_journal(self.path, data)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +812,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_base = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
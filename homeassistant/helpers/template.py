@@ -64,6 +64,7 @@ from homeassistant.core import (
     HomeAssistant,
     ServiceResponse,
     State,
+    StateMachine,
     callback,
     split_entity_id,
     valid_domain,
@@ -163,6 +164,7 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 #
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
+MAX_MEMOIZED_EXPRESSIONS = 1024
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
@@ -1100,6 +1102,9 @@ class TemplateStateBase(State):
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
         self._collect_state()
+        if type(render_info := _render_info.get()) is _MemoCollector:
+            # last_reported is updated in place when a state is reported
+            render_info.last_reported = True
         return self._state.last_reported
 
     @property
@@ -1225,7 +1230,8 @@ def _state_generator(
     if domain is None:
         container = states._states.values()  # noqa: SLF001
     else:
-        container = states.async_all(domain)
+        # The snapshot of a domain is shared until one of its states changes
+        container = states.async_domain_snapshot(domain).states
     for state in container:
         yield _template_state_no_collect(hass, state)
 
@@ -1342,6 +1348,337 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
     return list(found.values())
 
 
+# Filters which are memoized when they are applied to the states, the
+# states of a domain, expand or another memoized filter
+_MEMOIZED_FILTERS = frozenset(
+    {
+        "count",
+        "first",
+        "last",
+        "length",
+        "list",
+        "map",
+        "reject",
+        "rejectattr",
+        "select",
+        "selectattr",
+        "sort",
+        "sum",
+        "unique",
+    }
+)
+# Filters and tests which only depend on their arguments and the state
+# machine and can be passed by name to memoized filters
+_MEMOIZED_FUNCTIONS = frozenset(
+    {
+        "!=",
+        "<",
+        "<=",
+        "==",
+        ">",
+        ">=",
+        "abs",
+        "bool",
+        "boolean",
+        "contains",
+        "count",
+        "default",
+        "defined",
+        "divisibleby",
+        "eq",
+        "equalto",
+        "even",
+        "false",
+        "first",
+        "float",
+        "ge",
+        "greaterthan",
+        "gt",
+        "has_value",
+        "in",
+        "int",
+        "integer",
+        "is_number",
+        "is_state",
+        "is_state_attr",
+        "last",
+        "le",
+        "length",
+        "lessthan",
+        "list",
+        "lower",
+        "lt",
+        "match",
+        "ne",
+        "none",
+        "number",
+        "odd",
+        "replace",
+        "round",
+        "search",
+        "state_attr",
+        "states",
+        "string",
+        "title",
+        "trim",
+        "true",
+        "undefined",
+        "upper",
+    }
+)
+_MEMOIZED_ARG_TYPES = (str, int, float, bool, type(None))
+
+
+class _MemoizedList(list):
+    """A list which is the result of a memoized expression."""
+
+    __slots__ = ("memo_key", "memoized")
+
+    memo_key: tuple[Any, ...] | None
+    memoized: _MemoizedResult
+
+
+class _MemoizedIterator:
+    """An iterator over the result of a memoized expression."""
+
+    __slots__ = ("memo_key", "memoized", "_iterator")
+
+    def __init__(self, memo_key: tuple[Any, ...], memoized: _MemoizedResult) -> None:
+        """Initialize the iterator."""
+        self.memo_key: tuple[Any, ...] | None = memo_key
+        self.memoized = memoized
+        self._iterator = iter(memoized.value)
+
+    def __iter__(self) -> Self:
+        """Return the iterator."""
+        return self
+
+    def __next__(self) -> Any:
+        """Return the next item."""
+        # Once consumed the iterator no longer represents the expression
+        self.memo_key = None
+        return next(self._iterator)
+
+    def consume(self, first: bool) -> None:
+        """Consume the iterator as the filter a memoized result is reused for.
+
+        first only takes the first item, the other filters take all of them.
+        """
+        self.memo_key = None
+        if first:
+            next(self._iterator, None)
+        else:
+            self._iterator = iter(())
+
+
+class _MemoCollector:
+    """Collect what an expression reads while it is being memoized."""
+
+    __slots__ = (
+        "all_states",
+        "all_states_lifecycle",
+        "domains",
+        "domains_lifecycle",
+        "entities",
+        "has_time",
+        "last_reported",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.all_states = False
+        self.all_states_lifecycle = False
+        self.domains: set[str] = set()
+        self.domains_lifecycle: set[str] = set()
+        self.entities: set[str] = set()
+        self.has_time = False
+        self.last_reported = False
+
+
+class _MemoizedResult:
+    """The result of a memoized expression and the states it depends on."""
+
+    __slots__ = ("value", "kind", "collector", "version", "domain_versions")
+
+    def __init__(
+        self,
+        value: Any,
+        kind: type[_MemoizedList | _MemoizedIterator] | None,
+        collector: _MemoCollector,
+        states: StateMachine,
+    ) -> None:
+        """Initialize the result."""
+        self.value = value
+        self.kind = kind
+        self.collector = collector
+        self.version: int | None = None
+        if collector.all_states or collector.all_states_lifecycle:
+            self.version = states.async_version()
+        domains = collector.domains | collector.domains_lifecycle
+        domains.update(
+            split_entity_id(entity_id)[0] for entity_id in collector.entities
+        )
+        self.domain_versions = tuple(
+            (domain, states.async_version(domain)) for domain in domains
+        )
+
+    def is_current(self, states: StateMachine) -> bool:
+        """Return if none of the states the result depends on changed."""
+        if self.version is not None and self.version != states.async_version():
+            return False
+        return all(
+            states.async_version(domain) == version
+            for domain, version in self.domain_versions
+        )
+
+    def collect(self) -> None:
+        """Collect what the result read into the render info."""
+        if (render_info := _render_info.get()) is not None:
+            collector = self.collector
+            if collector.all_states:
+                render_info.all_states = True
+            if collector.all_states_lifecycle:
+                render_info.all_states_lifecycle = True
+            if collector.has_time:
+                render_info.has_time = True
+            if collector.last_reported and type(render_info) is _MemoCollector:
+                render_info.last_reported = True
+            render_info.domains.update(collector.domains)  # type: ignore[attr-defined]
+            render_info.domains_lifecycle.update(collector.domains_lifecycle)  # type: ignore[attr-defined]
+            render_info.entities.update(collector.entities)  # type: ignore[attr-defined]
+
+    def result(self, key: tuple[Any, ...]) -> Any:
+        """Return the result and collect what it read into the render info."""
+        self.collect()
+        if self.kind is _MemoizedList:
+            result = _MemoizedList(self.value)
+            result.memo_key = key
+            result.memoized = self
+            return result
+        if self.kind is _MemoizedIterator:
+            return _MemoizedIterator(key, self)
+        return self.value
+
+
+def _memo_key(value: Any) -> tuple[Any, ...] | None:
+    """Return the key of a value that is the result of a memoized expression."""
+    if type(value) is DomainStates:
+        return ("states", value._domain)  # noqa: SLF001
+    if type(value) is AllStates:
+        return ("states",)
+    if type(value) is _MemoizedList or type(value) is _MemoizedIterator:
+        return value.memo_key
+    return None
+
+
+class _ExpressionMemo:
+    """Results of expressions over the state machine shared by templates.
+
+    Filters applied to the states are pure for a version of the state
+    machine, many templates evaluate the same ones so their results are
+    kept until one of the domains they read from changes.
+    """
+
+    __slots__ = ("_states", "_results")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the memo."""
+        self._states = hass.states
+        self._results: dict[tuple[Any, ...], _MemoizedResult] = {}
+
+    def memoize_expand(
+        self, func: Callable[..., Iterable[State]]
+    ) -> Callable[..., Iterable[State]]:
+        """Memoize expand for entity ids."""
+
+        @wraps(func)
+        def memoized_expand(context: Any, *args: Any) -> Iterable[State]:
+            if not all(type(arg) is str for arg in args):
+                return func(context, *args)
+            return self._async_call(("expand", args), None, func, (context, *args), {})
+
+        return memoized_expand
+
+    def memoize_filter(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Memoize a filter applied to the result of a memoized expression."""
+        # Jinja passes the context or environment first when the filter asks
+        offset = 1 if getattr(func, "jinja_pass_arg", None) is not None else 0
+        # The test or filter applied by name, the attribute comes first
+        name_index = 1 if name in ("selectattr", "rejectattr") else 0
+
+        @wraps(func)
+        def memoized_filter(*args: Any, **kwargs: Any) -> Any:
+            if (parent := _memo_key(args[offset])) is None:
+                return func(*args, **kwargs)
+            filter_args = args[offset + 1 :]
+            if (
+                not all(isinstance(arg, _MEMOIZED_ARG_TYPES) for arg in filter_args)
+                or not all(
+                    isinstance(arg, _MEMOIZED_ARG_TYPES) for arg in kwargs.values()
+                )
+                or (
+                    len(filter_args) > name_index
+                    and filter_args[name_index] not in _MEMOIZED_FUNCTIONS
+                )
+            ):
+                return func(*args, **kwargs)
+            key = (name, parent, filter_args, tuple(sorted(kwargs.items())))
+            return self._async_call(key, args[offset], func, args, kwargs)
+
+        return memoized_filter
+
+    def _async_call(
+        self,
+        key: tuple[Any, ...],
+        value: Any,
+        func: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Return the memoized result of a call or call and memoize it.
+
+        The value is what the filter is applied to.
+        """
+        results = self._results
+        if (memoized := results.get(key)) is not None and memoized.is_current(
+            self._states
+        ):
+            if type(value) is _MemoizedIterator:
+                value.consume(key[0] == "first")
+            return memoized.result(key)
+
+        parent: _MemoizedResult | None = None
+        if type(value) is _MemoizedList or type(value) is _MemoizedIterator:
+            parent = value.memoized
+
+        collector = _MemoCollector()
+        token = _render_info.set(collector)  # type: ignore[arg-type]
+        try:
+            if parent is not None:
+                # The result depends on everything the value it is applied
+                # to was computed from
+                parent.collect()
+            result = func(*args, **kwargs)
+            kind: type[_MemoizedList | _MemoizedIterator] | None = None
+            if isinstance(result, list):
+                kind = _MemoizedList
+                result = tuple(result)
+            elif isinstance(result, collections.abc.Iterator):
+                kind = _MemoizedIterator
+                result = tuple(result)
+        finally:
+            _render_info.reset(token)
+
+        memoized = _MemoizedResult(result, kind, collector, self._states)
+        # Expressions depending on the time are not pure and reported states
+        # change last_reported without a new version of the state machine
+        if not collector.has_time and not collector.last_reported:
+            if len(results) >= MAX_MEMOIZED_EXPRESSIONS:
+                results.clear()
+            results[key] = memoized
+        return memoized.result(key)
+
+
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
     entity_reg = entity_registry.async_get(hass)
@@ -3122,7 +3459,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 self.filters[test] = unsupported(test)
             return
 
-        self.globals["expand"] = hassfunction(expand)
+        memo = _ExpressionMemo(hass)
+        self.globals["expand"] = memo.memoize_expand(hassfunction(expand))
         self.filters["expand"] = self.globals["expand"]
         self.globals["closest"] = hassfunction(closest)
         self.filters["closest"] = hassfunction(closest_filter)
@@ -3155,6 +3493,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["today_at"] = hassfunction(today_at)
         self.filters["today_at"] = self.globals["today_at"]
 
+        for name in _MEMOIZED_FILTERS:
+            self.filters[name] = memo.memoize_filter(name, self.filters[name])
+
     def is_safe_callable(self, obj):
         """Test if callback is safe."""
         return isinstance(
@@ -247,6 +247,20 @@ def script_execution_get() -> str | None:
     return data.script_execution
 
 
+@contextmanager
+def trace_disabled() -> Generator[None]:
+    """Run without recording a trace, the current trace is restored after."""
+    trace_token = trace_cv.set(None)
+    stack_token = trace_stack_cv.set(None)
+    path_token = trace_path_stack_cv.set(None)
+    try:
+        yield
+    finally:
+        trace_path_stack_cv.reset(path_token)
+        trace_stack_cv.reset(stack_token)
+        trace_cv.reset(trace_token)
+
+
 @contextmanager
 def trace_path(suffix: str | list[str]) -> Generator[None]:
     """Go deeper in the config tree.
@@ -6,6 +6,8 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import logging
 from timeit import default_timer as timer
 
@@ -17,6 +19,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -116,6 +119,209 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_keyed_listeners(hass):
+    """Fire 10k events with 10, 100 and 1000 filtered and keyed listeners."""
+    event_name = "benchmark_event"
+    events_to_fire = 10**4
+    total = 0.0
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+
+    for listener_count in (10, 100, 1000):
+        entity_ids = [f"sensor.power_{idx}" for idx in range(listener_count)]
+        events = [
+            {"entity_id": entity_ids[idx % listener_count]}
+            for idx in range(events_to_fire)
+        ]
+        for name in ("filtered", "keyed"):
+            unsubs = []
+            for entity_id in entity_ids:
+                if name == "keyed":
+                    unsubs.append(
+                        hass.bus.async_listen_keyed(event_name, entity_id, listener)
+                    )
+                    continue
+
+                @core.callback
+                def event_filter(event_data, entity_id=entity_id):
+                    """Filter event."""
+                    return event_data["entity_id"] == entity_id
+
+                unsubs.append(
+                    hass.bus.async_listen(
+                        event_name, listener, event_filter=event_filter
+                    )
+                )
+
+            start = timer()
+            for event_data in events:
+                hass.bus.async_fire(event_name, event_data)
+            await hass.async_block_till_done()
+            elapsed = timer() - start
+            total += elapsed
+            print(f"{listener_count} {name} listeners: {elapsed:.3f}s")
+
+            for unsub in unsubs:
+                unsub()
+
+    return total
+
+
+@benchmark
+async def websocket_subscribe_entities_coalesced(hass):
+    """Send 100 and 1000 state changes per second to 15 subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    import time
+
+    from homeassistant.auth.models import User
+    from homeassistant.components.websocket_api.commands import (
+        _CoalescedEntityChanges,
+        _forward_entity_changes,
+    )
+
+    connection_count = 15
+    seconds = 2
+    ticks_per_second = 10
+    user = User(name="benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    total = 0.0
+
+    for updates_per_second in (100, 1000):
+        entity_ids = [f"sensor.power_{idx}" for idx in range(updates_per_second)]
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0")
+        updates_per_tick = updates_per_second // ticks_per_second
+
+        for name in ("per change", "coalesced"):
+            frames = 0
+            sent_bytes = 0
+
+            def _send_message(message):
+                nonlocal frames, sent_bytes
+                frames += 1
+                sent_bytes += len(message)
+
+            unsubs = []
+            for msg_id in range(connection_count):
+                if name == "coalesced":
+                    forward = _CoalescedEntityChanges(
+                        hass, _send_message, None, user, str(msg_id).encode(), 0.1
+                    ).async_add_change
+                else:
+                    forward = partial(
+                        _forward_entity_changes,
+                        _send_message,
+                        None,
+                        user,
+                        str(msg_id).encode(),
+                    )
+                unsubs.append(hass.bus.async_listen(EVENT_STATE_CHANGED, forward))
+
+            start = time.process_time()
+            update = 0
+            for _ in range(seconds * ticks_per_second):
+                for _ in range(updates_per_tick):
+                    hass.states.async_set(
+                        entity_ids[update % updates_per_second], str(update)
+                    )
+                    update += 1
+                await asyncio.sleep(1 / ticks_per_second)
+            await asyncio.sleep(0.2)
+            await hass.async_block_till_done()
+            elapsed = time.process_time() - start
+            total += elapsed
+
+            for unsub in unsubs:
+                unsub()
+            print(
+                f"{connection_count} connections x {updates_per_second} updates/s, "
+                f"{name}: {elapsed:.3f}s CPU, {frames} frames, "
+                f"{sent_bytes / 2**20:.1f} MiB"
+            )
+
+    return total
+
+
+@benchmark
+async def websocket_subscribe_entities_reconnect(hass):
+    """Reconnect to subscribe_entities on an 8k entity install."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+    from homeassistant.components.websocket_api import const as websocket_const
+    from homeassistant.components.websocket_api.commands import (
+        handle_subscribe_entities,
+    )
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+    from homeassistant.components.websocket_api.replay import DATA_STATE_REPLAY_LOG
+
+    entity_count = 8000
+    missed_changes = 50
+    reconnects = 20
+    user = User(name="benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    refresh_token = RefreshToken(
+        user=user, client_id=None, access_token_expiration=timedelta(minutes=30)
+    )
+    hass.data.setdefault(websocket_const.DOMAIN, {})
+    for idx in range(entity_count):
+        hass.states.async_set(
+            f"sensor.power_{idx}",
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {idx}"},
+        )
+
+    sent_bytes = 0
+
+    def _send_message(message):
+        nonlocal sent_bytes
+        if isinstance(message, bytes):
+            sent_bytes += len(message)
+
+    schema = handle_subscribe_entities._ws_schema  # noqa: SLF001
+    connection = ActiveConnection(
+        logging.getLogger(__name__), hass, _send_message, user, refresh_token
+    )
+    handle_subscribe_entities(
+        hass,
+        connection,
+        schema({"id": 1, "type": "subscribe_entities", "resumable": True}),
+    )
+    connection.async_handle_close()
+    replay_log = hass.data[DATA_STATE_REPLAY_LOG]
+    total = 0.0
+
+    for name in ("full sync", "resume"):
+        sent_bytes = 0
+        elapsed = 0.0
+        for msg_id in range(2, reconnects + 2):
+            since = replay_log.last_seq
+            for idx in range(missed_changes):
+                hass.states.async_set(
+                    f"sensor.power_{idx}",
+                    str(msg_id * missed_changes + idx),
+                    {"unit_of_measurement": "W", "friendly_name": f"Power {idx}"},
+                )
+            msg = {"id": msg_id, "type": "subscribe_entities", "resumable": True}
+            if name == "resume":
+                msg |= {"replay_id": replay_log.id, "since": since}
+            connection = ActiveConnection(
+                logging.getLogger(__name__), hass, _send_message, user, refresh_token
+            )
+            msg = schema(msg)
+            start = timer()
+            handle_subscribe_entities(hass, connection, msg)
+            elapsed += timer() - start
+            connection.async_handle_close()
+        total += elapsed
+        print(
+            f"{name}: {elapsed / reconnects * 1000:.2f}ms, "
+            f"{sent_bytes / reconnects / 1024:.1f} KiB per reconnect"
+        )
+
+    return total
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +514,821 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_match_wildcard_subscriptions(hass):
+    """Match 100k topics against a growing number of wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import (
+        Subscription,
+        WildcardSubscriptionIndex,
+    )
+
+    topics_to_match = 10**5
+    job = core.HassJob(lambda msg: None)
+    total = 0.0
+
+    for subscription_count in (10**2, 10**3, 10**4):
+        index = WildcardSubscriptionIndex()
+        for idx in range(subscription_count):
+            index.add(Subscription(f"homeassistant/+/device_{idx}/#", False, job))
+            index.add(Subscription(f"zigbee2mqtt/device_{idx}/+", False, job))
+
+        topics = [
+            f"homeassistant/sensor/device_{idx % subscription_count}/state"
+            for idx in range(topics_to_match)
+        ]
+
+        start = timer()
+
+        for topic in topics:
+            assert len(index.match(topic)) == 1
+
+        elapsed = timer() - start
+        total += elapsed
+        print(
+            f"{2 * subscription_count} subscriptions:",
+            f"{topics_to_match / elapsed:.0f} messages/sec",
+        )
+
+    return total
+
+
+@benchmark
+async def recorder_insert_states(hass):
+    """Write 10k states through the ORM unit of work and multi-row inserts."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    states_to_write = 10**4
+    entity_count = 100
+
+    def _make_states(session):
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.power_{idx}") for idx in range(entity_count)
+        ]
+        attributes = StateAttributes(shared_attrs="{}", hash=1)
+        session.add_all([*states_meta, attributes])
+        session.flush()
+        last_state: dict[int, States] = {}
+        states = []
+        for idx in range(states_to_write):
+            dbstate = States(
+                state=str(idx),
+                last_updated_ts=float(idx),
+                metadata_id=states_meta[idx % entity_count].metadata_id,
+                attributes_id=attributes.attributes_id,
+            )
+            dbstate.old_state = last_state.get(idx % entity_count)
+            last_state[idx % entity_count] = dbstate
+            states.append(dbstate)
+        return states
+
+    def _orm_flush():
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            states = _make_states(session)
+            start = timer()
+            session.add_all(states)
+            session.commit()
+            return timer() - start
+
+    def _multi_row_insert():
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        columns = [c.key for c in States.__table__.columns if not c.primary_key]
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        with Session(engine) as session:
+            states = _make_states(session)
+            start = timer()
+            for offset in range(0, states_to_write, entity_count):
+                batch = states[offset : offset + entity_count]
+                rows = []
+                for dbstate in batch:
+                    row = {column: getattr(dbstate, column) for column in columns}
+                    if (old_state := dbstate.old_state) is not None:
+                        row["old_state_id"] = old_state.state_id
+                    rows.append(row)
+                for dbstate, state_id in zip(
+                    batch, session.execute(stmt, rows).scalars(), strict=True
+                ):
+                    dbstate.state_id = state_id
+            session.commit()
+            return timer() - start
+
+    orm_time = await hass.async_add_executor_job(_orm_flush)
+    insert_time = await hass.async_add_executor_job(_multi_row_insert)
+    print(f"ORM unit of work: {states_to_write / orm_time:.0f} states/sec")
+    print(f"Multi-row insert: {states_to_write / insert_time:.0f} states/sec")
+    return insert_time
+
+
+@benchmark
+async def sensor_compile_mean_min_max(hass):
+    """Calculate 5-minute mean, min and max for 1k, 5k and 20k sensors."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import _FloatStateColumns
+
+    end = dt_util.utcnow().replace(second=0, microsecond=0)
+    start = end - timedelta(minutes=5)
+    states_per_sensor = 30
+    total = 0.0
+
+    for sensor_count in (1000, 5000, 20000):
+        float_states = {
+            f"sensor.power_{idx}": [
+                (
+                    float(change),
+                    core.State(
+                        f"sensor.power_{idx}",
+                        str(change),
+                        last_updated=start + timedelta(seconds=change * 10),
+                    ),
+                )
+                for change in range(states_per_sensor)
+            ]
+            for idx in range(sensor_count)
+        }
+
+        start_time = timer()
+
+        columns = _FloatStateColumns()
+        for entity_id, fstates in float_states.items():
+            columns.add(entity_id, fstates)
+        averages = columns.time_weighted_averages(start, end)
+        for entity_id in float_states:
+            columns.min(entity_id)
+            columns.max(entity_id)
+
+        elapsed = timer() - start_time
+        assert len(averages) == sensor_count
+        total += elapsed
+        print(f"{sensor_count} sensors: {elapsed:.3f}s")
+
+    return total
+
+
+@benchmark
+async def history_columnar_states(hass):
+    """Build and serialize a 1M row minimal history response."""
+    # pylint: disable=import-outside-toplevel
+    import tracemalloc
+    from typing import NamedTuple
+
+    from homeassistant.components.recorder.history.modern import (
+        _sorted_states_to_columns,
+        _sorted_states_to_dict,
+    )
+    from homeassistant.helpers.json import json_bytes
+
+    row_count = 10**6
+    entity_count = 200
+    rows_per_entity = row_count // entity_count
+    entity_id_to_metadata_id = {
+        f"sensor.power_{idx}": idx + 1 for idx in range(entity_count)
+    }
+    entity_ids = list(entity_id_to_metadata_id)
+
+    class Row(NamedTuple):
+        metadata_id: int
+        state: str
+        last_updated_ts: float
+        last_changed_ts: float | None
+        attributes: str
+
+    start_ts = dt_util.utcnow().timestamp()
+    rows = [
+        Row(metadata_id, str(idx % 100), start_ts + idx * 2.5, None, "{}")
+        for metadata_id in entity_id_to_metadata_id.values()
+        for idx in range(rows_per_entity)
+    ]
+
+    def _dicts():
+        return json_bytes(
+            _sorted_states_to_dict(
+                rows,
+                start_ts,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response=True,
+                compressed_state_format=True,
+            )
+        )
+
+    def _columns():
+        return _sorted_states_to_columns(
+            rows, start_ts, entity_ids, entity_id_to_metadata_id
+        ).as_json()
+
+    total = 0.0
+    for name, func in (("dicts", _dicts), ("columns", _columns)):
+        start = timer()
+        func()
+        elapsed = timer() - start
+        total += elapsed
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name}: {elapsed:.3f}s, peak {peak / 2**20:.1f} MiB")
+
+    return total
+
+
+@benchmark
+async def storage_journal(hass):
+    """Rename 100 of 5k registry entries with and without a journaled store."""
+    # pylint: disable=import-outside-toplevel
+    import os
+    import tempfile
+
+    from homeassistant.helpers.storage import Store
+
+    entity_count = 5000
+    renames = 100
+
+    def _file_size(path):
+        with suppress(FileNotFoundError):
+            return os.path.getsize(path)
+        return 0
+
+    total = 0.0
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for journal in (False, True):
+            key = f"benchmark.journal_{journal}"
+            store = Store(hass, 1, key, atomic_writes=True, journal=journal)
+            entities = [
+                {
+                    "id": f"{idx:032x}",
+                    "entity_id": f"sensor.benchmark_{idx}",
+                    "platform": "benchmark",
+                    "unique_id": f"unique_{idx}",
+                    "name": None,
+                    "original_name": f"Benchmark sensor {idx}",
+                    "device_class": None,
+                    "options": {"sensor": {"suggested_display_precision": 1}},
+                    "capabilities": {"state_class": "measurement"},
+                    "created_at": "2025-01-01T00:00:00+00:00",
+                }
+                for idx in range(entity_count)
+            ]
+            await store.async_save({"entities": entities})
+            written = 0
+            start = timer()
+            for idx in range(renames):
+                entities[idx * 7]["name"] = f"Renamed {idx}"
+                journal_size = _file_size(store.journal_path)
+                await store.async_save({"entities": entities})
+                if (new_size := _file_size(store.journal_path)) > journal_size:
+                    written += new_size - journal_size
+                else:
+                    written += _file_size(store.path) + new_size
+            elapsed = timer() - start
+            total += elapsed
+            start = timer()
+            loaded = await Store(hass, 1, key, journal=journal).async_load()
+            load_time = timer() - start
+            assert loaded == {"entities": entities}
+            print(
+                f"journal={journal}: {written / renames / 1024:.1f} KiB written "
+                f"per mutation, {elapsed / renames * 1000:.2f}ms per save, "
+                f"load {load_time * 1000:.1f}ms"
+            )
+
+    return total
+
+
+@benchmark
+async def service_target_resolution(hass):
+    """Resolve floor and label targets against 1k, 5k and 20k entities."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        service,
+    )
+
+    await ar.async_load(hass)
+    await fr.async_load(hass)
+    await lr.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    area_reg = ar.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    floor_ids = [
+        fr.async_get(hass).async_create(f"Floor {idx}").floor_id for idx in range(4)
+    ]
+    label_ids = [
+        lr.async_get(hass).async_create(f"Label {idx}").label_id for idx in range(20)
+    ]
+    area_ids = [
+        area_reg.async_create(f"Area {idx}", floor_id=floor_ids[idx % 4]).id
+        for idx in range(40)
+    ]
+    call = core.ServiceCall(
+        hass,
+        "light",
+        "turn_on",
+        {"floor_id": floor_ids[0], "label_id": label_ids[0]},
+    )
+    calls = 1000
+
+    total = 0.0
+    entity_count = 0
+    for target_count in (1000, 5000, 20000):
+        for idx in range(entity_count, target_count):
+            device = dr.DeviceEntry(
+                area_id=area_ids[idx % 40], labels={label_ids[idx % 20]}
+            )
+            dev_reg.devices[device.id] = device
+            entity_id = f"light.benchmark_{idx}"
+            ent_reg.entities[entity_id] = er.RegistryEntry(
+                entity_id=entity_id,
+                unique_id=str(idx),
+                platform="benchmark",
+                device_id=device.id,
+                labels={label_ids[(idx + 1) % 20]},
+            )
+        entity_count = target_count
+        # The registries were changed without firing events
+        hass.data.pop(service.TARGET_INDEX, None)
+        selector = service.ServiceTargetSelector(call)
+
+        start = timer()
+        for _ in range(calls):
+            service._async_resolve_target(hass, selector)  # noqa: SLF001
+        walk_time = timer() - start
+
+        start = timer()
+        for _ in range(calls):
+            selected = service.async_extract_referenced_entity_ids(hass, call)
+        index_time = timer() - start
+        total += index_time
+        print(
+            f"{entity_count} entities ({len(selected.indirectly_referenced)} "
+            f"selected): registry walk {walk_time / calls * 1e6:.0f}µs, "
+            f"index {index_time / calls * 1e6:.0f}µs per call"
+        )
+
+    return total
+
+
+@benchmark
+async def script_variables_render(hass):
+    """Render 20 blueprint variables of which the actions use 2, 10k times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv, script_variables
+
+    runs = 10**4
+    variables = cv.SCRIPT_VARIABLES_SCHEMA(
+        {
+            "motion_entity": "binary_sensor.motion",
+            "light_target": {"entity_id": "light.hallway"},
+            **{
+                f"input_{idx}": f"{{{{ trigger.to_state.state ~ '_{idx}' }}}}"
+                for idx in range(18)
+            },
+            "brightness": "{{ (input_3 | length) * 10 }}",
+        }
+    )
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {
+                "action": "light.turn_on",
+                "target": "{{ light_target }}",
+                "data": {"brightness": "{{ brightness }}"},
+            }
+        ]
+    )
+    referenced = script_variables.async_referenced_variables(sequence)
+    hass.states.async_set("binary_sensor.motion", "on")
+    run_variables = {
+        "trigger": {"to_state": hass.states.get("binary_sensor.motion")},
+    }
+
+    total = 0.0
+    for name, used in (("all", None), ("referenced", referenced)):
+        start = timer()
+        for _ in range(runs):
+            variables.async_render(hass, run_variables, referenced=used)
+        elapsed = timer() - start
+        total += elapsed
+        print(f"{name}: {elapsed / runs * 1e6:.0f}µs per trigger")
+
+    return total
+
+
+@benchmark
+async def template_render_batch(hass):
+    """Change 10 sensors at once 1k times with 100 templates using all of them."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+    from homeassistant.helpers.template import Template
+
+    sensors = [f"sensor.power_{idx}" for idx in range(10)]
+    bursts = 1000
+    results = 0
+
+    @core.callback
+    def listener(event, updates):
+        nonlocal results
+        results += len(updates)
+
+    for idx in range(100):
+        template = Template(
+            " + ".join(f"states('{sensor}') | int(0)" for sensor in sensors).join(
+                ("{{ ", f" + {idx} }}}}")
+            ),
+            hass,
+        )
+        async_track_template_result(hass, [TrackTemplate(template, None)], listener)
+    await hass.async_block_till_done()
+
+    start = timer()
+    for burst in range(bursts):
+        for sensor in sensors:
+            hass.states.async_set(sensor, str(burst))
+        await hass.async_block_till_done()
+    elapsed = timer() - start
+
+    print(f"{results} results for {bursts * len(sensors) * 100} template state changes")
+
+    return elapsed
+
+
+@benchmark
+async def template_shared_expressions(hass):
+    """Render 500 templates filtering 1k sensors after a state change, 20 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    for idx in range(1000):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx}",
+            str(idx),
+            {"device_class": ("power", "energy", "temperature", "humidity")[idx % 4]},
+        )
+    expressions = (
+        "states.sensor | selectattr('attributes.device_class', 'eq', 'power')"
+        " | map(attribute='state') | map('float') | sum",
+        "states.sensor | selectattr('attributes.device_class', 'eq', 'energy')"
+        " | map(attribute='state') | map('float') | max",
+        "states.sensor | selectattr('state', 'eq', '42') | list | count",
+        "states | selectattr('domain', 'eq', 'sensor')"
+        " | map(attribute='entity_id') | first",
+        "states.sensor | rejectattr('attributes.device_class', 'eq', 'humidity')"
+        " | list | length",
+    )
+    templates = [
+        Template(f"{{{{ ({expressions[idx % 5]}) ~ ' {idx}' }}}}", hass)
+        for idx in range(500)
+    ]
+    cycles = 20
+
+    start = timer()
+    for cycle in range(cycles):
+        hass.states.async_set("sensor.benchmark_0", str(cycle))
+        for template in templates:
+            template.async_render_to_info()
+    elapsed = timer() - start
+    print(f"{elapsed / cycles / len(templates) * 1e6:.0f}µs per template render")
+
+    return elapsed
+
+
+@benchmark
+async def state_snapshot_serialize(hass):
+    """Serialize 8k states for 1000 reconnects, one state changing in between."""
+    for idx in range(8000):
+        hass.states.async_set(
+            f"sensor{idx % 40}.benchmark_{idx}", str(idx), {"unit_of_measurement": "W"}
+        )
+    reconnects = 1000
+
+    start = timer()
+    for idx in range(reconnects):
+        hass.states.async_set("sensor0.benchmark_0", str(idx))
+        snapshot = hass.states.async_snapshot()
+        payload = b",".join(domain.as_dict_json for domain in snapshot.domains.values())
+    elapsed = timer() - start
+    print(f"{elapsed / reconnects * 1e6:.0f}µs per get_states of {len(payload)} bytes")
+
+    return elapsed
+
+
+@benchmark
+async def condition_compiled(hass):
+    """Check conditions 100k times with the closure tree and compiled."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import condition, config_validation as cv, trace
+
+    configs = [
+        {"condition": "time", "after": "00:00:00", "before": "23:59:59"},
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.benchmark_temperature",
+            "above": 10,
+            "below": 30,
+        },
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": "light.benchmark_kitchen",
+                    "state": "on",
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "light.benchmark_hallway",
+                    "state": "on",
+                },
+            ],
+        },
+        {
+            "condition": "state",
+            "entity_id": "binary_sensor.benchmark_motion",
+            "state": "on",
+        },
+    ]
+    configs = await condition.async_validate_conditions_config(
+        hass, [cv.CONDITION_SCHEMA(config) for config in configs]
+    )
+    hass.states.async_set("sensor.benchmark_temperature", "21")
+    hass.states.async_set("light.benchmark_kitchen", "off")
+    hass.states.async_set("light.benchmark_hallway", "on")
+    check_conditions = await condition.async_conditions_from_config(
+        hass, configs, logging.getLogger(__name__), "benchmark"
+    )
+    count = 100000
+
+    for motion in ("on", "off"):
+        hass.states.async_set("binary_sensor.benchmark_motion", motion)
+        start = timer()
+        for _ in range(count):
+            trace.trace_clear()
+            check_conditions()
+        traced = timer() - start
+        start = timer()
+        with trace.trace_disabled():
+            for _ in range(count):
+                check_conditions()
+        compiled = timer() - start
+        print(
+            f"motion {motion}: {traced / count * 1e6:.2f}µs traced,"
+            f" {compiled / count * 1e6:.2f}µs compiled"
+        )
+
+    return compiled
+
+
+@benchmark
+async def logbook_context_index(hass):
+    """Query an entity logbook over 1 and 7 days with and without a context index."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+
+    from homeassistant.components.logbook.context_index import LogbookContextIndex
+    from homeassistant.components.logbook.queries import statement_for_request
+    from homeassistant.components.logbook.queries.contexts import (
+        context_rows_since_stmt,
+    )
+    from homeassistant.components.recorder.const import SQLITE_MAX_BIND_VARS
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        EventData,
+        Events,
+        EventTypes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
+
+    entity_count = 50
+    interval = 600
+    now = dt_util.utcnow()
+    start_ts = (now - timedelta(days=7)).timestamp()
+    entity_ids = [f"light.benchmark_{idx}" for idx in range(entity_count)]
+
+    # All executor threads must share the same in-memory database
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+
+    def _populate():
+        with Session(engine) as session:
+            event_type = EventTypes(event_type="call_service")
+            states_meta = [StatesMeta(entity_id=entity_id) for entity_id in entity_ids]
+            session.add_all([event_type, *states_meta])
+            session.flush()
+            last_state: dict[int, States] = {}
+            timestamp = start_ts
+            while timestamp < now.timestamp():
+                for idx, entity_id in enumerate(entity_ids):
+                    fired_ts = timestamp + idx
+                    context_id_bin = ulid_to_bytes(ulid_at_time(fired_ts))
+                    state = "on" if idx % 2 == int(timestamp / interval) % 2 else "off"
+                    session.add(
+                        Events(
+                            event_type_id=event_type.event_type_id,
+                            event_data=None,
+                            origin_idx=0,
+                            time_fired_ts=fired_ts,
+                            context_id_bin=context_id_bin,
+                            event_data_rel=EventData(
+                                shared_data=(
+                                    '{"domain":"light","service":"turn_'
+                                    f'{state}","entity_id":"{entity_id}"}}'
+                                ),
+                                hash=0,
+                            ),
+                        )
+                    )
+                    dbstate = States(
+                        state=state,
+                        last_updated_ts=fired_ts + 0.1,
+                        last_changed_ts=fired_ts + 0.1,
+                        metadata_id=states_meta[idx].metadata_id,
+                        context_id_bin=context_id_bin,
+                    )
+                    dbstate.old_state = last_state.get(idx)
+                    last_state[idx] = dbstate
+                    session.add(dbstate)
+                timestamp += interval
+            session.commit()
+            return (event_type.event_type_id,), [states_meta[0].metadata_id]
+
+    def _query(days, context_index):
+        with Session(engine) as session:
+            stmt = statement_for_request(
+                now - timedelta(days=days),
+                now,
+                event_type_ids,
+                entity_ids[:1],
+                metadata_ids,
+                context_union=context_index is None,
+            )
+            rows = session.connection().execute(stmt).all()
+            if context_index is not None:
+                context_index.find_context_origins(
+                    session, rows, {}, SQLITE_MAX_BIND_VARS
+                )
+        return rows
+
+    def _load_context_rows():
+        with Session(engine) as session:
+            return session.connection().execute(context_rows_since_stmt(0)).all()
+
+    event_type_ids, metadata_ids = await hass.async_add_executor_job(_populate)
+    context_index = LogbookContextIndex()
+    context_index.async_load(
+        start_ts - 1, await hass.async_add_executor_job(_load_context_rows)
+    )
+
+    count = 20
+    total = 0.0
+    for days in (1, 7):
+        for name, index in (("context union", None), ("context index", context_index)):
+            start = timer()
+            for _ in range(count):
+                await hass.async_add_executor_job(_query, days, index)
+            elapsed = (timer() - start) / count
+            total += elapsed
+            print(f"{days} day(s) {name}: {elapsed * 1000:.2f}ms per request")
+
+    return total
+
+
+@benchmark
+async def statistics_incremental(hass):
+    """Update a 10k sample statistics buffer 500 times with and without aggregates."""
+    # pylint: disable=import-outside-toplevel
+    from collections import deque
+
+    from homeassistant.components.statistics import sensor as statistics_sensor
+
+    buffer_size = 10000
+    count = 500
+    samples = [
+        (float(idx % 977) + (idx % 7) / 10, 1_700_000_000.0 + idx)
+        for idx in range(buffer_size + count)
+    ]
+    total = 0.0
+    for characteristic in (
+        statistics_sensor.STAT_MEAN,
+        statistics_sensor.STAT_MEDIAN,
+        statistics_sensor.STAT_PERCENTILE,
+        statistics_sensor.STAT_STANDARD_DEVIATION,
+        statistics_sensor.STAT_VALUE_MAX,
+        statistics_sensor.STAT_AVERAGE_STEP,
+    ):
+        characteristic_fn = statistics_sensor.STATS_NUMERIC_SUPPORT[characteristic]
+        aggregate_factory = statistics_sensor.STATS_NUMERIC_INCREMENTAL[characteristic]
+        for name, aggregate in (
+            ("whole buffer", None),
+            ("incremental", aggregate_factory()),
+        ):
+            states = deque(maxlen=buffer_size)
+            ages = deque(maxlen=buffer_size)
+            for value, age in samples[:buffer_size]:
+                states.append(value)
+                ages.append(age)
+                if aggregate is not None:
+                    aggregate.sample_added(states, ages)
+            value_fn = characteristic_fn if aggregate is None else aggregate.value
+            start = timer()
+            for value, age in samples[buffer_size:]:
+                if aggregate is not None:
+                    aggregate.sample_removed(states, ages)
+                states.append(value)
+                ages.append(age)
+                if aggregate is not None:
+                    aggregate.sample_added(states, ages)
+                value_fn(states, ages, 95)
+            elapsed = timer() - start
+            total += elapsed
+            print(f"{characteristic} {name}: {elapsed / count * 1e6:.1f}µs per update")
+
+    return total
+
+
+@benchmark
+async def prometheus_scrape(hass):
+    """Scrape 1k and 10k sensor series with and without the exposition cache."""
+    # pylint: disable=import-outside-toplevel
+    import prometheus_client
+
+    from homeassistant.components.prometheus import PrometheusMetrics
+    from homeassistant.helpers.entity_values import EntityValues
+
+    count = 20
+    total = 0.0
+    for series in (1000, 10000):
+        metrics = PrometheusMetrics(
+            lambda entity_id: True,
+            "homeassistant",
+            hass.config.units.temperature_unit,
+            EntityValues({}, {}, {}),
+            None,
+            None,
+        )
+        states = [
+            core.State(
+                f"sensor.temperature_{idx}",
+                str(20 + idx % 10),
+                {
+                    "device_class": "temperature",
+                    "friendly_name": f"Temperature {idx}",
+                    "unit_of_measurement": "°C",
+                },
+            )
+            for idx in range(series)
+        ]
+        for state in states:
+            metrics.handle_state(state)
+        registry = metrics._registry  # noqa: SLF001
+
+        def _uncached(registry=registry):
+            return prometheus_client.generate_latest(
+                registry
+            ) + prometheus_client.generate_latest(prometheus_client.REGISTRY)
+
+        def _changed(metrics=metrics, states=states):
+            metrics.handle_state(states[0])
+            return metrics.generate_latest()
+
+        for name, scrape in (
+            ("uncached", _uncached),
+            ("cached", metrics.generate_latest),
+            ("cached gzip", partial(metrics.generate_latest, True)),
+            ("cached, 1 state changed", _changed),
+        ):
+            scrape()
+            start = timer()
+            for _ in range(count):
+                scrape()
+            elapsed = (timer() - start) / count
+            total += elapsed
+            print(f"{series} series {name}: {elapsed * 1000:.2f}ms per scrape")
+
+    return total
@@ -50,6 +50,7 @@ from homeassistant.helpers.script import (
     SCRIPT_MODE_SINGLE,
     _async_stop_scripts_at_shutdown,
 )
+from homeassistant.helpers.trace import trace_path
 from homeassistant.setup import async_setup_component
 from homeassistant.util import yaml
 import homeassistant.util.dt as dt_util
@@ -319,6 +320,56 @@ async def test_two_conditions_with_and(
     assert len(calls) == 1
 
 
+async def test_conditions_without_stored_traces(
+    hass: HomeAssistant, calls: list[ServiceCall], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test conditions of an automation which does not store traces."""
+    entity_id = "test.entity"
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "id": "sun",
+                "trace": {"stored_traces": 0},
+                "triggers": [{"platform": "event", "event_type": "test_event"}],
+                "conditions": [
+                    {"condition": "state", "entity_id": entity_id, "state": "100"},
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": entity_id,
+                        "below": 150,
+                    },
+                ],
+                "actions": {"action": "test.automation"},
+            }
+        },
+    )
+
+    with patch(
+        "homeassistant.helpers.condition.trace_path", wraps=trace_path
+    ) as condition_trace_path:
+        hass.states.async_set(entity_id, 100)
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 1
+
+        hass.states.async_set(entity_id, 101)
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+        assert len(calls) == 1
+
+    # The conditions were checked without the traced condition tree
+    condition_trace_path.assert_not_called()
+
+    # The traced conditions report errors
+    hass.states.async_remove(entity_id)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "Error evaluating condition in 'automation 0'" in caplog.text
+
+
 async def test_shorthand_conditions_template(
     hass: HomeAssistant, calls: list[ServiceCall]
 ) -> None:
@@ -2615,6 +2666,43 @@ async def test_blueprint_automation_override(
     ]
 
 
+async def test_blueprint_automation_referenced_variables(
+    hass: HomeAssistant, calls: list[ServiceCall], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test blueprint automations only render the variables they read."""
+    assert await async_setup_component(
+        hass,
+        "automation",
+        {
+            "automation": {
+                "use_blueprint": {
+                    "path": "test_event_service.yaml",
+                    "input": {
+                        "trigger_event": "blueprint_event",
+                        "service_to_call": "test.automation",
+                        "a_number": 5,
+                    },
+                },
+                "variables": {
+                    "used": "{{ trigger.event.data.value }}",
+                    "unused": "{{ trigger.event.data.break + 1 }}",
+                },
+                "actions": {
+                    "action": "test.automation",
+                    "data": {"value": "{{ used }}"},
+                },
+            }
+        },
+    )
+
+    # A broken template in a variable nothing reads does not abort the run
+    hass.bus.async_fire("blueprint_event", {"value": "rendered"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].data["value"] == "rendered"
+    assert "Error rendering variables" not in caplog.text
+
+
 @pytest.mark.parametrize(
     ("blueprint_inputs", "problem", "details"),
     [
@@ -10,6 +10,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.websocket_api import ActiveConnection
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -173,6 +174,183 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    minimal_response: bool,
+) -> None:
+    """Test history_during_period sends the same states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(5):
+        hass.states.async_set("sensor.one", str(idx), attributes={"any": idx})
+        hass.states.async_set("sensor.two", str(idx % 2))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two", "sensor.missing"],
+        "significant_changes_only": False,
+        "minimal_response": minimal_response,
+    }
+    client = await hass_ws_client()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+
+    with patch("homeassistant.components.recorder.history.modern.STREAM_CHUNK_SIZE", 2):
+        await client.send_json_auto_id({**request, "chunked": True})
+        chunks: list[dict[str, list[dict]]] = []
+        while (response := await client.receive_json())["type"] == "event":
+            chunks.append(response["event"]["states"])
+
+    assert response["success"]
+    assert response["result"] == {}
+    assert all(len(states) == 1 for states in chunks)
+    assert [next(iter(states)) for states in chunks] == [
+        "sensor.one",
+        "sensor.one",
+        "sensor.one",
+        "sensor.two",
+        "sensor.two",
+        "sensor.two",
+    ]
+    streamed: dict[str, list[dict]] = {}
+    for states in chunks:
+        for entity_id, entity_states in states.items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+    assert streamed == expected
+
+
+async def test_history_during_period_chunked_waits_for_client(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test chunks are only read once the previous ones have been sent."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(5):
+        hass.states.async_set("sensor.one", str(idx))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    produced = 0
+    drained = 0
+    max_in_flight = 0
+    stream_significant_states = websocket_api._ws_stream_significant_states
+    async_drain = ActiveConnection.async_drain
+
+    def _stream_significant_states(hass, send_chunk, *args):
+        def _send_chunk(chunk: bytes) -> bool:
+            nonlocal produced, max_in_flight
+            result = send_chunk(chunk)
+            produced += 1
+            max_in_flight = max(max_in_flight, produced - drained)
+            return result
+
+        stream_significant_states(hass, _send_chunk, *args)
+
+    async def _async_drain(connection: ActiveConnection) -> None:
+        nonlocal drained
+        await async_drain(connection)
+        drained += 1
+
+    client = await hass_ws_client()
+    with (
+        patch("homeassistant.components.recorder.history.modern.STREAM_CHUNK_SIZE", 1),
+        patch.object(websocket_api, "MAX_CHUNKS_IN_FLIGHT", 1),
+        patch.object(
+            websocket_api,
+            "_ws_stream_significant_states",
+            _stream_significant_states,
+        ),
+        patch.object(ActiveConnection, "async_drain", _async_drain),
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunked": True,
+            }
+        )
+        chunks = 0
+        while (response := await client.receive_json())["type"] == "event":
+            chunks += 1
+
+    assert response["success"]
+    assert chunks == produced == drained == 5
+    assert max_in_flight == 1
+
+
+async def test_history_during_period_chunked_connection_closed(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test chunks are no longer read once the connection is closed."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for idx in range(5):
+        hass.states.async_set("sensor.one", str(idx))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    sent: list[bool] = []
+    finished = hass.loop.create_future()
+    stream_significant_states = websocket_api._ws_stream_significant_states
+
+    def _stream_significant_states(hass, send_chunk, *args):
+        def _send_chunk(chunk: bytes) -> bool:
+            sent.append(send_chunk(chunk))
+            return sent[-1]
+
+        try:
+            stream_significant_states(hass, _send_chunk, *args)
+        finally:
+            hass.loop.call_soon_threadsafe(finished.set_result, None)
+
+    client = await hass_ws_client()
+    with (
+        patch("homeassistant.components.recorder.history.modern.STREAM_CHUNK_SIZE", 1),
+        patch.object(websocket_api, "MAX_CHUNKS_IN_FLIGHT", 1),
+        patch.object(
+            websocket_api,
+            "_ws_stream_significant_states",
+            _stream_significant_states,
+        ),
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunked": True,
+            }
+        )
+        assert (await client.receive_json())["type"] == "event"
+        await client.close()
+        async with asyncio.timeout(5):
+            await finished
+
+    assert sent[-1] is False
+    assert len(sent) < 5
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
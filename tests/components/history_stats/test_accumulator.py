@@ -0,0 +1,141 @@
+"""Test the History stats accumulator."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from homeassistant.components.history_stats.accumulator import (
+    BUCKET_SECONDS,
+    ChangePoint,
+    HistoryStatsAccumulator,
+    accumulate,
+    ceil_bucket,
+    floor_bucket,
+)
+
+START = 1706745600  # 2024-02-01 00:00:00 UTC
+
+# Changes at, within, and across hour boundaries, and hours without a change
+POINTS: list[ChangePoint] = [
+    (START - 1200.0, True),
+    (START + 600.0, False),
+    (START + 3600.0, True),
+    (START + 3601.5, False),
+    (START + 5000.0, True),
+    (START + 12000.0, False),
+    (START + 18000.0, True),
+    (START + 18030.0, False),
+    (START + 21599.0, True),
+]
+
+
+def _window(
+    accumulator: HistoryStatsAccumulator, start: float, end: float
+) -> tuple[float, int]:
+    """Compute a window from the buckets and the change points at its edges."""
+    first_boundary = ceil_bucket(start)
+    last_boundary = floor_bucket(end)
+    if first_boundary > last_boundary:
+        seconds, rises, matched = accumulate(POINTS, start, end, end + 1)
+        return seconds, rises + matched
+    if start < first_boundary:
+        seconds, rises, matched = accumulate(
+            POINTS, start, first_boundary, math.nextafter(first_boundary, math.inf)
+        )
+    else:
+        seconds, rises = 0.0, 0
+        matched = accumulator.matched_at(first_boundary)
+    window_seconds, window_rises = accumulator.window_sum(first_boundary, last_boundary)
+    seconds += window_seconds
+    rises += window_rises
+    if last_boundary < end:
+        end_seconds, end_rises, _ = accumulate(POINTS, last_boundary, end, end + 1)
+        seconds += end_seconds
+        rises += end_rises
+    return seconds, rises + matched
+
+
+@pytest.mark.parametrize("duration", [1800, 3600, 7200, 4 * 3600 + 17])
+@pytest.mark.parametrize("step", [60, 1800, 3600, 5000])
+def test_sliding_window_matches_change_points(duration: int, step: int) -> None:
+    """Test a sliding window sums up like the change points it was built from."""
+    now = START + duration
+    accumulator = HistoryStatsAccumulator()
+    start = floor_bucket(now - duration)
+    accumulator.reset([point for point in POINTS if point[0] <= now], start, now)
+    while now < START + 8 * BUCKET_SECONDS:
+        accumulator.advance(now)
+        seconds, count = _window(accumulator, now - duration, now)
+        expected_seconds, rises, matched = accumulate(
+            POINTS, now - duration, now, now + 1
+        )
+        assert seconds == pytest.approx(expected_seconds)
+        assert count == rises + matched
+        accumulator.drop_before(floor_bucket(now - duration))
+
+        for timestamp, matches in POINTS:
+            if now < timestamp <= now + step:
+                accumulator.add_change(timestamp, matches)
+        now += step
+
+
+def test_buckets_only_for_matched_hours() -> None:
+    """Test hours without a match get no bucket."""
+    accumulator = HistoryStatsAccumulator()
+    accumulator.reset(POINTS[:6], START, START + 5 * BUCKET_SECONDS + 10)
+
+    assert sorted(accumulator.buckets) == [
+        START,
+        START + BUCKET_SECONDS,
+        START + 2 * BUCKET_SECONDS,
+        START + 3 * BUCKET_SECONDS,
+    ]
+    assert accumulator.end == START + 5 * BUCKET_SECONDS
+    assert accumulator.tail == [(START + 12000.0, False)]
+    assert accumulator.matched_at(START)
+    assert not accumulator.matched_at(START + 4 * BUCKET_SECONDS)
+    assert not accumulator.matched_at(START + 5 * BUCKET_SECONDS)
+
+    accumulator.add_change(START + 18030.0, True)
+    accumulator.advance(START + 6 * BUCKET_SECONDS)
+
+    assert sorted(accumulator.buckets)[-1] == START + 5 * BUCKET_SECONDS
+    assert accumulator.matched_at(START + 6 * BUCKET_SECONDS)
+
+
+def test_add_change_keeps_order() -> None:
+    """Test changes are kept sorted, without duplicates and redundant changes."""
+    accumulator = HistoryStatsAccumulator()
+    accumulator.reset([(START + 10.0, True)], START, START + 20)
+
+    accumulator.add_change(START + 30.0, True)
+    accumulator.add_change(START + 40.0, False)
+    accumulator.add_change(START + 20.0, False)
+    accumulator.add_change(START + 40.0, False)
+    accumulator.add_change(START - 10.0, False)
+
+    assert accumulator.tail == [
+        (START + 10.0, True),
+        (START + 20.0, False),
+        (START + 40.0, False),
+    ]
+
+
+def test_restore_from_dict() -> None:
+    """Test an accumulator survives a round trip through its dict."""
+    accumulator = HistoryStatsAccumulator()
+    accumulator.reset(POINTS, START, START + 5 * BUCKET_SECONDS + 10)
+
+    restored = HistoryStatsAccumulator()
+    restored.load_dict(accumulator.as_dict())
+
+    assert restored.start == accumulator.start
+    assert restored.end == accumulator.end
+    assert restored.buckets == accumulator.buckets
+    assert restored.tail == accumulator.tail
+    assert restored.covered_until == accumulator.covered_until
+    assert restored.window_sum(START, restored.end) == accumulator.window_sum(
+        START, accumulator.end
+    )
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+from typing import Any
+from unittest.mock import patch
+
 from homeassistant.components.history_stats.const import (
     CONF_END,
     CONF_START,
     DEFAULT_NAME,
     DOMAIN as HISTORY_STATS_DOMAIN,
 )
+from homeassistant.components.history_stats.data import yaml_storage_key
 from homeassistant.components.recorder import Recorder
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_ENTITY_ID, CONF_NAME, CONF_STATE, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.setup import async_setup_component
 
 from tests.common import MockConfigEntry
 
@@ -28,6 +33,71 @@ async def test_unload_entry(
     assert loaded_entry.state is ConfigEntryState.NOT_LOADED
 
 
+async def test_remove_entry(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    loaded_entry: MockConfigEntry,
+) -> None:
+    """Test removing an entry removes its accumulated history."""
+    hass_storage[f"{HISTORY_STATS_DOMAIN}.{loaded_entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{HISTORY_STATS_DOMAIN}.{loaded_entry.entry_id}",
+        "data": {},
+    }
+
+    assert await hass.config_entries.async_remove(loaded_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert f"{HISTORY_STATS_DOMAIN}.{loaded_entry.entry_id}" not in hass_storage
+
+
+async def test_remove_orphaned_stores(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the accumulated history of removed sensors is removed."""
+    entry = MockConfigEntry(domain=HISTORY_STATS_DOMAIN)
+    entry.add_to_hass(hass)
+    kept = [entry.entry_id, yaml_storage_key("yaml/sensor")]
+    orphaned = [yaml_storage_key("removed"), "raw unique id"]
+    for key in (*kept, *orphaned):
+        hass_storage[f"{HISTORY_STATS_DOMAIN}.{key}"] = {
+            "version": 1,
+            "key": f"{HISTORY_STATS_DOMAIN}.{key}",
+            "data": {},
+        }
+
+    with patch(
+        "homeassistant.components.history_stats.data._list_storage_keys",
+        return_value={*kept, *orphaned},
+    ):
+        assert await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": HISTORY_STATS_DOMAIN,
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "yaml",
+                        "state": "on",
+                        "start": "{{ utcnow().replace(hour=0, minute=0) }}",
+                        "duration": {"hours": 1},
+                        "unique_id": "yaml/sensor",
+                    }
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    for key in kept:
+        assert f"{HISTORY_STATS_DOMAIN}.{key}" in hass_storage
+    for key in orphaned:
+        assert f"{HISTORY_STATS_DOMAIN}.{key}" not in hass_storage
+
+
 async def test_device_cleaning(
     recorder_mock: Recorder,
     hass: HomeAssistant,
@@ -1,6 +1,7 @@
 """The test for the History Statistics sensor platform."""
 
 from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -14,6 +15,7 @@ from homeassistant.components.history_stats.const import (
     DEFAULT_NAME,
     DOMAIN,
 )
+from homeassistant.components.history_stats.data import yaml_storage_key
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
@@ -1263,6 +1265,12 @@ async def test_measure_sliding_window(
     assert hass.states.get("sensor.sensor3").state == "0"
     assert hass.states.get("sensor.sensor4").state == "0.0"
 
+    # Changes after the start are tracked, not queried again
+    for last_changed, state in ((t0, "on"), (t1, "off")):
+        with freeze_time(last_changed):
+            hass.states.async_set("binary_sensor.test_id", state)
+            await hass.async_block_till_done()
+
     past_next_update = start_time + timedelta(minutes=30)
     with (
         patch(
@@ -1364,6 +1372,12 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor3").state == "0"
     assert hass.states.get("sensor.sensor4").state == "0.0"
 
+    # Changes after the start are tracked, not queried again
+    for last_changed, state in ((t0, "on"), (t1, "off")):
+        with freeze_time(last_changed):
+            hass.states.async_set("binary_sensor.test_id", state)
+            await hass.async_block_till_done()
+
     past_next_update = start_time + timedelta(minutes=30)
     with (
         patch(
@@ -1828,7 +1842,107 @@ async def test_history_stats_handles_floored_timestamps(
         await async_update_entity(hass, "sensor.sensor1")
         await hass.async_block_till_done()
 
-    assert last_times == (start_time, start_time + timedelta(hours=2))
+    # Changes are only queried until now, later ones are tracked
+    assert last_times == (start_time, start_time)
+
+
+async def test_restore_accumulated_history(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the accumulated hours are restored and only the gap is queried."""
+    await hass.config.async_set_time_zone("UTC")
+    start_time = dt_util.parse_datetime("2024-02-01 00:00:00+00:00")
+    saved_time = start_time + timedelta(hours=5, minutes=10)
+    startup_time = start_time + timedelta(hours=5, minutes=30)
+    queried = []
+
+    hass_storage[f"{DOMAIN}.{yaml_storage_key('restored_history')}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{yaml_storage_key('restored_history')}",
+        "data": {
+            "entity_id": "binary_sensor.state",
+            "entity_states": ["on"],
+            "accumulator": {
+                "start": int(start_time.timestamp()),
+                "end": int((start_time + timedelta(hours=5)).timestamp()),
+                "buckets": [
+                    [int(start_time.timestamp()), 3600.0, 0, True],
+                    [
+                        int((start_time + timedelta(hours=1)).timestamp()),
+                        1800.0,
+                        0,
+                        True,
+                    ],
+                ],
+                "tail": [[(start_time + timedelta(hours=1.5)).timestamp(), False]],
+                "covered_until": saved_time.timestamp(),
+            },
+        },
+    }
+
+    def _fake_states(
+        hass: HomeAssistant, start: datetime, end: datetime | None, *args, **kwargs
+    ) -> dict[str, list[ha.State]]:
+        queried.append((start, end))
+        turn_on_time = start_time + timedelta(hours=5, minutes=20)
+        return {
+            "binary_sensor.state": [
+                ha.State("binary_sensor.state", "on", last_changed=turn_on_time)
+            ]
+        }
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        _fake_states,
+    ):
+        with freeze_time(startup_time):
+            await async_setup_component(
+                hass,
+                "sensor",
+                {
+                    "sensor": [
+                        {
+                            "platform": "history_stats",
+                            "entity_id": "binary_sensor.state",
+                            "name": "sensor1",
+                            "state": "on",
+                            "start": "{{ utcnow().replace(hour=0, minute=0, second=0) }}",
+                            "end": "{{ utcnow() }}",
+                            "type": "time",
+                            "unique_id": "restored_history",
+                        }
+                    ]
+                },
+            )
+            await hass.async_block_till_done()
+
+        # 1.5h from the buckets and 10min since the state turned on
+        assert 1.666 < float(hass.states.get("sensor.sensor1").state) < 1.667
+        assert queried == [(saved_time, startup_time)]
+
+        next_hour = start_time + timedelta(hours=6)
+        with freeze_time(next_hour):
+            async_fire_time_changed(hass, next_hour)
+            await hass.async_block_till_done()
+
+        assert 2.166 < float(hass.states.get("sensor.sensor1").state) < 2.167
+        assert len(queried) == 1
+
+        with freeze_time(next_hour + timedelta(seconds=11)):
+            async_fire_time_changed(hass, next_hour + timedelta(seconds=11))
+            await hass.async_block_till_done()
+
+    data = hass_storage[f"{DOMAIN}.{yaml_storage_key('restored_history')}"]["data"]
+    assert data["accumulator"]["buckets"][-1] == [
+        int((start_time + timedelta(hours=5)).timestamp()),
+        2400.0,
+        1,
+        False,
+    ]
+    assert data["accumulator"]["end"] == int(next_hour.timestamp())
 
 
 async def test_unique_id(
@@ -3,10 +3,17 @@
 from collections.abc import Generator
 from dataclasses import dataclass
 import datetime
+from functools import partial
 from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
 import logging
+from pathlib import Path
+import threading
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
+from urllib.parse import parse_qs, urlsplit
 
+from influxdb.line_protocol import make_line
 import pytest
 
 from homeassistant.components import influxdb
@@ -15,6 +22,8 @@ from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
 
+from tests.common import get_system_health_info
+
 INFLUX_PATH = "homeassistant.components.influxdb"
 INFLUX_CLIENT_PATH = f"{INFLUX_PATH}.InfluxDBClient"
 BASE_V1_CONFIG = {}
@@ -42,6 +51,14 @@ class FilterTest:
     should_pass: bool
 
 
+@pytest.fixture(autouse=True)
+def mock_spill_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep the spill file out of the test config directory."""
+    monkeypatch.setattr(
+        f"{INFLUX_PATH}.SPILL_FILE", str(tmp_path / influxdb.SPILL_FILE)
+    )
+
+
 @pytest.fixture(autouse=True)
 def mock_batch_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     """Mock the event bus listener and the batch timeout for tests."""
@@ -65,12 +82,44 @@ def mock_client_fixture(
         yield client
 
 
+class LinesMatching:
+    """Match written lines against the points they should encode.
+
+    The timestamps of the lines are not compared. Numeric fields are
+    always written as floats, as they would compare equal in the points.
+    """
+
+    def __init__(self, body: list[dict[str, Any]]) -> None:
+        """Encode the expected points with the client library."""
+        self.expected = [
+            make_line(
+                point["measurement"],
+                point["tags"],
+                {
+                    key: float(value) if type(value) is int else value
+                    for key, value in point["fields"].items()
+                },
+            )
+            for point in body
+        ]
+
+    def __eq__(self, lines: object) -> bool:
+        """Compare lines without their timestamps."""
+        return isinstance(lines, list) and self.expected == [
+            line.rsplit(" ", 1)[0] for line in lines
+        ]
+
+    def __repr__(self) -> str:
+        """Return the expected lines."""
+        return f"LinesMatching({self.expected!r})"
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LinesMatching(body)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,7 +128,9 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        LinesMatching(body), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1377,8 +1428,9 @@ async def test_event_listener_scheduled_write(
         assert mock_sleep.called
     assert write_api.call_count == 2
 
-    # Write works again
+    # Write works again once the retry delay has passed
     write_api.side_effect = None
+    hass.data[influxdb.DOMAIN]._retry_at = 0.0
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         hass.states.async_set("entity.entity_id", "2")
         await hass.async_block_till_done()
@@ -1405,10 +1457,10 @@ async def test_event_listener_scheduled_write(
     ],
     indirect=["mock_client", "get_mock_call"],
 )
-async def test_event_listener_backlog_full(
+async def test_event_listener_backlog_kept(
     hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
 ) -> None:
-    """Test the event listener drops old events when backlog gets full."""
+    """Test the event listener keeps old events when the server is slow."""
     await _setup(hass, mock_client, config_ext, get_write_api)
 
     monotonic_time = 0
@@ -1424,7 +1476,7 @@ async def test_event_listener_backlog_full(
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
 
-        assert get_write_api(mock_client).call_count == 0
+        assert get_write_api(mock_client).call_count == 1
 
 
 @pytest.mark.parametrize(
@@ -1706,3 +1758,308 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+class InfluxAPIStandIn(BaseHTTPRequestHandler):
+    """Stand in for the write API of an InfluxDB server."""
+
+    server: "InfluxServerStandIn"
+
+    def do_POST(self) -> None:
+        """Record the lines of a write request."""
+        url = urlsplit(self.path)
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        self.server.requests += 1
+        self.server.request_received.set()
+        self.server.requests_held.wait()
+        if self.server.status == HTTPStatus.NO_CONTENT and body.strip():
+            self.server.writes.append((parse_qs(url.query), body.splitlines()))
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Do not log requests."""
+
+
+class InfluxServerStandIn(HTTPServer):
+    """Local HTTP server standing in for InfluxDB."""
+
+    def __init__(self) -> None:
+        """Listen on a free port."""
+        super().__init__(("127.0.0.1", 0), InfluxAPIStandIn)
+        self.status = HTTPStatus.NO_CONTENT
+        self.requests = 0
+        self.request_received = threading.Event()
+        self.requests_held = threading.Event()
+        self.requests_held.set()
+        self.writes: list[tuple[dict[str, list[str]], list[str]]] = []
+
+    @property
+    def lines(self) -> list[str]:
+        """Return all lines written so far."""
+        return [line for _, lines in self.writes for line in lines]
+
+
+@pytest.fixture(name="influx_server")
+def influx_server_fixture(socket_enabled: None) -> Generator[InfluxServerStandIn]:
+    """Run a local stand in for the InfluxDB write API."""
+    server = InfluxServerStandIn()
+    thread = threading.Thread(target=server.serve_forever, name="influx_stand_in")
+    thread.start()
+    yield server
+    server.requests_held.set()
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+async def _setup_with_server(
+    hass: HomeAssistant, server: InfluxServerStandIn, config_ext: dict[str, Any]
+) -> influxdb.InfluxThread:
+    """Set up the integration to write to the stand in server."""
+    config = {
+        "influxdb": {"host": "127.0.0.1", "port": server.server_port, **config_ext}
+    }
+    assert await async_setup_component(hass, influxdb.DOMAIN, config)
+    await hass.async_block_till_done()
+    return hass.data[influxdb.DOMAIN]
+
+
+def _expected_line(
+    hass: HomeAssistant, entity_id: str, fields: dict[str, Any], precision=None
+) -> str:
+    """Encode the line expected for the current state of an entity."""
+    state = hass.states.get(entity_id)
+    time_fired = state.last_updated.replace(tzinfo=datetime.UTC)
+    microseconds = (
+        time_fired - datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+    ) // datetime.timedelta(microseconds=1)
+    timestamp = (
+        microseconds * 1000 // influxdb.line_protocol.PRECISION_DIVISORS[precision]
+    )
+    return make_line(
+        state.attributes.get("unit_of_measurement", entity_id),
+        {"domain": state.domain, "entity_id": state.object_id},
+        fields,
+        time=timestamp,
+    )
+
+
+@pytest.mark.parametrize("precision", [None, "ms", "s"])
+async def test_write_lines_to_server(
+    hass: HomeAssistant, influx_server: InfluxServerStandIn, precision: str | None
+) -> None:
+    """Test events are written as lines to the InfluxDB API."""
+    config_ext = {"precision": precision} if precision else {}
+    await _setup_with_server(hass, influx_server, config_ext)
+
+    hass.states.async_set("sensor.temperature", "21.5", {"unit_of_measurement": "°C"})
+    hass.states.async_set(
+        "fake.entity_id",
+        "on",
+        {"friendly_name": 'My "quoted", spaced=name', "weight": "12kg"},
+    )
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    assert influx_server.lines == [
+        _expected_line(hass, "sensor.temperature", {"value": 21.5}, precision),
+        _expected_line(
+            hass,
+            "fake.entity_id",
+            {
+                "state": "on",
+                "value": 1.0,
+                "friendly_name_str": 'My "quoted", spaced=name',
+                "weight": 12.0,
+                "weight_str": "12kg",
+            },
+            precision,
+        ),
+    ]
+    params = influx_server.writes[-1][0]
+    assert params["db"] == ["home_assistant"]
+    assert params.get("precision") == ([precision] if precision else None)
+
+
+async def test_write_backlog_in_larger_batches(
+    hass: HomeAssistant, influx_server: InfluxServerStandIn
+) -> None:
+    """Test the batch size grows while there is a backlog."""
+    instance = await _setup_with_server(hass, influx_server, {})
+    assert await async_setup_component(hass, "system_health", {})
+    influx_server.requests_held.clear()
+    influx_server.request_received.clear()
+
+    hass.states.async_set("fake.first", 0)
+    await hass.async_block_till_done()
+    # Hold the first write so the other events back up
+    await hass.async_add_executor_job(influx_server.request_received.wait)
+    for value in range(1000):
+        hass.states.async_set("fake.entity_id", value)
+    await hass.async_block_till_done()
+
+    info = await get_system_health_info(hass, influxdb.DOMAIN)
+    assert info["queue_depth"] == 1000
+    assert info["batch_size"] == influxdb.BATCH_BUFFER_SIZE
+
+    influx_server.requests_held.set()
+    while len(influx_server.lines) < 1001:
+        await async_wait_for_queue_to_process(hass)
+
+    assert instance.batch_size > influxdb.BATCH_BUFFER_SIZE
+    assert len(influx_server.writes) < 1001 / influxdb.BATCH_BUFFER_SIZE
+    assert instance.points_written == 1001
+    info = await get_system_health_info(hass, influxdb.DOMAIN)
+    assert info == {
+        "queue_depth": 0,
+        "spilled_events": 0,
+        "dropped_events": 0,
+        "events_per_second": round(1001 / influxdb.POINTS_RATE_WINDOW, 1),
+        "batch_size": instance.batch_size,
+    }
+
+
+async def test_outage_spills_to_disk(
+    hass: HomeAssistant, influx_server: InfluxServerStandIn, tmp_path: Path
+) -> None:
+    """Test events are spilled to disk while the server is down."""
+    with patch(
+        f"{INFLUX_PATH}.PointSpool",
+        partial(influxdb.PointSpool, max_memory_points=2),
+    ):
+        instance = await _setup_with_server(hass, influx_server, {})
+    influx_server.status = HTTPStatus.INTERNAL_SERVER_ERROR
+    requests = influx_server.requests
+
+    with patch(f"{INFLUX_PATH}.time.sleep"):
+        for value in range(5):
+            hass.states.async_set("fake.entity_id", value)
+            await hass.async_block_till_done()
+            await async_wait_for_queue_to_process(hass)
+
+    assert influx_server.lines == []
+    # New events are not written before the retry delay has passed
+    assert influx_server.requests == requests + 1
+    assert instance.queue_depth == 5
+    assert instance.spool.spilled == 3
+    spill_path = tmp_path / influxdb.SPILL_FILE
+    assert len(spill_path.read_text().splitlines()) == 3
+
+    influx_server.status = HTTPStatus.NO_CONTENT
+    # Skip the rest of the retry delay
+    instance._retry_at = 0.0
+    hass.states.async_set("fake.entity_id", 5)
+    await hass.async_block_till_done()
+    while len(influx_server.lines) < 6:
+        await async_wait_for_queue_to_process(hass)
+
+    assert sorted(line.split(" ")[1] for line in influx_server.lines) == [
+        f"value={float(value)}" for value in range(6)
+    ]
+    assert instance.queue_depth == 0
+    assert not spill_path.exists()
+
+
+async def test_outage_spools_events_while_retrying(
+    hass: HomeAssistant, influx_server: InfluxServerStandIn
+) -> None:
+    """Test events queued while a write is retried are moved to the spool."""
+    instance = await _setup_with_server(hass, influx_server, {"max_retries": 2})
+    write_started = threading.Event()
+    write_held = threading.Event()
+    queued: list[int] = []
+
+    def _write(lines: list[str]) -> None:
+        queued.append(instance.queue.qsize())
+        if len(queued) == 1:
+            write_started.set()
+            write_held.wait()
+        raise ConnectionError("unavailable")
+
+    instance.influx.write = _write
+    with patch(f"{INFLUX_PATH}.time.sleep"):
+        hass.states.async_set("fake.first", 0)
+        await hass.async_block_till_done()
+        await hass.async_add_executor_job(write_started.wait)
+        for value in range(10):
+            hass.states.async_set("fake.entity_id", value)
+        await hass.async_block_till_done()
+        write_held.set()
+        await async_wait_for_queue_to_process(hass)
+
+    # The first write was tried before the other events were queued
+    assert queued == [0, 0, 0]
+    assert instance.queue.qsize() == 0
+    assert instance.queue_depth == 11
+
+
+def test_spool_restart_after_partial_drain(tmp_path: Path) -> None:
+    """Test spilled lines which were read are not read again after a restart."""
+    path = str(tmp_path / influxdb.SPILL_FILE)
+    spool = influxdb.PointSpool(path, max_memory_points=0)
+    spool.append(f"line{idx}" for idx in range(5))
+    assert spool.spilled == 5
+    assert spool.pop_batch(2) == ["line0", "line1"]
+    spool.append(["line5"])
+    spool.close()
+
+    spool = influxdb.PointSpool(path, max_memory_points=0)
+    spool.load()
+    assert len(spool) == 4
+    assert spool.pop_batch(1) == ["line2"]
+    spool.close()
+
+    spool = influxdb.PointSpool(path, max_memory_points=0)
+    spool.load()
+    assert len(spool) == 3
+    assert spool.pop_batch(10) == ["line3", "line4", "line5"]
+    assert not (tmp_path / influxdb.SPILL_FILE).exists()
+    assert not (tmp_path / f"{influxdb.SPILL_FILE}.offset").exists()
+
+    # An offset left behind does not apply to a new spill file
+    (tmp_path / f"{influxdb.SPILL_FILE}.offset").write_text("6")
+    spool = influxdb.PointSpool(path, max_memory_points=0)
+    spool.load()
+    assert not (tmp_path / f"{influxdb.SPILL_FILE}.offset").exists()
+    spool.append(["line6"])
+    spool.close()
+    spool = influxdb.PointSpool(path)
+    spool.load()
+    assert spool.pop_batch(10) == ["line6"]
+
+
+async def test_spilled_events_written_after_restart(
+    hass: HomeAssistant, influx_server: InfluxServerStandIn, tmp_path: Path
+) -> None:
+    """Test events which could not be written are kept over a restart."""
+    spill_path = tmp_path / influxdb.SPILL_FILE
+    spill_path.write_text(
+        "fake.entity_id,domain=fake,entity_id=entity_id value=1.0 1000\n"
+        "fake.entity_id,domain=fake,entity_id=entity_id value=2.0 2000\n"
+    )
+    await _setup_with_server(hass, influx_server, {})
+
+    hass.states.async_set("fake.entity_id", 3)
+    await hass.async_block_till_done()
+    while len(influx_server.lines) < 3:
+        await async_wait_for_queue_to_process(hass)
+
+    assert influx_server.lines[:2] == [
+        "fake.entity_id,domain=fake,entity_id=entity_id value=1.0 1000",
+        "fake.entity_id,domain=fake,entity_id=entity_id value=2.0 2000",
+    ]
+    assert not spill_path.exists()
+
+    influx_server.status = HTTPStatus.INTERNAL_SERVER_ERROR
+    hass.states.async_set("fake.entity_id", 4)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    await hass.async_stop()
+
+    assert spill_path.read_text().splitlines() == [
+        _expected_line(hass, "fake.entity_id", {"value": 4.0})
+    ]
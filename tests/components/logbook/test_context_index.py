@@ -0,0 +1,145 @@
+"""The tests for the logbook context index."""
+
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components import logbook
+from homeassistant.components.logbook.context_index import LogbookContextIndex
+from homeassistant.components.logbook.queries.contexts import context_rows_stmt
+from homeassistant.components.recorder import Recorder
+from homeassistant.const import (
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    ATTR_SERVICE,
+    EVENT_CALL_SERVICE,
+    STATE_OFF,
+    STATE_ON,
+)
+import homeassistant.core as ha
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
+
+from .common import MockRow
+
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import ClientSessionGenerator
+
+
+@pytest.fixture
+async def hass_(recorder_mock: Recorder, hass: HomeAssistant) -> HomeAssistant:
+    """Set up the logbook and wait for the context index to be warmed."""
+    assert await async_setup_component(hass, logbook.DOMAIN, {})
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert hass.data[logbook.DOMAIN].context_index.ready
+    return hass
+
+
+async def _async_turn_off_light(hass: HomeAssistant, context: ha.Context) -> None:
+    """Turn off a light with a service call in context."""
+    hass.states.async_set("light.kitchen", STATE_ON)
+    await hass.async_block_till_done()
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {
+            ATTR_DOMAIN: "light",
+            ATTR_SERVICE: "turn_off",
+            ATTR_ENTITY_ID: "light.kitchen",
+        },
+        context=context,
+    )
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    await async_wait_recording_done(hass)
+
+
+async def _async_get_light_logbook(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> list[dict]:
+    """Get the logbook of the light for the last hour."""
+    client = await hass_client()
+    start_time = dt_util.utcnow() - timedelta(hours=1)
+    response = await client.get(
+        f"/api/logbook/{start_time.isoformat()}",
+        params={"entity": "light.kitchen"},
+    )
+    assert response.status == HTTPStatus.OK
+    return await response.json()
+
+
+async def test_entity_context_from_index(
+    hass_: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test contexts of entity rows are linked without querying the database."""
+    context = ha.Context(user_id="9400facee45711eaa9308bfd3d19e474")
+    await _async_turn_off_light(hass_, context)
+
+    with patch(
+        "homeassistant.components.logbook.context_index.context_rows_stmt",
+        wraps=context_rows_stmt,
+    ) as context_rows_stmt_mock:
+        entries = await _async_get_light_logbook(hass_, hass_client)
+
+    assert context_rows_stmt_mock.call_count == 0
+    assert len(entries) == 1
+    assert entries[0]["entity_id"] == "light.kitchen"
+    assert entries[0]["state"] == STATE_OFF
+    assert entries[0]["context_event_type"] == EVENT_CALL_SERVICE
+    assert entries[0]["context_domain"] == "light"
+    assert entries[0]["context_service"] == "turn_off"
+    assert entries[0]["context_user_id"] == "9400facee45711eaa9308bfd3d19e474"
+
+
+async def test_entity_context_outside_index(
+    hass_: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test contexts created before the index covers them are queried."""
+    context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVBFC",
+        user_id="9400facee45711eaa9308bfd3d19e474",
+    )
+    await _async_turn_off_light(hass_, context)
+
+    with patch(
+        "homeassistant.components.logbook.context_index.context_rows_stmt",
+        wraps=context_rows_stmt,
+    ) as context_rows_stmt_mock:
+        entries = await _async_get_light_logbook(hass_, hass_client)
+
+    assert context_rows_stmt_mock.call_count == 1
+    assert len(entries) == 1
+    assert entries[0]["entity_id"] == "light.kitchen"
+    assert entries[0]["context_event_type"] == EVENT_CALL_SERVICE
+    assert entries[0]["context_domain"] == "light"
+    assert entries[0]["context_service"] == "turn_off"
+
+
+async def test_context_index_eviction() -> None:
+    """Test evicting contexts stops the index from covering older contexts."""
+    index = LogbookContextIndex(max_size=2)
+    contexts = [
+        ha.Context(ulid_at_time(timestamp)) for timestamp in (1000.0, 2000.0, 3000.0)
+    ]
+    rows: list[MockRow] = []
+    for timestamp, context in zip((1000.0, 2000.0, 3000.0), contexts, strict=True):
+        row = MockRow(EVENT_CALL_SERVICE, context=context)
+        row.time_fired_ts = timestamp
+        rows.append(row)
+
+    assert index.get(rows[2].context_id_bin) is None
+    index.async_load(0.0, rows)
+
+    assert len(index) == 2
+    assert index.get(rows[0].context_id_bin) is None
+    assert index.get(rows[1].context_id_bin) is rows[1]
+    assert index.get(rows[2].context_id_bin) is rows[2]
+    assert index.get(ulid_to_bytes(ulid_at_time(500.0))) is None
+
+    older_row = MockRow(EVENT_CALL_SERVICE, context=contexts[2])
+    older_row.time_fired_ts = 2500.0
+    index.async_load(0.0, [older_row])
+    assert index.get(rows[2].context_id_bin) is older_row
@@ -13,7 +13,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    WildcardSubscriptionIndex,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -633,6 +637,37 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+def test_wildcard_subscription_index() -> None:
+    """Test matching and removing subscriptions in the wildcard index."""
+    job = Mock()
+    index = WildcardSubscriptionIndex()
+    subtree = Subscription("test/#", False, job)
+    level = Subscription("test/+/state", False, job)
+    root_level = Subscription("+/+/state", False, job)
+    index.add(subtree)
+    index.add(level)
+    index.add(root_level)
+
+    assert list(index) == [subtree, level, root_level]
+    assert index.match("test") == [subtree]
+    assert index.match("test/light/state") == [subtree, level, root_level]
+    assert index.match("other/light/state") == [root_level]
+    assert index.match("test/light/state/extra") == [subtree]
+    assert index.match("$test/light/state") == []
+
+    index.remove(level)
+    assert level not in index
+    assert index.match("test/light/state") == [subtree, root_level]
+
+    index.remove(subtree)
+    index.remove(root_level)
+    assert len(index) == 0
+    assert index.match("test/light/state") == []
+
+    with pytest.raises(KeyError):
+        index.remove(subtree)
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 import datetime
+import gzip
 from http import HTTPStatus
 from typing import Any, Self
 from unittest import mock
@@ -53,6 +54,8 @@ from homeassistant.components.fan import (
 )
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES
 from homeassistant.components.lock import LockState
+from homeassistant.components.prometheus import exposition
+from homeassistant.components.prometheus.exposition import ExpositionCache, accepts_gzip
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
@@ -532,6 +535,191 @@ async def test_setup_enumeration(
     ).withValue(state).assert_in_metrics(body)
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_exposition_cached(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test series are only rendered again when their entity changes."""
+    with (
+        mock.patch.object(
+            prometheus_client,
+            "generate_latest",
+            wraps=prometheus_client.generate_latest,
+        ) as generate_latest_mock,
+        mock.patch.object(
+            exposition, "_render_samples", wraps=exposition._render_samples
+        ) as render_samples_mock,
+    ):
+        await generate_latest_metrics(client)
+
+        generate_latest_mock.reset_mock()
+        render_samples_mock.reset_mock()
+        await generate_latest_metrics(client)
+        # Only the default registry is rendered
+        assert generate_latest_mock.call_count == 1
+        assert render_samples_mock.call_count == 0
+
+        set_state_with_entry(
+            hass,
+            sensor_entities["sensor_1"],
+            16.1,
+            sensor_entities["sensor_1_attributes"],
+        )
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+        assert render_samples_mock.call_count > 1
+        assert {
+            sample.labels["entity"]
+            for call in render_samples_mock.call_args_list
+            for sample in call.args[1]
+        } == {"sensor.outside_temperature"}
+
+    EntityMetric(
+        metric_name="sensor_temperature_celsius",
+        domain="sensor",
+        friendly_name="Outside Temperature",
+        entity="sensor.outside_temperature",
+    ).withValue(16.1).assert_in_metrics(body)
+    EntityMetric(
+        metric_name="sensor_humidity_percent",
+        domain="sensor",
+        friendly_name="Outside Humidity",
+        entity="sensor.outside_humidity",
+    ).withValue(54.0).assert_in_metrics(body)
+
+
+@pytest.mark.parametrize("namespace", [""])
+@pytest.mark.parametrize(
+    "accept_encoding", ["identity", "gzip;q=0", "deflate, gzip; q=0.0", "br, *;q=0"]
+)
+async def test_view_uncompressed(
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+    accept_encoding: str,
+) -> None:
+    """Test prometheus metrics view without gzip compression."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": accept_encoding}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    body = (await resp.text()).split("\n")
+
+    assert "# HELP python_info Python platform information" in body
+    EntityMetric(
+        metric_name="sensor_humidity_percent",
+        domain="sensor",
+        friendly_name="Outside Humidity",
+        entity="sensor.outside_humidity",
+    ).withValue(54.0).assert_in_metrics(body)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("", False),
+        ("gzip", True),
+        ("GZIP;q=0.5", True),
+        ("deflate, gzip;q=1.0, br", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.000", False),
+        ("gzip;q=invalid", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+        ("identity, *;q=0.1", True),
+    ],
+)
+def test_accepts_gzip(accept_encoding: str, expected: bool) -> None:
+    """Test the q-values of the Accept-Encoding header are respected."""
+    assert accepts_gzip(accept_encoding) is expected
+
+
+def test_exposition_cache_gzip() -> None:
+    """Test the compressed exposition joins the cached and default metrics."""
+    registry = prometheus_client.CollectorRegistry()
+    gauge = prometheus_client.Gauge(
+        "test_gauge", "Test gauge", ["entity"], registry=registry
+    )
+    gauge.labels(entity="sensor.test").set(1.5)
+    default_registry = prometheus_client.CollectorRegistry()
+    default_gauge = prometheus_client.Gauge(
+        "default_gauge", "Default gauge", registry=default_registry
+    )
+    cache = ExpositionCache()
+
+    with mock.patch.object(prometheus_client, "REGISTRY", default_registry):
+        body = cache.generate_latest({"test_gauge": gauge})
+        assert b'test_gauge{entity="sensor.test"} 1.5' in body
+        assert b"default_gauge 0.0" in body
+        assert (
+            gzip.decompress(cache.generate_latest({"test_gauge": gauge}, True)) == body
+        )
+
+        gauge.labels(entity="sensor.test").set(2.5)
+        default_gauge.set(3.0)
+        # The family has not been marked dirty yet
+        body = cache.generate_latest({"test_gauge": gauge})
+        assert b'test_gauge{entity="sensor.test"} 1.5' in body
+        assert b"default_gauge 3.0" in body
+        assert (
+            gzip.decompress(cache.generate_latest({"test_gauge": gauge}, True)) == body
+        )
+
+        cache.mark_dirty("sensor.test", ["test_gauge"])
+        body = cache.generate_latest({"test_gauge": gauge})
+        assert b'test_gauge{entity="sensor.test"} 2.5' in body
+        assert (
+            gzip.decompress(cache.generate_latest({"test_gauge": gauge}, True)) == body
+        )
+
+
+def test_exposition_cache_entities() -> None:
+    """Test the series of each entity are kept until it is marked dirty."""
+    registry = prometheus_client.CollectorRegistry()
+    counter = prometheus_client.Counter(
+        "test_counter", "Test counter", ["entity", "mode"], registry=registry
+    )
+    counter.labels(entity="sensor.one", mode="a").inc()
+    counter.labels(entity="sensor.two", mode="a").inc(2)
+    counter.labels(entity="sensor.one", mode="b").inc(3)
+    cache = ExpositionCache()
+
+    with mock.patch.object(
+        prometheus_client, "REGISTRY", prometheus_client.CollectorRegistry()
+    ):
+        body = cache.generate_latest({"test_counter": counter})
+        # The same lines as the whole family, sections in the same order
+        assert sorted(body.splitlines()) == sorted(
+            prometheus_client.generate_latest(registry).splitlines()
+        )
+        assert [line for line in body.splitlines() if line.startswith(b"#")] == [
+            line
+            for line in prometheus_client.generate_latest(registry).splitlines()
+            if line.startswith(b"#")
+        ]
+
+        counter.labels(entity="sensor.one", mode="a").inc()
+        counter.labels(entity="sensor.two", mode="a").inc()
+        counter.remove("sensor.one", "b")
+        cache.mark_dirty("sensor.one", ["test_counter"])
+        body = cache.generate_latest({"test_counter": counter})
+        assert b'test_counter_total{entity="sensor.one",mode="a"} 2.0' in body
+        assert b'mode="b"' not in body
+        # Not marked dirty yet
+        assert b'test_counter_total{entity="sensor.two",mode="a"} 2.0' in body
+
+        counter.remove("sensor.two", "a")
+        cache.mark_dirty("sensor.two", ["test_counter"])
+        body = cache.generate_latest({"test_counter": counter})
+        assert b"sensor.two" not in body
+        assert sorted(body.splitlines()) == sorted(
+            prometheus_client.generate_latest(registry).splitlines()
+        )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_view_empty_namespace(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -18,10 +18,17 @@ from homeassistant.components.recorder.db_schema import (
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models import (
+    EntityStateColumns,
+    process_timestamp,
+)
 from homeassistant.components.recorder.util import session_scope
+from homeassistant.components.sensor.recorder import (
+    _entity_history_to_float_and_state,
+    _FloatStateColumns,
+)
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -512,6 +519,36 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+async def test_get_significant_states_columns(hass: HomeAssistant) -> None:
+    """Test the columnar result matches the compressed minimal response."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    # Request the entities in a different order than they were recorded
+    entity_ids = sorted(states, reverse=True)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids=entity_ids,
+        minimal_response=True,
+        compressed_state_format=True,
+    )
+    columns = history.get_significant_states_columns(
+        hass, zero, four, entity_ids=entity_ids
+    )
+
+    assert list(columns.entities) == [
+        entity_id for entity_id in entity_ids if entity_id in hist
+    ]
+    assert list(columns.as_compressed_states()) == list(hist)
+
+    assert isinstance(columns.entities["media_player.test"], EntityStateColumns)
+    assert isinstance(columns.entities["thermostat.test"], list)
+    assert columns.as_compressed_states() == hist
+    assert json.loads(columns.as_json()) == json.loads(json_bytes(hist))
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
@@ -1014,3 +1051,83 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+def _row_time_weighted_average(
+    fstates: list[tuple[float, State]], start: datetime, end: datetime
+) -> float:
+    """Calculate a time weighted average from the states one row at a time."""
+    old_fstate: float | None = None
+    old_start_time: datetime | None = None
+    accumulated = 0.0
+
+    for fstate, state in fstates:
+        start_time = max(state.last_updated, start)
+        if old_start_time is None:
+            start = start_time
+        else:
+            accumulated += old_fstate * (start_time - old_start_time).total_seconds()
+        old_fstate = fstate
+        old_start_time = start_time
+
+    accumulated += old_fstate * (end - old_start_time).total_seconds()
+    if (period_seconds := (end - start).total_seconds()) == 0:
+        return 0.0
+    return accumulated / period_seconds
+
+
+async def test_float_state_columns_match_rows(hass: HomeAssistant) -> None:
+    """Test sensor statistics over columns match the ones over history rows."""
+    start = dt_util.utcnow().replace(microsecond=0) - timedelta(minutes=10)
+    end = start + timedelta(minutes=5)
+    states = {
+        # The first state is before the start of the period
+        "sensor.numeric": ["1", "2.5", "-3", "4", "1e3"],
+        "sensor.mixed": ["10", "abc", "unavailable", "null", "20.5", "unknown"],
+        "sensor.not_numeric": ["unavailable", "null", "abc"],
+        "sensor.last": ["unknown", "7.25"],
+    }
+    with freeze_time(start - timedelta(seconds=30)) as freezer:
+        for idx in range(6):
+            for entity_id, entity_states in states.items():
+                if idx < len(entity_states):
+                    hass.states.async_set(entity_id, entity_states[idx])
+            freezer.tick(timedelta(seconds=47, microseconds=123457))
+    await async_wait_recording_done(hass)
+
+    def _set_null_states() -> None:
+        with session_scope(hass=hass) as session:
+            session.query(States).filter(States.state == "null").update(
+                {States.state: None}
+            )
+
+    await recorder.get_instance(hass).async_add_executor_job(_set_null_states)
+
+    hist = history.get_significant_states(
+        hass, start, end, list(states), significant_changes_only=False
+    )
+    assert [state.state for state in hist["sensor.mixed"]] == [
+        "10",
+        "abc",
+        "unavailable",
+        "",
+        "20.5",
+        "unknown",
+    ]
+
+    columns = _FloatStateColumns()
+    float_states = {}
+    for entity_id, entity_history in hist.items():
+        if fstates := _entity_history_to_float_and_state(entity_history):
+            float_states[entity_id] = fstates
+            columns.add(entity_id, fstates)
+    assert set(float_states) == {"sensor.numeric", "sensor.mixed", "sensor.last"}
+
+    averages = columns.time_weighted_averages(start, end)
+    assert set(averages) == set(float_states)
+    for entity_id, fstates in float_states.items():
+        assert averages[entity_id] == pytest.approx(
+            _row_time_weighted_average(fstates, start, end), rel=1e-12
+        )
+        assert columns.min(entity_id) == min(fstate for fstate, _ in fstates)
+        assert columns.max(entity_id) == max(fstate for fstate, _ in fstates)
@@ -395,11 +395,11 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance._pending_states or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -438,11 +438,11 @@ async def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        instance = get_instance(hass)
+        if instance._pending_states or any(
+            isinstance(obj, States) for obj in instance.event_session
+        ):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1473,6 +1473,41 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_sets_old_state_inside_commit_interval(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert_states: bool
+) -> None:
+    """Test saving sets old state for many changes inside the commit interval."""
+    instance = get_instance(hass)
+    with patch.object(instance, "_bulk_insert_states", bulk_insert_states):
+        for state in ("s1", "s2", "s3", "s4"):
+            hass.states.async_set("test.one", state, {})
+        hass.bus.async_fire("this_event", {"de": "dupe"})
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert all(state.entity_id == "test.one" for state in states)
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+
+        events = list(
+            session.query(Events).filter(
+                Events.event_type_id.in_(select_event_type_ids(("this_event",)))
+            )
+        )
+        assert len(events) == 1
+        assert events[0].data_id is not None
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -4,6 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -26,6 +27,12 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge_progress import (
+    MIN_PURGE_BATCH_SIZE,
+    PURGE_TARGET_BATCH_TIME,
+    STORAGE_KEY as PURGE_PROGRESS_STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -45,6 +52,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -223,6 +231,133 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_time_budget(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge stops starting new batches once its time budget is spent."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = recorder_mock.purge_progress
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 1),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 1),
+    ):
+        finished = purge_old_data(
+            recorder_mock, purge_before, repack=False, time_budget=0
+        )
+        assert not finished
+        assert progress.states == 1
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 5
+
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert finished
+        assert progress.states == 4
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        assert session.query(StateAttributes).count() == 1
+    assert progress.state_attributes == 2
+
+
+async def test_purge_progress_batch_size(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the purge batch size adapts to the time a batch takes."""
+    progress = recorder_mock.purge_progress
+    assert progress.next_batch_size(1000) == 1000
+
+    progress.adjust_batch_size(1000, PURGE_TARGET_BATCH_TIME * 2, 1000)
+    assert progress.next_batch_size(1000) == 500
+    progress.adjust_batch_size(500, PURGE_TARGET_BATCH_TIME * 0.75, 1000)
+    assert progress.next_batch_size(1000) == 500
+    assert progress.next_batch_size(100) == 100
+
+    for _ in range(10):
+        progress.adjust_batch_size(
+            progress.next_batch_size(1000), PURGE_TARGET_BATCH_TIME * 2, 1000
+        )
+    assert progress.next_batch_size(1000) == MIN_PURGE_BATCH_SIZE
+
+    for _ in range(10):
+        progress.adjust_batch_size(progress.next_batch_size(1000), 0, 1000)
+    assert progress.batch_size is None
+    assert progress.next_batch_size(2000) == 2000
+
+
+async def test_purge_task_tracks_progress(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_storage: dict[str, Any]
+) -> None:
+    """Test purge runs are tracked and the progress is persisted."""
+    await _add_test_states(hass)
+    progress = recorder_mock.purge_progress
+    assert not progress.in_progress
+    assert progress.rows_per_second is None
+
+    await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+    await hass.async_block_till_done()
+    await async_wait_purge_done(hass)
+
+    assert not progress.in_progress
+    assert progress.finished is not None
+    assert progress.runs >= 1
+    assert progress.states == 4
+    assert progress.rows_per_second is not None
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    data = hass_storage[PURGE_PROGRESS_STORAGE_KEY]["data"]
+    assert data["finished"] is not None
+    assert data["states"] == 4
+
+
+@pytest.fixture
+def unfinished_purge(hass_storage: dict[str, Any]) -> None:
+    """Store the progress of a purge interrupted by a restart."""
+    hass_storage[PURGE_PROGRESS_STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": PURGE_PROGRESS_STORAGE_KEY,
+        "data": {
+            "purge_before": "2020-01-01T00:00:00+00:00",
+            "repack": False,
+            "apply_filter": False,
+            "started": "2020-01-02T00:00:00+00:00",
+            "finished": None,
+            "runs": 3,
+            "elapsed": 3.0,
+            "states": 3000,
+            "events": 0,
+            "state_attributes": 10,
+            "event_data": 0,
+            "batch_size": 256,
+            "rows_per_second": 1003.3,
+        },
+    }
+
+
+@pytest.mark.usefixtures("unfinished_purge")
+async def test_purge_resumed_after_restart(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test an unfinished purge is resumed when the recorder starts."""
+    await async_wait_purge_done(hass)
+
+    progress = recorder_mock.purge_progress
+    assert not progress.in_progress
+    assert progress.purge_before == datetime(2020, 1, 1, tzinfo=dt_util.UTC)
+    assert progress.started == datetime(2020, 1, 2, tzinfo=dt_util.UTC)
+    assert progress.finished is not None
+    assert progress.runs == 4
+    assert progress.states == 3000
+    assert progress.batch_size == 256
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
@@ -17,6 +17,8 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     PlatformCompiledStatistics,
+    ShortTermStatisticsRunCache,
+    _compile_hourly_statistics_from_periods,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
     _generate_statistics_during_period_stmt,
@@ -352,6 +354,59 @@ def mock_from_stats():
         yield
 
 
+def test_compile_hourly_statistics_from_run_cache() -> None:
+    """Test summarizing the hour from the 5-minute periods in the run cache."""
+    run_cache = ShortTermStatisticsRunCache()
+    hour_start_ts = dt_util.parse_datetime("2022-10-01 00:00:00+00:00").timestamp()
+    last_reset_ts = hour_start_ts - 3600
+
+    for idx in range(12):
+        period_stats = {1: {"mean": idx, "min": idx - 1, "max": idx + 1}}
+        if idx < 6:
+            period_stats[2] = {
+                "last_reset_ts": last_reset_ts,
+                "state": idx,
+                "sum": idx * 10,
+            }
+        run_cache.add_period(hour_start_ts + idx * 300, period_stats)
+        if idx < 11:
+            assert run_cache.get_hour_periods(hour_start_ts) is None
+
+    periods = run_cache.get_hour_periods(hour_start_ts)
+    assert periods is not None
+    assert _compile_hourly_statistics_from_periods(periods, hour_start_ts) == {
+        1: {
+            "start_ts": hour_start_ts,
+            "mean": 5.5,
+            "min": -1,
+            "max": 12,
+            "last_reset_ts": None,
+            "state": None,
+            "sum": None,
+        },
+        2: {
+            "start_ts": hour_start_ts,
+            "mean": None,
+            "min": None,
+            "max": None,
+            "last_reset_ts": last_reset_ts,
+            "state": 5,
+            "sum": 50,
+        },
+    }
+
+    # Periods of the previous hour are dropped when the next hour starts
+    run_cache.add_period(hour_start_ts + 3600, {})
+    assert run_cache.get_hour_periods(hour_start_ts) is None
+    assert run_cache.get_hour_periods(hour_start_ts + 3600) is None
+
+    run_cache.discard_hour_periods()
+    for idx in range(12):
+        run_cache.add_period(hour_start_ts + idx * 300, {})
+    run_cache.discard_hour_periods()
+    assert run_cache.get_hour_periods(hour_start_ts) is None
+
+
 async def test_compile_periodic_statistics_exception(
     hass: HomeAssistant, setup_recorder: None, mock_sensor_statistics, mock_from_stats
 ) -> None:
@@ -8,6 +8,7 @@ from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -38,6 +39,26 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_purge(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health includes the progress of the last purge."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    progress = get_instance(hass).purge_progress
+    progress.start(dt_util.utcnow(), False, False)
+    progress.states = 900
+    progress.state_attributes = 100
+    progress.run_finished(2.0, False)
+
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_in_progress"] is True
+    assert info["purge_rows_purged"] == 1000
+    assert info["purge_rows_per_second"] == "500"
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -40,7 +40,7 @@ from .common import (
 )
 from .conftest import InstrumentedMigration
 
-from tests.common import async_fire_time_changed
+from tests.common import MockUser, async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator, WebSocketGenerator
 
 
@@ -2565,6 +2565,59 @@ async def test_recorder_info(
     }
 
 
+async def test_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the last purge."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["started"] is None
+    assert response["result"]["rows_per_second"] is None
+
+    await hass.services.async_call(recorder.DOMAIN, "purge", {"keep_days": 0})
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "purge_before": ANY,
+        "repack": False,
+        "apply_filter": False,
+        "started": ANY,
+        "finished": ANY,
+        "runs": 1,
+        "elapsed": ANY,
+        "states": ANY,
+        "events": ANY,
+        "state_attributes": ANY,
+        "event_data": ANY,
+        "batch_size": None,
+        "rows_per_second": ANY,
+    }
+    assert response["result"]["finished"] is not None
+
+
+async def test_purge_progress_non_admin(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the progress of the last purge requires an admin."""
+    hass_admin_user.groups = []
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -1647,6 +1647,44 @@ async def test_blueprint_script(hass: HomeAssistant, calls: list[ServiceCall]) -
     ]
 
 
+async def test_blueprint_script_referenced_variables(
+    hass: HomeAssistant, calls: list[ServiceCall], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test blueprint scripts only render the variables they read."""
+    assert await async_setup_component(
+        hass,
+        script.DOMAIN,
+        {
+            script.DOMAIN: {
+                "test_script": {
+                    "use_blueprint": {
+                        "path": "test_service.yaml",
+                        "input": {
+                            "service_to_call": "test.script",
+                        },
+                    },
+                    "variables": {
+                        "used": "{{ value }}",
+                        "unused": "{{ break + 1 }}",
+                    },
+                    "sequence": {
+                        "action": "test.script",
+                        "data": {"value": "{{ used }}"},
+                    },
+                }
+            }
+        },
+    )
+
+    # A broken template in a variable nothing reads does not abort the run
+    await hass.services.async_call(
+        "script", "test_script", {"value": "rendered"}, blocking=True
+    )
+    assert len(calls) == 1
+    assert calls[0].data["value"] == "rendered"
+    assert "Error rendering variables" not in caplog.text
+
+
 @pytest.mark.parametrize(
     ("blueprint_inputs", "problem", "details"),
     [
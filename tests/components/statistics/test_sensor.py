@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from asyncio import Event as AsyncioEvent
+from collections import deque
 from collections.abc import Sequence
 from datetime import datetime, timedelta
+import math
+import random
 import statistics
 from threading import Event
 from typing import Any
@@ -28,6 +31,10 @@ from homeassistant.components.statistics.sensor import (
     CONF_SAMPLES_MAX_BUFFER_SIZE,
     CONF_STATE_CHARACTERISTIC,
     STAT_MEAN,
+    STATS_BINARY_INCREMENTAL,
+    STATS_BINARY_SUPPORT,
+    STATS_NUMERIC_INCREMENTAL,
+    STATS_NUMERIC_SUPPORT,
     StatisticsSensor,
 )
 from homeassistant.const import (
@@ -1481,6 +1488,94 @@ async def test_state_characteristic_mean_circular(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("characteristic", "binary"),
+    [
+        *((characteristic, False) for characteristic in STATS_NUMERIC_INCREMENTAL),
+        *((characteristic, True) for characteristic in STATS_BINARY_INCREMENTAL),
+    ],
+)
+def test_incremental_state_characteristics(characteristic: str, binary: bool) -> None:
+    """Test incremental characteristics match calculating over the whole buffer."""
+    rng = random.Random(characteristic)
+    characteristic_fn = (STATS_BINARY_SUPPORT if binary else STATS_NUMERIC_SUPPORT)[
+        characteristic
+    ]
+    aggregate = (STATS_BINARY_INCREMENTAL if binary else STATS_NUMERIC_INCREMENTAL)[
+        characteristic
+    ]()
+    states: deque[bool | float] = deque()
+    ages: deque[float] = deque()
+    age = 0.0
+
+    for _ in range(500):
+        if states and (len(states) >= 25 or rng.random() < 0.4):
+            aggregate.sample_removed(states, ages)
+            states.popleft()
+            ages.popleft()
+        else:
+            if binary:
+                states.append(rng.random() < 0.5)
+            else:
+                # Repeated values make sure ties are handled like the functions
+                states.append(
+                    rng.choice((rng.uniform(-50, 50), float(rng.randint(0, 3))))
+                )
+            age += rng.uniform(0.5, 60)
+            ages.append(age)
+            aggregate.sample_added(states, ages)
+
+        for percentile in (1, 50, 99):
+            expected = characteristic_fn(states, ages, percentile)
+            value = aggregate.value(states, ages, percentile)
+            if isinstance(expected, float):
+                # Removing samples from running sums leaves rounding errors,
+                # which the square root of the variance magnifies
+                assert value == pytest.approx(expected, abs=1e-6)
+            else:
+                assert value == expected
+
+
+@pytest.mark.parametrize(
+    ("characteristic", "value"),
+    [
+        (characteristic, value)
+        for characteristic in STATS_NUMERIC_INCREMENTAL
+        for value in (math.nan, math.inf, -math.inf)
+        # The sine of an infinite angle is a math domain error
+        if characteristic != "mean_circular" or math.isnan(value)
+    ],
+)
+def test_incremental_state_characteristics_not_finite(
+    characteristic: str, value: float
+) -> None:
+    """Test incremental characteristics recover once a non finite sample left."""
+    characteristic_fn = STATS_NUMERIC_SUPPORT[characteristic]
+    aggregate = STATS_NUMERIC_INCREMENTAL[characteristic]()
+    states: deque[bool | float] = deque()
+    ages: deque[float] = deque()
+
+    samples = [3.0, 1.0, value, 2.0, 5.0, 1.0, 4.0, 0.0, 2.0, 6.0, 3.0, 1.0]
+    for age, sample in enumerate(samples):
+        if len(states) == 4:
+            aggregate.sample_removed(states, ages)
+            states.popleft()
+            ages.popleft()
+        states.append(sample)
+        ages.append(float(age))
+        aggregate.sample_added(states, ages)
+        if any(not math.isfinite(state) for state in states):
+            continue
+
+        for percentile in (1, 50, 99):
+            expected = characteristic_fn(states, ages, percentile)
+            result = aggregate.value(states, ages, percentile)
+            if isinstance(expected, float):
+                assert result == pytest.approx(expected, abs=1e-6)
+            else:
+                assert result == expected
+
+
 async def test_invalid_state_characteristic(hass: HomeAssistant) -> None:
     """Test the detection of wrong state_characteristics selected."""
     assert await async_setup_component(
@@ -0,0 +1,75 @@
+"""Test the pooled segment buffers."""
+
+from io import SEEK_CUR, SEEK_END
+
+import pytest
+
+from homeassistant.components.stream.buffer import SegmentBuffer, SegmentBufferPool
+
+
+def test_views_remain_valid_while_writing() -> None:
+    """Test views of written data survive later writes and growing the buffer."""
+    pool = SegmentBufferPool()
+    segment_buffer = SegmentBuffer(pool)
+    segment_buffer.write(b"init")
+    part = segment_buffer.view(0, 4)
+
+    # Grow the buffer beyond its initial size
+    data = bytes(range(256)) * 4096
+    segment_buffer.write(data)
+
+    assert part == b"init"
+    assert segment_buffer.view(4, 4 + len(data)) == data
+    assert pool.allocations == 2
+    assert part.readonly
+
+    segment_buffer.close()
+    with pytest.raises(ValueError):
+        segment_buffer.write(b"closed")
+
+
+def test_seek_read_and_overwrite() -> None:
+    """Test the buffer behaves like a seekable file."""
+    segment_buffer = SegmentBuffer(SegmentBufferPool())
+    segment_buffer.write(b"0123456789")
+
+    assert segment_buffer.seek(2) == 2
+    assert segment_buffer.read(3) == b"234"
+    assert segment_buffer.seek(-2, SEEK_CUR) == 3
+    segment_buffer.write(b"ab")
+    assert segment_buffer.seek(0, SEEK_END) == 10
+    segment_buffer.seek(12)
+    segment_buffer.write(b"z")
+    segment_buffer.seek(0)
+
+    assert segment_buffer.read() == b"012ab56789\x00\x00z"
+    assert segment_buffer.read() == b""
+    with pytest.raises(ValueError):
+        segment_buffer.seek(-1)
+
+
+def test_buffers_reused_once_views_released() -> None:
+    """Test a buffer is only handed out again when no views of it are left."""
+    pool = SegmentBufferPool()
+    first = SegmentBuffer(pool)
+    first.write(b"segment 0")
+    view = first.view(0, 9)
+    first.close()
+
+    second = SegmentBuffer(pool)
+    second.write(b"segment 1")
+    second.close()
+
+    assert pool.allocations == 2
+    assert pool.reuses == 0
+    assert view == b"segment 0"
+
+    del view
+    third = SegmentBuffer(pool)
+    third.write(b"segment 2")
+
+    assert pool.allocations == 2
+    assert pool.reuses == 1
+    assert pool.active_bytes > 0
+    third.close()
+    assert pool.active_bytes == 0
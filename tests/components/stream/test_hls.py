@@ -188,6 +188,9 @@ async def test_hls_stream(
         "container_format": "mov,mp4,m4a,3gp,3g2,mj2",
         "keepalive": False,
         "orientation": Orientation.NO_TRANSFORM,
+        "segment_buffer_allocations": 2,
+        "segment_buffer_bytes": 1048576,
+        "segment_buffer_reuses": 0,
         "start_worker": 1,
         "video_codec": "h264",
         "worker_error": 1,
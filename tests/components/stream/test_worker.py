@@ -27,6 +27,7 @@ import numpy as np
 import pytest
 
 from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
+from homeassistant.components.stream.buffer import SegmentBuffer
 from homeassistant.components.stream.const import (
     ATTR_SETTINGS,
     CONF_LL_HLS,
@@ -215,7 +216,7 @@ class FakePyAvBuffer:
         self.segments = []
         self.audio_packets = []
         self.video_packets = []
-        self.memory_file: io.BytesIO | None = None
+        self.memory_file: SegmentBuffer | None = None
 
     def add_stream(self, template=None):
         """Create an output buffer that captures packets for test to examine."""
@@ -278,7 +279,7 @@ class MockPyAv:
 
     def open(self, stream_source, *args, **kwargs):
         """Return a stream or buffer depending on args."""
-        if isinstance(stream_source, io.BytesIO):
+        if isinstance(stream_source, SegmentBuffer):
             self.capture_buffer.memory_file = stream_source
             return self.capture_buffer
         return self.container
@@ -732,7 +733,7 @@ async def test_update_stream_source(hass: HomeAssistant) -> None:
 
     def blocking_open(stream_source, *args, **kwargs):
         nonlocal last_stream_source
-        if not isinstance(stream_source, io.BytesIO):
+        if not isinstance(stream_source, SegmentBuffer):
             last_stream_source = stream_source
             # Let test know the thread is running
             worker_open.set()
@@ -861,6 +862,9 @@ async def test_durations(hass: HomeAssistant, worker_finished_stream) -> None:
     # check that the Part duration metadata matches the durations in the media
     running_metadata_duration = 0
     for segment in complete_segments:
+        # The parts are served from the muxed data without joining them
+        assert isinstance(segment.get_data(), memoryview)
+        assert segment.get_data() == b"".join(part.data for part in segment.parts)
         av_segment = av.open(io.BytesIO(segment.init + segment.get_data()))
         av_segment.close()
         for part_num, part in enumerate(segment.parts):
@@ -991,6 +995,9 @@ async def test_h265_video_is_hvc1(hass: HomeAssistant, worker_finished_stream) -
         "container_format": "mov,mp4,m4a,3gp,3g2,mj2",
         "keepalive": False,
         "orientation": Orientation.NO_TRANSFORM,
+        "segment_buffer_allocations": 2,
+        "segment_buffer_bytes": 1048576,
+        "segment_buffer_reuses": 0,
         "start_worker": 1,
         "video_codec": "hevc",
         "worker_error": 1,
@@ -157,6 +157,8 @@ async def test_forecasts(
         },
     )
     await hass.async_block_till_done()
+    # The state written by the template entity is re-rendered in the next batch
+    await hass.async_block_till_done()
     state = hass.states.get("weather.forecast")
     assert state is not None
     assert state.state == "sunny"
@@ -203,6 +205,8 @@ async def test_forecasts(
         },
     )
     await hass.async_block_till_done()
+    # The state written by the template entity is re-rendered in the next batch
+    await hass.async_block_till_done()
     state = hass.states.get("weather.forecast")
     assert state is not None
     assert state.state == "sunny"
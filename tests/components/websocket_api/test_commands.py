@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -34,6 +35,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -692,6 +694,30 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_after_state_change(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states reflects changes made between calls."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("farewell.bye", "universe")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert {state["entity_id"]: state["state"] for state in msg["result"]} == {
+        "greeting.hello": "world",
+        "farewell.bye": "universe",
+    }
+
+    hass.states.async_set("farewell.bye", "moon")
+    hass.states.async_remove("greeting.hello")
+
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [hass.states.get("farewell.bye").as_dict()]
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1198,6 +1224,147 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_coalesce_interval(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test subscribe entities merges state changes within the interval."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.permitted": True,
+                    "light.removed": True,
+                    "light.added": True,
+                    "light.short_lived": True,
+                }
+            }
+        }
+    )
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "coalesce_interval": 0.1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.permitted", "light.removed"}
+
+    hass.states.async_set("light.permitted", "on", {"color": "red"})
+    hass.states.async_set("light.permitted", "off", {"color": "blue"})
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.short_lived", "on")
+    hass.states.async_remove("light.short_lived")
+    hass.states.async_set("light.not_permitted", "on")
+    await hass.async_block_till_done()
+
+    freezer.tick(0.1)
+    async_fire_time_changed(hass)
+
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {"light.permitted": {"+": {"a": {"color": "blue"}, "c": ANY, "s": "on"}}},
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.permitted", "off", {"color": "blue"})
+    await websocket_client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": msg["id"]}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    freezer.tick(0.1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("light.permitted", "on")
+    await websocket_client.send_json_auto_id({"type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "pong"
+
+
+async def test_subscribe_entities_resumable(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test resuming subscribe entities from the replay log."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("switch.fan", "off")
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "resumable": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    replay_id = msg["result"]["replay_id"]
+    assert msg["result"] == {"replay_id": replay_id, "seq": 0, "resumed": False}
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "switch.fan"}
+
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["seq"] == 1
+    assert msg["event"] == {"c": {"light.kitchen": {"+": ANY}}}
+
+    await websocket_client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": msg["id"]}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    hass.states.async_set("switch.fan", "on")
+    hass.states.async_set("light.kitchen", "off")
+
+    await websocket_client.send_json_auto_id(
+        {
+            "type": "subscribe_entities",
+            "entity_ids": ["light.kitchen"],
+            "replay_id": replay_id,
+            "since": 1,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"replay_id": replay_id, "seq": 1, "resumed": True}
+    msg = await websocket_client.receive_json()
+    assert msg["seq"] == 3
+    assert msg["event"] == {
+        "c": {"light.kitchen": {"+": {"s": "off", "c": ANY, "lc": ANY}}}
+    }
+
+    hass.states.async_set("light.kitchen", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["seq"] == 4
+
+    for replay_id_and_since in ((replay_id, 5), ("unknown", 4)):
+        await websocket_client.send_json_auto_id(
+            {
+                "type": "subscribe_entities",
+                "replay_id": replay_id_and_since[0],
+                "since": replay_id_and_since[1],
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["result"] == {"replay_id": replay_id, "seq": 4, "resumed": False}
+        msg = await websocket_client.receive_json()
+        assert set(msg["event"]["a"]) == {"light.kitchen", "switch.fan"}
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "resumable": True, "coalesce_interval": 0.1}
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_SUPPORTED
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
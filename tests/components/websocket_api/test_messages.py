@@ -3,13 +3,16 @@
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    _STATE_DIFF_JSON_CACHE as state_diff_json_cache,
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    coalesced_state_diff_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -281,6 +284,46 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_coalesced_state_diff_message_cache(hass: HomeAssistant) -> None:
+    """Test the coalesced diffs are cached without keeping the states."""
+    state_diff_json_cache.clear()
+    hass.states.async_set("light.window", "on")
+    old_state = hass.states.get("light.window")
+    hass.states.async_set("light.window", "off")
+    new_state = hass.states.get("light.window")
+    changes = {"light.window": (old_state, new_state)}
+
+    msg = coalesced_state_diff_message(b"2", changes)
+    assert json_loads(msg) == {
+        "id": 2,
+        "type": "event",
+        "event": _state_diff_event(
+            Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": "light.window",
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+        ),
+    }
+    assert state_diff_json_cache.keys() == [
+        (
+            "light.window",
+            old_state.last_updated_timestamp,
+            new_state.last_updated_timestamp,
+        )
+    ]
+    assert not any(isinstance(value, State) for value in state_diff_json_cache.values())
+
+    # Subscriptions of other connections reuse the serialized diff
+    assert coalesced_state_diff_message(b"3", changes) == msg.replace(
+        b'{"id":2', b'{"id":3'
+    )
+    assert len(state_diff_json_cache) == 1
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
@@ -1,6 +1,7 @@
 """Test the condition helper."""
 
 from datetime import datetime, timedelta
+import logging
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
@@ -3668,3 +3669,154 @@ async def test_or_condition_with_disabled_condition(hass: HomeAssistant) -> None
             "conditions/1/entity_id/0": [{"result": {"result": True, "state": 100.0}}],
         }
     )
+
+
+async def test_compiled_conditions(hass: HomeAssistant) -> None:
+    """Test conditions compiled into an evaluation plan."""
+    configs = [
+        {
+            "condition": "time",
+            "after": "00:00:00",
+        },
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "numeric_state",
+                    "entity_id": "sensor.temperature",
+                    "below": 110,
+                },
+                {
+                    "condition": "state",
+                    "entity_id": ["light.kitchen", "light.hallway"],
+                    "state": "on",
+                    "match": "any",
+                },
+            ],
+        },
+        {
+            "condition": "or",
+            "conditions": [
+                {"condition": "state", "entity_id": "switch.fan", "state": "off"},
+                {
+                    "condition": "state",
+                    "entity_id": "switch.fan",
+                    "attribute": "mode",
+                    "state": "eco",
+                },
+            ],
+        },
+        {
+            "condition": "not",
+            "conditions": [
+                {"condition": "state", "entity_id": "switch.alarm", "state": "on"},
+                {
+                    "enabled": False,
+                    "condition": "state",
+                    "entity_id": "switch.alarm",
+                    "state": "off",
+                },
+            ],
+        },
+    ]
+    configs = await condition.async_validate_conditions_config(
+        hass, [cv.CONDITION_SCHEMA(config) for config in configs]
+    )
+    compiled = condition.async_compile_conditions(configs)
+    assert compiled is not None
+    checks = [await condition.async_from_config(hass, config) for config in configs]
+
+    # Errors are raised for the traced conditions to report
+    with pytest.raises(ConditionError):
+        compiled(hass)
+
+    for temperature, kitchen, fan, fan_mode, alarm, expected in (
+        (100, "on", "off", None, "off", True),
+        (120, "on", "off", None, "off", False),
+        (100, "off", "off", None, "off", False),
+        (100, "off", "on", "eco", "off", False),
+        (100, "on", "on", "eco", "off", True),
+        (100, "on", "on", "boost", "off", False),
+        (100, "on", "off", None, "on", False),
+    ):
+        hass.states.async_set("sensor.temperature", temperature)
+        hass.states.async_set("light.kitchen", kitchen)
+        hass.states.async_set("light.hallway", "off")
+        hass.states.async_set("switch.fan", fan, {"mode": fan_mode} if fan_mode else {})
+        hass.states.async_set("switch.alarm", alarm)
+        assert compiled(hass) is expected
+        assert all(check(hass) is not False for check in checks) is expected
+
+    # The cheapest conditions are checked first
+    hass.states.async_set("sensor.temperature", 120)
+    with patch("homeassistant.helpers.condition.time") as time_condition:
+        assert compiled(hass) is False
+    time_condition.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"condition": "template", "value_template": "{{ true }}"},
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "value_template": "{{ state.state }}",
+            "below": 110,
+        },
+        {
+            "condition": "state",
+            "entity_id": "sensor.temperature",
+            "state": "100",
+            "for": "{{ 5 }}",
+        },
+        {
+            "condition": "state",
+            "entity_id": "sensor.temperature",
+            "state": "input_number.wanted",
+        },
+        {
+            "condition": "or",
+            "conditions": [{"condition": "trigger", "id": "event"}],
+        },
+    ],
+)
+async def test_compiled_conditions_not_supported(
+    hass: HomeAssistant, config: dict[str, Any]
+) -> None:
+    """Test conditions which can't be compiled."""
+    configs = await condition.async_validate_conditions_config(
+        hass, [cv.CONDITION_SCHEMA(config)]
+    )
+    assert condition.async_compile_conditions(configs) is None
+
+
+async def test_conditions_from_config_compiled(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test conditions use the compiled plan when no trace is recorded."""
+    configs = await condition.async_validate_conditions_config(
+        hass,
+        [
+            cv.CONDITION_SCHEMA(
+                {"condition": "state", "entity_id": "switch.fan", "state": "on"}
+            )
+        ],
+    )
+    check_conditions = await condition.async_conditions_from_config(
+        hass, configs, logging.getLogger(__name__), "test"
+    )
+
+    with trace.trace_disabled():
+        # The traced conditions report the error
+        assert check_conditions() is False
+        assert "Error evaluating condition in 'test'" in caplog.text
+        assert trace.trace_get(clear=False) is not None
+
+    with trace.trace_disabled():
+        hass.states.async_set("switch.fan", "on")
+        assert check_conditions() is True
+        assert trace.trace_get(clear=False) is None
+
+    assert check_conditions() is True
+    assert "condition/0" in trace.trace_get(clear=False)
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -1756,6 +1757,107 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_batched(hass: HomeAssistant) -> None:
+    """Test state changes in the same loop iteration re-render templates once."""
+    runs: list[tuple[str | None, list[str]]] = []
+    template_sum = Template(
+        "{{ (states('sensor.one') | int(0)) + (states('sensor.two') | int(0)) }}",
+        hass,
+    )
+    template_two = Template("{{ states('sensor.two') }}", hass)
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(
+            (
+                event and event.data["entity_id"],
+                [str(update.result) for update in updates],
+            )
+        )
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_sum, None), TrackTemplate(template_two, None)],
+        refresh_listener,
+    )
+    await hass.async_block_till_done()
+
+    def _renders() -> dict[Template, int]:
+        return {
+            stats.template: stats.renders
+            for stats in async_get_template_render_stats(hass)
+        }
+
+    assert _renders() == {template_sum: 1, template_two: 1}
+
+    hass.states.async_set("sensor.two", "2")
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.one", "3")
+    await hass.async_block_till_done()
+
+    # Each template is rendered once for the batch, the updates are in the
+    # order of the state changes that caused them
+    assert runs == [("sensor.one", ["2", "5"])]
+    assert _renders() == {template_sum: 2, template_two: 2}
+    stats = async_get_template_render_stats(hass)[0]
+    assert stats.max_time > 0
+    assert stats.total_time >= stats.max_time
+
+    # The statistics are dropped with the tracker
+    hass.states.async_set("sensor.one", "4")
+    info.async_remove()
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+    assert async_get_template_render_stats(hass) == []
+
+
+async def test_track_template_result_batched_follow_up(hass: HomeAssistant) -> None:
+    """Test state changes written while rendering a batch are the next batch."""
+    runs: list[str] = []
+
+    @ha.callback
+    def source_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        hass.states.async_set("sensor.derived", str(updates[0].result))
+
+    @ha.callback
+    def derived_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(str(updates[0].result))
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.source') }}", hass), None)],
+        source_listener,
+    )
+    async_track_template_result(
+        hass,
+        [TrackTemplate(Template("{{ states('sensor.derived') }}", hass), None)],
+        derived_listener,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.source", "1")
+    hass.states.async_set("sensor.source", "2")
+    # One iteration of the event loop dispatches both state changes and
+    # renders the first template once
+    await asyncio.sleep(0)
+    assert hass.states.get("sensor.derived").state == "2"
+    assert runs == []
+
+    # The state change written by its listener is dispatched and rendered
+    # in the next iteration
+    await asyncio.sleep(0)
+    assert runs == ["2"]
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
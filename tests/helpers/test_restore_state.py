@@ -6,6 +6,8 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun import freeze_time
+
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.exceptions import HomeAssistantError
@@ -15,7 +17,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_COMPACT_INTERVAL,
     STORAGE_KEY,
+    STORAGE_KEY_CHANGES,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -115,14 +119,28 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    # Only changed states are written periodically
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
 
+    assert not mock_write_data.called
+
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        await hass.async_block_till_done()
+
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -134,7 +152,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=45))
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
@@ -181,6 +199,9 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
+    data.async_restore_entity_added(entity)
+    hass.states.async_set("input_boolean.b1", "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -189,6 +210,8 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Verify still saving
     assert mock_write_data.called
 
+    hass.states.async_set("input_boolean.b1", "off")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -342,6 +365,69 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only changed states are dumped until they are compacted."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for object_id in ("b0", "b1", "b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.{object_id}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_changed_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 3
+    assert STORAGE_KEY_CHANGES not in hass_storage
+
+    # Nothing changed, nothing written
+    await data.async_dump_changed_states()
+    assert STORAGE_KEY_CHANGES not in hass_storage
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await entities[2].async_remove()
+    await data.async_dump_changed_states()
+    changes = hass_storage[STORAGE_KEY_CHANGES]["data"]
+    assert [item["state"]["entity_id"] for item in changes["states"]] == [
+        "input_boolean.b1",
+        "input_boolean.b2",
+    ]
+    assert changes["removed"] == {}
+
+    # Changes are applied on top of the full dump when loading
+    loaded = RestoreStateData(hass)
+    await loaded.async_load()
+    last_states = loaded.last_states
+    assert last_states["input_boolean.b0"].state.state == "on"
+    assert last_states["input_boolean.b1"].state.state == "off"
+    assert last_states["input_boolean.b2"].state.state == "on"
+
+    data.last_states.pop("input_boolean.b2")
+    await data.async_dump_changed_states()
+    changes = hass_storage[STORAGE_KEY_CHANGES]["data"]
+    assert [item["state"]["entity_id"] for item in changes["states"]] == [
+        "input_boolean.b1"
+    ]
+    assert list(changes["removed"]) == ["input_boolean.b2"]
+
+    loaded = RestoreStateData(hass)
+    await loaded.async_load()
+    assert "input_boolean.b2" not in loaded.last_states
+
+    # Changes are compacted into a full dump
+    with freeze_time(dt_util.utcnow() + STATE_COMPACT_INTERVAL):
+        await data.async_dump_changed_states()
+    assert STORAGE_KEY_CHANGES not in hass_storage
+    assert [
+        item["state"]["entity_id"] for item in hass_storage[STORAGE_KEY]["data"]
+    ] == ["input_boolean.b0", "input_boolean.b1"]
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
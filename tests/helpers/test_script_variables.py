@@ -5,6 +5,7 @@ import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.script_variables import async_referenced_variables
 
 
 async def test_static_vars() -> None:
@@ -113,3 +114,31 @@ async def test_template_vars_error(hass: HomeAssistant) -> None:
     var = cv.SCRIPT_VARIABLES_SCHEMA({"hello": "{{ canont.work }}"})
     with pytest.raises(TemplateError):
         var.async_render(hass, None)
+
+
+async def test_template_vars_referenced(hass: HomeAssistant) -> None:
+    """Test only referenced template vars and their dependencies are rendered."""
+    var = cv.SCRIPT_VARIABLES_SCHEMA(
+        {
+            "static": "value",
+            "base": "{{ run_var + 1 }}",
+            "derived": "{{ base * 2 }}",
+            "unused": "{{ canont.work }}",
+        }
+    )
+    sequence = cv.SCRIPT_SCHEMA(
+        [{"action": "test.script", "data": {"value": "{{ derived }}"}}]
+    )
+    referenced = async_referenced_variables(sequence)
+    assert "derived" in referenced
+    rendered = var.async_render(hass, {"run_var": 1}, referenced=referenced)
+    assert rendered == {"run_var": 1, "static": "value", "base": 2, "derived": 4}
+
+    # Templates which include other templates with their context can read
+    # any variable
+    sequence = cv.SCRIPT_SCHEMA(
+        [{"action": "test.script", "data": {"value": "{% include 'x.jinja' %}"}}]
+    )
+    assert async_referenced_variables(sequence) is None
+    with pytest.raises(TemplateError):
+        var.async_render(hass, {"run_var": 1}, referenced=None)
@@ -754,6 +754,62 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_target_index(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test resolved targets are cached until a registry change affects them."""
+    call = ServiceCall(hass, "light", "turn_on", {"area_id": "own-area"})
+    assert await service.async_extract_entity_ids(hass, call) == {"light.in_own_area"}
+    resolved = hass.data[service.TARGET_INDEX].async_resolve(
+        service.ServiceTargetSelector(call)
+    )
+
+    # Changes which do not affect targets keep the resolved targets
+    entity_registry.async_update_entity("light.in_area", name="Renamed")
+    assert (
+        hass.data[service.TARGET_INDEX].async_resolve(
+            service.ServiceTargetSelector(call)
+        )
+        is resolved
+    )
+
+    entity_registry.async_update_entity("light.in_area", area_id="own-area")
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_own_area",
+        "light.in_area",
+    }
+
+    entity_registry.async_update_entity(
+        "light.in_own_area", hidden_by=er.RegistryEntryHider.USER
+    )
+    assert await service.async_extract_entity_ids(hass, call) == {"light.in_area"}
+
+    resolved = hass.data[service.TARGET_INDEX].async_resolve(
+        service.ServiceTargetSelector(call)
+    )
+    entity_registry.async_update_entity(
+        "light.in_area", disabled_by=er.RegistryEntryDisabler.USER
+    )
+    assert (
+        hass.data[service.TARGET_INDEX].async_resolve(
+            service.ServiceTargetSelector(call)
+        )
+        is not resolved
+    )
+    resolved = hass.data[service.TARGET_INDEX].async_resolve(
+        service.ServiceTargetSelector(call)
+    )
+    entity_registry.async_update_entity("light.in_area", disabled_by=None)
+    assert (
+        hass.data[service.TARGET_INDEX].async_resolve(
+            service.ServiceTargetSelector(call)
+        )
+        is not resolved
+    )
+    assert await service.async_extract_entity_ids(hass, call) == {"light.in_area"}
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
@@ -842,6 +842,132 @@ async def test_json_load_failure(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and compacts them."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        entities = [{"id": str(idx), "name": f"entity {idx}"} for idx in range(100)]
+        await store.async_save({"entities": entities, "deleted": []})
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        def _read_file(path: str) -> bytes:
+            with open(path, "rb") as fp:
+                return fp.read()
+
+        base = await hass.async_add_executor_job(_read_file, store.path)
+
+        entities[5] = {"id": "5", "name": "renamed"}
+        await store.async_save({"entities": entities, "deleted": []})
+        removed = entities.pop(10)
+        entities.append({"id": "100", "name": "entity 100"})
+        await store.async_save({"entities": entities, "deleted": [removed]})
+
+        # The data file is untouched, the changes are in the journal
+        assert await hass.async_add_executor_job(_read_file, store.path) == base
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert journal.count(b"\n") == 2
+        assert len(journal) < len(base) / 4
+
+        expected = {"entities": entities, "deleted": [removed]}
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == expected
+        )
+
+        # An interrupted append is ignored and forces a compaction
+        def _truncate_journal() -> None:
+            with open(store.journal_path, "ab") as fp:
+                fp.write(b'{"id": 1, "ops": [["set"')
+
+        await hass.async_add_executor_job(_truncate_journal)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == expected
+
+        entities[0] = {"id": "0", "name": "compacted"}
+        await store.async_save({"entities": entities, "deleted": []})
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        assert json.loads(await hass.async_add_executor_job(_read_file, store.path))[
+            "data"
+        ] == {"entities": entities, "deleted": []}
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"entities": entities, "deleted": []}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_does_not_apply(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a journal which does not apply to the data file is discarded."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"entities": [{"id": "0"}]})
+
+        def _write_journal() -> None:
+            with open(store.journal_path, "wb") as fp:
+                fp.write(b'{"id": 1, "ops": [["set", ["data", "entities", 0], 1]]}\n')
+                fp.write(b'{"id": 1, "ops": [["set", ["data", "missing", 0], 1]]}\n')
+
+        await hass.async_add_executor_job(_write_journal)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {"entities": [{"id": "0"}]}
+        assert "Discarding journal for storage-test" in caplog.text
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_without_minor_version(tmpdir: py.path.local) -> None:
+    """Test a journal is replayed on a data file without a minor version."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+
+        def _write_files() -> None:
+            os.makedirs(os.path.dirname(store.path), exist_ok=True)
+            with open(store.path, "w", encoding="utf-8") as fp:
+                json.dump(
+                    {"version": MOCK_VERSION, "key": MOCK_KEY, "data": {"a": 1}}, fp
+                )
+            with open(store.journal_path, "wb") as fp:
+                fp.write(b'{"id": 0, "ops": [["set", ["data", "a"], 2]]}\n')
+
+        await hass.async_add_executor_job(_write_files)
+        assert await store.async_load() == {"a": 2}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is folded into the data file on shutdown."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"hello": "world"})
+        await store.async_save({"hello": "journal"})
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        def _read_data() -> Any:
+            with open(store.path, encoding="utf-8") as fp:
+                return json.load(fp)["data"]
+
+        # Versions without journal support read a complete data file
+        assert await hass.async_add_executor_job(_read_data) == {"hello": "journal"}
+
+        await hass.async_stop(force=True)
+
+
 async def test_read_only_store(
     hass: HomeAssistant, read_only_store: storage.Store, hass_storage: dict[str, Any]
 ) -> None:
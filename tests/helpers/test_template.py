@@ -3452,6 +3452,114 @@ async def test_closest_function_home_vs_group_state(hass: HomeAssistant) -> None
     assert info.rate_limit is None
 
 
+async def test_memoized_expressions(hass: HomeAssistant) -> None:
+    """Test filters over the states are shared by templates until they change."""
+    hass.states.async_set("sensor.power_1", "10", {"device_class": "power"})
+    hass.states.async_set("sensor.power_2", "20", {"device_class": "power"})
+    hass.states.async_set("sensor.energy", "30", {"device_class": "energy"})
+    power = (
+        "{{ states.sensor | selectattr('attributes.device_class', 'eq', 'power')"
+        " | map(attribute='state') | map('float') | sum }}"
+    )
+    iterations = 0
+    domain_states_iter = template.DomainStates.__iter__
+
+    def count_iter(domain_states: template.DomainStates) -> Any:
+        nonlocal iterations
+        iterations += 1
+        return domain_states_iter(domain_states)
+
+    with patch.object(template.DomainStates, "__iter__", count_iter):
+        for _ in range(3):
+            info = render_to_info(hass, power)
+            assert_result_info(info, 30.0, [], ["sensor"])
+            assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+        assert iterations == 1
+
+        # The same filters are shared, the rest of the template is not
+        assert render(
+            hass,
+            "{{ states.sensor | selectattr('state', 'eq', '10')"
+            " | map(attribute='entity_id') | list }}",
+        ) == ["sensor.power_1"]
+        assert iterations == 2
+        assert (
+            render(
+                hass,
+                "{{ states.sensor | selectattr('state', 'eq', '10')"
+                " | map(attribute='name') | first }}",
+            )
+            == "power 1"
+        )
+        assert iterations == 2
+
+        # Changes to other domains keep the results
+        hass.states.async_set("light.kitchen", "on")
+        assert render(hass, power) == 30.0
+        assert iterations == 2
+
+        hass.states.async_set("sensor.power_2", "5", {"device_class": "power"})
+        assert render(hass, power) == 15.0
+        assert iterations == 3
+
+        # Filters with arguments which can not be compared cheaply are not
+        # memoized
+        for _ in range(2):
+            assert render(
+                hass,
+                "{{ states.sensor | selectattr('state', 'in', ['5'])"
+                " | map(attribute='entity_id') | list }}",
+            ) == ["sensor.power_2"]
+        assert iterations == 5
+
+    # Partly consumed results are not reused
+    template_str = (
+        "{% set entity_ids = states.sensor | map(attribute='entity_id') %}"
+        "{{ entity_ids | first }} {{ entity_ids | list }}"
+    )
+    for _ in range(2):
+        assert render(hass, template_str) == (
+            "sensor.power_1 ['sensor.power_2', 'sensor.energy']"
+        )
+
+    hass.states.async_set("group.power", "on", {"entity_id": ["sensor.power_1"]})
+    template_str = "{{ expand('group.power') | map(attribute='state') | list }}"
+    for _ in range(2):
+        info = render_to_info(hass, template_str)
+        assert_result_info(info, ["10"], ["group.power", "sensor.power_1"])
+    hass.states.async_set("sensor.power_1", "11", {"device_class": "power"})
+    assert render(hass, template_str) == ["11"]
+
+
+async def test_memoized_expressions_not_pure(hass: HomeAssistant) -> None:
+    """Test expressions reading the time or last_reported are not memoized."""
+    hass.states.async_set("sensor.power_1", "10", timestamp=1000.0)
+    hass.states.async_set("sensor.power_2", "20", timestamp=1000.0)
+    template_str = (
+        "{{ states.sensor | map(attribute='last_reported')"
+        " | map(attribute='minute') | list }}"
+    )
+    assert render(hass, template_str) == [16, 16]
+
+    # Reporting a state updates last_reported in place
+    hass.states.async_set("sensor.power_1", "10", timestamp=1060.0)
+    assert render(hass, template_str) == [17, 16]
+
+    template_str = (
+        "{{ states.sensor | map(attribute='last_changed')"
+        " | map('relative_time') | list }}"
+    )
+    with patch.object(
+        template,
+        "_MEMOIZED_FUNCTIONS",
+        template._MEMOIZED_FUNCTIONS | {"relative_time"},
+    ):
+        for _ in range(2):
+            info = render_to_info(hass, template_str)
+            assert len(info.result()) == 2
+            assert info.has_time is True
+
+
 async def test_expand(hass: HomeAssistant) -> None:
     """Test expand function."""
     info = render_to_info(hass, "{{ expand('test.object') }}")
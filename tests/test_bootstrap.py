@@ -182,6 +182,55 @@ async def test_preload_translations(hass: HomeAssistant) -> None:
     assert async_translations_loaded(hass, BASE_PLATFORMS)
 
 
+async def test_preimport_integrations_dependency_order(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test integrations are preimported after their dependencies."""
+    imported: list[str] = []
+
+    def _mock_integration(
+        domain: str,
+        dependencies: list[str],
+        after_dependencies: list[str] | None = None,
+        import_executor: bool = True,
+    ) -> Mock:
+        async def _async_get_component() -> None:
+            await asyncio.sleep(0)
+            imported.append(domain)
+            if domain == "broken":
+                raise ImportError("broken")
+
+        return Mock(
+            domain=domain,
+            dependencies=dependencies,
+            after_dependencies=after_dependencies or [],
+            import_executor=import_executor,
+            async_get_component=_async_get_component,
+        )
+
+    integrations = {
+        "http": _mock_integration("http", []),
+        "api": _mock_integration("api", ["http"]),
+        "broken": _mock_integration("broken", ["http"]),
+        "frontend": _mock_integration("frontend", ["api", "broken"]),
+        "cycle_a": _mock_integration("cycle_a", [], ["cycle_b"]),
+        "cycle_b": _mock_integration("cycle_b", [], ["cycle_a"]),
+        "in_loop": _mock_integration("in_loop", ["http"], import_executor=False),
+    }
+    with caplog.at_level(logging.DEBUG):
+        timings = await bootstrap._async_preimport_integrations(integrations)
+
+    assert timings.keys() == integrations.keys()
+    assert "in_loop" not in imported
+    assert sorted(imported) == sorted(integrations.keys() - {"in_loop"})
+    assert imported.index("http") < imported.index("api")
+    assert imported.index("api") < imported.index("frontend")
+    assert imported.index("broken") < imported.index("frontend")
+    assert timings["frontend"][1] >= timings["api"][1] >= timings["http"][1]
+    assert "Failed to preimport broken" in caplog.text
+    assert "Integration import critical path" in caplog.text
+
+
 async def test_core_failure_loads_recovery_mode(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -1165,6 +1165,49 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listening for events by entity_id and domain."""
+    calls = []
+    old_listeners = hass.bus.async_listeners()
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", ["light.kitchen", "switch"], listener, event_filter=mock_filter
+    )
+    assert hass.bus.async_listeners()["test"] == old_listeners.get("test", 0) + 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test", {"entity_id": "switch.fan"})
+    hass.bus.async_fire("test", {"entity_id": "switch.fan", "filtered": True})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen", "switch.fan"]
+
+    unsub()
+    assert hass.bus.async_listeners() == old_listeners
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+
+    assert calls == ["light.kitchen", "switch.fan"]
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "light", listener)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1603,69 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_version(hass: HomeAssistant) -> None:
+    """Test the version of the states and the states of a domain."""
+    assert hass.states.async_version() == 0
+    assert hass.states.async_version("light") == 0
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.fan", "on")
+    assert hass.states.async_version() == 2
+    assert hass.states.async_version("light") == 1
+    assert hass.states.async_version("switch") == 2
+
+    # Reporting the same state does not change the version
+    hass.states.async_set("light.bowl", "on")
+    assert hass.states.async_version() == 2
+    assert hass.states.async_version("light") == 1
+
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    assert hass.states.async_version() == 3
+    assert hass.states.async_version("light") == 3
+
+    hass.states.async_remove("switch.fan")
+    hass.states.async_remove("switch.missing")
+    assert hass.states.async_version() == 4
+    assert hass.states.async_version("switch") == 4
+    assert hass.states.async_version("light") == 3
+
+
+async def test_statemachine_snapshot(hass: HomeAssistant) -> None:
+    """Test snapshots of the states share the domains which did not change."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("switch.fan", "on")
+
+    snapshot = hass.states.async_snapshot()
+    assert hass.states.async_snapshot() is snapshot
+    assert list(snapshot) == hass.states.async_all()
+    assert len(snapshot) == 3
+    assert snapshot.domain_states("light") == tuple(hass.states.async_all("light"))
+    assert snapshot.domain_states("sensor") == ()
+    light_snapshot = snapshot.domains["light"]
+    assert light_snapshot is hass.states.async_domain_snapshot("light")
+    assert light_snapshot.as_dict_json == b",".join(
+        state.as_dict_json for state in hass.states.async_all("light")
+    )
+
+    hass.states.async_set("switch.fan", "off")
+    new_snapshot = hass.states.async_snapshot()
+    assert new_snapshot is not snapshot
+    assert new_snapshot.domains["light"] is light_snapshot
+    assert new_snapshot.domain_states("switch") == (hass.states.get("switch.fan"),)
+    # Snapshots are immutable
+    assert snapshot.domain_states("switch")[0].state == "on"
+    assert new_snapshot.domains["switch"].as_compressed_state_json == (
+        hass.states.get("switch.fan").as_compressed_state_json
+    )
+
+    hass.states.async_remove("switch.fan")
+    snapshot = hass.states.async_snapshot()
+    assert "switch" not in snapshot.domains
+    assert snapshot.domains["light"] is light_snapshot
+    assert len(snapshot) == 2
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")